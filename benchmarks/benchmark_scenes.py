@@ -0,0 +1,117 @@
+import os
+
+import numpy as np
+
+from manimlib.imports import *
+
+# Each scene is a representative workload rather than a nice animation.
+# Keep their content fixed, since changing them invalidates any
+# baseline recorded with run_benchmarks.py.
+
+
+class TexHeavyBenchmark(Scene):
+    def construct(self):
+        equations = VGroup(*[
+            TexMobject(
+                "\\sum_{{n=1}}^\\infty \\frac{{1}}{{n^{{{}}}}}".format(k),
+                "=", "\\zeta({})".format(k),
+            )
+            for k in range(2, 14)
+        ])
+        equations.arrange_in_grid(4, 3, buff=MED_LARGE_BUFF)
+        equations.set_width(FRAME_WIDTH - 1)
+        self.play(Write(equations), run_time=2)
+        self.play(
+            LaggedStartMap(Indicate, equations, lag_ratio=0.1),
+            run_time=2,
+        )
+
+
+class VMobjectGridBenchmark(Scene):
+    CONFIG = {
+        "n_rows": 40,
+        "n_cols": 50,
+    }
+
+    def construct(self):
+        grid = VGroup(*[
+            Square(side_length=0.12)
+            for n in range(self.n_rows * self.n_cols)
+        ])
+        grid.arrange_in_grid(self.n_rows, self.n_cols, buff=0.02)
+        grid.set_stroke(WHITE, 1)
+        grid.set_fill(BLUE, 0.5)
+        self.play(ShowCreation(grid), run_time=2)
+        self.play(
+            grid.rotate, 30 * DEGREES,
+            grid.set_color, YELLOW,
+            run_time=2,
+        )
+
+
+class SurfaceBenchmark(ThreeDScene):
+    def construct(self):
+        self.set_camera_orientation(phi=70 * DEGREES, theta=-60 * DEGREES)
+        surface = ParametricSurface(
+            lambda u, v: np.array([u, v, 0.5 * np.sin(u) * np.cos(v)]),
+            u_min=-3, u_max=3,
+            v_min=-3, v_max=3,
+            resolution=(32, 32),
+        )
+        self.play(ShowCreation(surface), run_time=2)
+        self.begin_ambient_camera_rotation(rate=0.5)
+        self.wait(2)
+
+
+class PointCloudBenchmark(Scene):
+    CONFIG = {
+        "n_points": 200000,
+    }
+
+    def construct(self):
+        points = np.random.normal(scale=1.5, size=(self.n_points, 3))
+        points[:, 2] = 0
+        cloud = PMobject(stroke_width=2)
+        cloud.add_points(points, color=BLUE)
+        self.play(FadeIn(cloud), run_time=1)
+        self.play(Rotate(cloud, TAU / 4), run_time=2)
+
+
+class TextAndCodeBenchmark(Scene):
+    def construct(self):
+        paragraph = Paragraph(
+            "The quick brown fox",
+            "jumps over the lazy dog,",
+            "again and again.",
+        )
+        paragraph.to_edge(UP)
+        code = Code(
+            os.path.abspath(__file__),
+            language="python",
+            insert_line_no=False,
+        )
+        code.set_height(4)
+        code.to_edge(DOWN)
+        self.play(Write(paragraph), run_time=2)
+        self.play(Write(code), run_time=3)
+
+
+class LongWaitBenchmark(Scene):
+    def construct(self):
+        self.add(NumberPlane(), Circle(radius=2))
+        self.wait(10)
+        clock = DecimalNumber(0).add_updater(
+            lambda m, dt: m.set_value(m.get_value() + dt)
+        )
+        self.add(clock)
+        self.wait(5)
+
+
+BENCHMARKS = [
+    TexHeavyBenchmark,
+    VMobjectGridBenchmark,
+    SurfaceBenchmark,
+    PointCloudBenchmark,
+    TextAndCodeBenchmark,
+    LongWaitBenchmark,
+]
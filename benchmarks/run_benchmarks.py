@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+"""
+Renders the scenes in benchmark_scenes.py at a fixed resolution without
+encoding a movie, and compares their speed and memory use against a
+baseline, e.g.
+
+    python benchmarks/run_benchmarks.py --save_baseline
+    (make changes)
+    python benchmarks/run_benchmarks.py
+
+The second call exits with status 1 if any benchmark got worse than
+its baseline by more than the threshold.
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+sys.path.insert(0, BENCHMARK_DIR)
+
+DEFAULT_BASELINE_FILE = os.path.join(BENCHMARK_DIR, "baseline.json")
+DEFAULT_THRESHOLD = 0.15
+
+CAMERA_CONFIG = {
+    "pixel_height": 480,
+    "pixel_width": 854,
+    "frame_rate": 15,
+}
+
+# Frames are rasterized as usual, but only counted
+FILE_WRITER_CONFIG = {
+    "write_to_movie": False,
+    "save_last_frame": False,
+    "frame_sinks": ["null"],
+}
+
+# Metric name, and whether larger values are better
+METRICS = [
+    ("fps", True),
+    ("cold_time", False),
+    ("warm_time", False),
+    ("peak_rss_mb", False),
+]
+
+
+def get_peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        # e.g. on Windows
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        # Bytes rather than kilobytes
+        peak_rss /= 1024
+    return peak_rss / 1024
+
+
+def render_benchmark(scene_name, media_dir):
+    """
+    Renders a benchmark scene, and is meant to be run in a fresh
+    process so that in-memory caches start out empty and peak memory
+    use only reflects this scene.
+    """
+    import manimlib.constants
+    import benchmark_scenes
+
+    manimlib.constants.initialize_directories({
+        "media_dir": media_dir,
+        "video_dir": None,
+        "video_output_dir": None,
+        "tex_dir": None,
+    })
+    SceneClass = getattr(benchmark_scenes, scene_name)
+    start_time = time.perf_counter()
+    scene = SceneClass(
+        camera_config=CAMERA_CONFIG,
+        file_writer_config=FILE_WRITER_CONFIG,
+        skip_animations=False,
+        leave_progress_bars=False,
+    )
+    wall_time = time.perf_counter() - start_time
+    return {
+        "wall_time": wall_time,
+        "n_frames": scene.file_writer.frame_sinks[0].n_frames,
+        "peak_rss_mb": get_peak_rss_mb(),
+    }
+
+
+def render_benchmark_in_new_process(scene_name, media_dir):
+    ctx = mp.get_context("spawn")
+    with ctx.Pool(processes=1) as pool:
+        return pool.apply(render_benchmark, (scene_name, media_dir))
+
+
+def run_benchmark(scene_name):
+    """
+    Renders the scene twice, first with an empty media directory,
+    so that Tex, Text and svg files all have to be generated, and
+    then again reusing those files.
+    """
+    media_dir = tempfile.mkdtemp(prefix="manim_benchmark_")
+    try:
+        cold = render_benchmark_in_new_process(scene_name, media_dir)
+        warm = render_benchmark_in_new_process(scene_name, media_dir)
+    finally:
+        shutil.rmtree(media_dir, ignore_errors=True)
+    peak_rss_values = [
+        run["peak_rss_mb"] for run in (cold, warm)
+        if run["peak_rss_mb"] is not None
+    ]
+    return {
+        "n_frames": warm["n_frames"],
+        "fps": warm["n_frames"] / warm["wall_time"],
+        "cold_time": cold["wall_time"],
+        "warm_time": warm["wall_time"],
+        "peak_rss_mb": max(peak_rss_values) if peak_rss_values else None,
+    }
+
+
+def compare_to_baseline(results, baseline, threshold):
+    """
+    Returns a description of each metric which is worse than
+    in baseline by more than the fraction threshold.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        for metric, larger_is_better in METRICS:
+            value = result.get(metric)
+            base_value = baseline[name].get(metric)
+            if value is None or not base_value:
+                continue
+            change = (value - base_value) / base_value
+            if larger_is_better:
+                change = -change
+            if change > threshold:
+                regressions.append(
+                    "{}: {} went from {:.3f} to {:.3f} ({:+.1%})".format(
+                        name, metric, base_value, value,
+                        (value - base_value) / base_value,
+                    )
+                )
+    return regressions
+
+
+def print_results(results, baseline):
+    print("\n{:<25} {:>8} {:>10} {:>10} {:>10}".format(
+        "benchmark", "fps", "cold (s)", "warm (s)", "rss (MB)"
+    ))
+    for name, result in results.items():
+        row = "{:<25} {:>8.2f} {:>10.2f} {:>10.2f} {:>10}".format(
+            name, result["fps"], result["cold_time"], result["warm_time"],
+            "-" if result["peak_rss_mb"] is None
+            else "{:.0f}".format(result["peak_rss_mb"]),
+        )
+        if name in baseline:
+            row += "   (baseline {:.2f} fps)".format(baseline[name]["fps"])
+        print(row)
+
+
+def parse_cli():
+    import benchmark_scenes
+    names = [scene_class.__name__ for scene_class in benchmark_scenes.BENCHMARKS]
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        default=names,
+        help="Benchmarks to run, all of them by default",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=DEFAULT_BASELINE_FILE,
+        help="Json file of earlier results to compare against",
+    )
+    parser.add_argument(
+        "--save_baseline",
+        action="store_true",
+        help="Write the results into the baseline file",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Fraction by which a metric may be worse than "
+             "its baseline before counting as a regression",
+    )
+    parser.add_argument(
+        "-o", "--output",
+        help="Json file to write the results to",
+    )
+    args = parser.parse_args()
+    unknown_names = set(args.benchmarks).difference(names)
+    if unknown_names:
+        parser.error("Unknown benchmarks: {}. Choose from {}".format(
+            ", ".join(sorted(unknown_names)), ", ".join(names)
+        ))
+    return args
+
+
+def main():
+    args = parse_cli()
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r") as fp:
+            baseline = json.load(fp)["benchmarks"]
+
+    results = {}
+    for name in args.benchmarks:
+        print("Running {}".format(name))
+        results[name] = run_benchmark(name)
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump({"benchmarks": results}, fp, indent=2)
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w") as fp:
+            json.dump({
+                "camera_config": CAMERA_CONFIG,
+                "benchmarks": baseline,
+            }, fp, indent=2)
+        print("Baseline written to {}".format(args.baseline))
+        return
+    if not baseline:
+        print("\nNo baseline at {}, create one with --save_baseline".format(
+            args.baseline
+        ))
+        return
+
+    regressions = compare_to_baseline(results, baseline, args.threshold)
+    if regressions:
+        print("\nRegressions beyond {:.0%}:".format(args.threshold))
+        for regression in regressions:
+            print("  " + regression)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
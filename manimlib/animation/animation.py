@@ -5,6 +5,7 @@ import numpy as np
 from manimlib.mobject.mobject import Mobject
 from manimlib.utils.config_ops import digest_config
 from manimlib.utils.rate_functions import smooth
+from manimlib.utils.rate_functions import tabulate_rate_func
 
 
 DEFAULT_ANIMATION_RUN_TIME = 1.0
@@ -25,12 +26,17 @@ class Animation(object):
         # with lagged start times
         "lag_ratio": DEFAULT_ANIMATION_LAG_RATIO,
         "suspend_mobject_updating": True,
+        # If not None, rate_func is replaced by a lookup table
+        # with this many samples, which is worth it for rate
+        # functions which are expensive to evaluate
+        "rate_func_table_size": None,
     }
 
     def __init__(self, mobject, **kwargs):
         assert(isinstance(mobject, Mobject))
         digest_config(self, kwargs)
         self.mobject = mobject
+        self.apply_rate_func_table_size()
 
     def __str__(self):
         if self.name:
@@ -103,8 +109,17 @@ class Animation(object):
 
     def update_config(self, **kwargs):
         digest_config(self, kwargs)
+        if "rate_func" in kwargs or "rate_func_table_size" in kwargs:
+            self.apply_rate_func_table_size()
         return self
 
+    def apply_rate_func_table_size(self):
+        if self.rate_func_table_size is None:
+            return
+        # Tabulate the original function, not an earlier table of it
+        func = getattr(self.rate_func, "tabulated_func", self.rate_func)
+        self.rate_func = tabulate_rate_func(func, self.rate_func_table_size)
+
     # Methods for interpolation, the mean of an Animation
     def interpolate(self, alpha):
         alpha = np.clip(alpha, 0, 1)
@@ -119,8 +134,8 @@ class Animation(object):
 
     def interpolate_mobject(self, alpha):
         families = list(self.get_all_families_zipped())
-        for i, mobs in enumerate(families):
-            sub_alpha = self.get_sub_alpha(alpha, i, len(families))
+        sub_alphas = self.get_sub_alphas(alpha, len(families))
+        for mobs, sub_alpha in zip(families, sub_alphas):
             self.interpolate_submobject(*mobs, sub_alpha)
 
     def interpolate_submobject(self, submobject, starting_sumobject, alpha):
@@ -137,6 +152,19 @@ class Animation(object):
         lower = index * lag_ratio
         return np.clip((value - lower), 0, 1)
 
+    def get_sub_alphas(self, alpha, num_submobjects):
+        """
+        All the values of get_sub_alpha for this alpha, as one array
+        """
+        if type(self).get_sub_alpha is not Animation.get_sub_alpha:
+            return [
+                self.get_sub_alpha(alpha, index, num_submobjects)
+                for index in range(num_submobjects)
+            ]
+        return self.get_sub_alpha(
+            alpha, np.arange(num_submobjects), num_submobjects
+        )
+
     # Getters and setters
     def set_run_time(self, run_time):
         self.run_time = run_time
@@ -7,6 +7,7 @@ from manimlib.utils.bezier import interpolate
 from manimlib.utils.config_ops import digest_config
 from manimlib.utils.iterables import remove_list_redundancies
 from manimlib.utils.rate_functions import linear
+from manimlib.utils.rate_functions import supports_arrays
 
 
 DEFAULT_LAGGED_START_LAG_RATIO = 0.05
@@ -93,16 +94,35 @@ class AnimationGroup(Animation):
         # e.g. of the surrounding scene.  Instead they'd
         # be a rescaled version.  But that's okay!
         time = alpha * self.max_end_time
-        for anim, start_time, end_time in self.anims_with_timings:
-            anim_time = end_time - start_time
-            if anim_time == 0:
-                sub_alpha = 0
+        if not self.anims_with_timings:
+            return
+        anims, start_times, end_times = zip(*self.anims_with_timings)
+        start_times = np.array(start_times, dtype=float)
+        anim_times = np.array(end_times, dtype=float) - start_times
+        sub_alphas = np.clip(
+            np.divide(
+                time - start_times, anim_times,
+                out=np.zeros(len(anims)),
+                where=(anim_times != 0),
+            ),
+            0, 1
+        )
+        # Animations sharing a rate function which works on arrays,
+        # as with LaggedStartMap, get it applied to all their alphas
+        # at once.  Those which override interpolate don't.
+        indices_by_rate_func = dict()
+        for index, anim in enumerate(anims):
+            if type(anim).interpolate is Animation.interpolate and \
+                    supports_arrays(anim.rate_func):
+                indices_by_rate_func.setdefault(anim.rate_func, []).append(index)
+        rated_alphas = dict()
+        for rate_func, indices in indices_by_rate_func.items():
+            rated_alphas.update(zip(indices, rate_func(sub_alphas[indices])))
+        for index, (anim, sub_alpha) in enumerate(zip(anims, sub_alphas)):
+            if index in rated_alphas:
+                anim.interpolate_mobject(rated_alphas[index])
             else:
-                sub_alpha = np.clip(
-                    (time - start_time) / anim_time,
-                    0, 1
-                )
-            anim.interpolate(sub_alpha)
+                anim.interpolate(sub_alpha)
 
 
 class Succession(AnimationGroup):
@@ -1,6 +1,7 @@
 from manimlib.animation.animation import Animation
 from manimlib.animation.composition import Succession
 from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.mobject.types.vectorized_mobject import batch_pointwise_become_partial
 from manimlib.mobject.mobject import Group
 from manimlib.utils.bezier import integer_interpolate
 from manimlib.utils.config_ops import digest_config
@@ -12,11 +13,55 @@ import numpy as np
 import itertools as it
 
 
+def can_become_partial_in_batch(submob, start_submob):
+    return all([
+        isinstance(submob, VMobject),
+        isinstance(start_submob, VMobject),
+        # Subclasses may do something else
+        type(submob).pointwise_become_partial is VMobject.pointwise_become_partial,
+    ])
+
+
+def get_cubic_bezier_tuples_using_cache(cache, vmobject, use_cache):
+    if not use_cache:
+        return vmobject.get_cubic_bezier_tuples()
+    if vmobject not in cache:
+        cache[vmobject] = vmobject.get_cubic_bezier_tuples()
+    return cache[vmobject]
+
+
 class ShowPartial(Animation):
     """
     Abstract class for ShowCreation and ShowPassingFlash
     """
 
+    def begin(self):
+        self.cubic_bezier_tuples_cache = {}
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        if type(self).interpolate_submobject is not ShowPartial.interpolate_submobject:
+            return super().interpolate_mobject(alpha)
+        # Unless something updates the starting mobject, its
+        # curves are the same every frame
+        use_cache = len(self.starting_mobject.get_family_updaters()) == 0
+        submobs, start_submobs, bounds, bezier_quads_list = [], [], [], []
+        families = list(self.get_all_families_zipped())
+        sub_alphas = self.get_sub_alphas(alpha, len(families))
+        for (submob, start_submob), sub_alpha in zip(families, sub_alphas):
+            if not can_become_partial_in_batch(submob, start_submob):
+                self.interpolate_submobject(submob, start_submob, sub_alpha)
+                continue
+            submobs.append(submob)
+            start_submobs.append(start_submob)
+            bounds.append(self.get_bounds(sub_alpha))
+            bezier_quads_list.append(get_cubic_bezier_tuples_using_cache(
+                self.cubic_bezier_tuples_cache, start_submob, use_cache
+            ))
+        batch_pointwise_become_partial(
+            submobs, start_submobs, bounds, bezier_quads_list
+        )
+
     def interpolate_submobject(self, submob, start_submob, alpha):
         submob.pointwise_become_partial(
             start_submob, *self.get_bounds(alpha)
@@ -64,6 +109,7 @@ class DrawBorderThenFill(Animation):
 
     def begin(self):
         self.outline = self.get_outline()
+        self.cubic_bezier_tuples_cache = {}
         super().begin()
 
     def get_outline(self):
@@ -86,6 +132,32 @@ class DrawBorderThenFill(Animation):
     def get_all_mobjects(self):
         return [*super().get_all_mobjects(), self.outline]
 
+    def interpolate_mobject(self, alpha):
+        if type(self).interpolate_submobject is not DrawBorderThenFill.interpolate_submobject:
+            return super().interpolate_mobject(alpha)
+        use_cache = len(self.outline.get_family_updaters()) == 0
+        # Submobjects still having their border drawn are
+        # handled all together once the others are done
+        submobs, outlines, bounds, bezier_quads_list = [], [], [], []
+        families = list(self.get_all_families_zipped())
+        sub_alphas = self.get_sub_alphas(alpha, len(families))
+        for (submob, start, outline), sub_alpha in zip(families, sub_alphas):
+            index, subalpha = integer_interpolate(0, 2, sub_alpha)
+            if index != 0 or not can_become_partial_in_batch(submob, outline):
+                self.interpolate_submobject(submob, start, outline, sub_alpha)
+                continue
+            submobs.append(submob)
+            outlines.append(outline)
+            bounds.append((0, subalpha))
+            bezier_quads_list.append(get_cubic_bezier_tuples_using_cache(
+                self.cubic_bezier_tuples_cache, outline, use_cache
+            ))
+        batch_pointwise_become_partial(
+            submobs, outlines, bounds, bezier_quads_list
+        )
+        for submob, outline in zip(submobs, outlines):
+            submob.match_style(outline)
+
     def interpolate_submobject(self, submob, start, outline, alpha):
         index, subalpha = integer_interpolate(0, 2, alpha)
         if index == 0:
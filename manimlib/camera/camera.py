@@ -3,25 +3,33 @@ import itertools as it
 import operator as op
 import time
 import copy
+import weakref
 
 from PIL import Image
-from scipy.spatial.distance import pdist
 import cairo
 import numpy as np
 
 from manimlib.constants import *
 from manimlib.mobject.types.image_mobject import AbstractImageMobject
 from manimlib.mobject.mobject import Mobject
+from manimlib.mobject.three_d_utils import get_3d_end_corner_index
+from manimlib.mobject.three_dimensions import ParametricSurface
 from manimlib.mobject.types.point_cloud_mobject import PMobject
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.color import color_to_int_rgba
+from manimlib.utils.compositing import composite_premultiplied
+from manimlib.utils.compositing import get_compositing_buffers
+from manimlib.utils.compositing import get_scratch_array
+from manimlib.utils.compositing import overlay_rgba_array
 from manimlib.utils.config_ops import digest_config
+from manimlib.utils.config_ops import get_config_keys
 from manimlib.utils.images import get_full_raster_image_path
+from manimlib.utils.images import sample_bilinear
 from manimlib.utils.iterables import batch_by_property
 from manimlib.utils.iterables import list_difference_update
 from manimlib.utils.iterables import remove_list_redundancies
+from manimlib.utils.profiling import time_phase
 from manimlib.utils.simple_functions import fdiv
-from manimlib.utils.space_ops import angle_of_vector
 from manimlib.utils.space_ops import get_norm
 
 
@@ -48,12 +56,26 @@ class Camera(object):
         # round z coordinate to nearest hundredth when comparring
         "z_buff_func": lambda m: np.round(m.get_center()[2], 2),
         "cairo_line_width_multiple": 0.01,
+        # If True, vmobjects which are drawn unchanged in consecutive
+        # frames are rendered once to their own tile, which is then
+        # painted in place of redrawing them.
+        "cache_rasterized_vmobjects": False,
+        # In bytes, least recently used tiles are dropped first.
+        "max_rasterization_cache_size": 256 * 1024**2,
+        # A RenderProfiler, which is handed the time spent drawing
+        # each type of mobject
+        "profiler": None,
     }
 
     def __init__(self, background=None, **kwargs):
         digest_config(self, kwargs, locals())
         self.rgb_max_val = np.iinfo(self.pixel_array_dtype).max
         self.pixel_array_to_cairo_context = {}
+        # Maps vmobjects to the points and cairo path they
+        # were last drawn with
+        self.cairo_path_cache = weakref.WeakKeyDictionary()
+        self.rasterization_cache = weakref.WeakKeyDictionary()
+        self.rasterization_cache_clock = 0
         self.init_background()
         self.resize_frame_shape()
         self.reset()
@@ -65,6 +87,35 @@ class Camera(object):
         self.canvas = None
         return copy.copy(self)
 
+    def get_configuration(self):
+        """
+        Everything which determines how this camera draws a
+        given set of mobjects, e.g. for hashing, as opposed to
+        what it keeps of the frames it has drawn.
+        """
+        result = dict([
+            (key, self.__dict__[key])
+            for key in get_config_keys(type(self))
+            # The profiler only records how long drawing took
+            if key in self.__dict__ and key != "profiler"
+        ])
+        result.update({
+            "pixel_shape": (self.get_pixel_height(), self.get_pixel_width()),
+            "frame_shape": (self.get_frame_height(), self.get_frame_width()),
+            "frame_center": np.array(self.get_frame_center()),
+            "background": self.background,
+        })
+        return result
+
+    def copy_view_from(self, camera):
+        """
+        Makes this camera look at the scene the way camera does,
+        e.g. for filming the same shots as another camera at a
+        different resolution.
+        """
+        self.frame_center = np.array(camera.get_frame_center())
+        return self
+
     def reset_pixel_shape(self, new_height, new_width):
         self.pixel_width = new_width
         self.pixel_height = new_height
@@ -266,7 +317,8 @@ class Camera(object):
             # check what the type is, and call the appropriate function
             for mobject_type, func in type_func_pairs:
                 if batch_type == mobject_type:
-                    func(batch, self.pixel_array)
+                    with time_phase(self.profiler, "rasterization", mobject_type.__name__):
+                        func(batch, self.pixel_array)
 
     # Methods associated with svg rendering
 
@@ -284,9 +336,6 @@ class Camera(object):
             return cached_ctx
         pw = self.get_pixel_width()
         ph = self.get_pixel_height()
-        fw = self.get_frame_width()
-        fh = self.get_frame_height()
-        fc = self.get_frame_center()
         surface = cairo.ImageSurface.create_for_data(
             pixel_array,
             cairo.FORMAT_ARGB32,
@@ -294,14 +343,25 @@ class Camera(object):
         )
         ctx = cairo.Context(surface)
         ctx.scale(pw, ph)
-        ctx.set_matrix(cairo.Matrix(
+        ctx.set_matrix(self.get_cairo_matrix())
+        self.cache_cairo_context(pixel_array, ctx)
+        return ctx
+
+    def get_cairo_matrix(self):
+        """
+        The transformation from frame coordinates to pixels
+        """
+        pw = self.get_pixel_width()
+        ph = self.get_pixel_height()
+        fw = self.get_frame_width()
+        fh = self.get_frame_height()
+        fc = self.get_frame_center()
+        return cairo.Matrix(
             fdiv(pw, fw), 0,
             0, -fdiv(ph, fh),
             (pw / 2) - fc[0] * fdiv(pw, fw),
             (ph / 2) + fc[1] * fdiv(ph, fh),
-        ))
-        self.cache_cairo_context(pixel_array, ctx)
-        return ctx
+        )
 
     def display_multiple_vectorized_mobjects(self, vmobjects, pixel_array):
         if len(vmobjects) == 0:
@@ -318,10 +378,167 @@ class Camera(object):
 
     def display_multiple_non_background_colored_vmobjects(self, vmobjects, pixel_array):
         ctx = self.get_cairo_context(pixel_array)
+        for vmobject in vmobjects:
+            if self.cache_rasterized_vmobjects:
+                self.display_vectorized_using_cache(vmobject, ctx)
+            else:
+                self.display_vectorized(vmobject, ctx)
+
+    def get_rasterization_key(self, vmobject):
+        """
+        Everything which affects how a vmobject is drawn, for
+        comparing against how it was drawn last time.
+        """
+        return [
+            np.array(self.transform_points_pre_display(
+                vmobject, vmobject.points
+            )),
+            np.array(self.get_fill_rgbas(vmobject)),
+            np.array(self.get_stroke_rgbas(vmobject)),
+            np.array(self.get_stroke_rgbas(vmobject, background=True)),
+            np.array(vmobject.get_stroke_width()),
+            np.array(vmobject.get_stroke_width(background=True)),
+            np.array(vmobject.get_sheen_direction()),
+            np.array(self.get_frame_center()),
+            np.array([self.get_frame_width(), self.get_frame_height()]),
+        ] + [
+            np.array(vmobject.get_face_rgbas(kind))
+            for kind in ["fill", "stroke"]
+            if isinstance(vmobject, ParametricSurface) and vmobject.has_mesh()
+        ]
+
+    def display_vectorized_using_cache(self, vmobject, ctx):
+        self.rasterization_cache_clock += 1
+        key = self.get_rasterization_key(vmobject)
+        entry = self.rasterization_cache.get(vmobject)
+        if entry is None or not all([
+            np.array_equal(a1, a2) for a1, a2 in zip(entry["key"], key)
+        ]):
+            # It's new or it has changed since the last time it was drawn,
+            # in which case it's likely to keep changing, so draw it
+            # directly, and only cache a tile once it holds still.
+            self.rasterization_cache[vmobject] = {
+                "key": key,
+                "tile": None,
+                "last_used": self.rasterization_cache_clock,
+            }
+            return self.display_vectorized(vmobject, ctx)
+        entry["last_used"] = self.rasterization_cache_clock
+        if entry["tile"] is None:
+            entry["tile"] = self.rasterize_vmobject_tile(vmobject, key[0])
+            self.evict_from_rasterization_cache()
+        if entry["tile"] is None:
+            # Too large to fit in the cache at all
+            return self.display_vectorized(vmobject, ctx)
+        surface, x, y, size = entry["tile"]
+        if surface is None:
+            # Entirely off screen
+            return self
+        ctx.save()
+        ctx.identity_matrix()
+        ctx.set_source_surface(surface, x, y)
+        ctx.paint()
+        ctx.restore()
+        return self
+
+    def rasterize_vmobject_tile(self, vmobject, points):
+        """
+        Draws vmobject onto a transparent surface covering only its
+        pixel bounding box.  Returns that surface, the pixel coordinates
+        of its upper left corner, and its size in bytes.
+        """
+        bounding_box = self.get_pixel_bounding_box(vmobject, points)
+        if bounding_box is None:
+            return (None, 0, 0, 0)
+        x0, y0, x1, y1 = bounding_box
+        matrix = self.get_cairo_matrix()
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, x1 - x0, y1 - y0)
+        ctx = cairo.Context(surface)
+        ctx.set_matrix(cairo.Matrix(
+            matrix.xx, matrix.yx,
+            matrix.xy, matrix.yy,
+            matrix.x0 - x0, matrix.y0 - y0,
+        ))
+        self.display_vectorized(vmobject, ctx)
+        surface.flush()
+        return (surface, x0, y0, surface.get_stride() * (y1 - y0))
+
+    def get_pixel_bounding_box(self, vmobject, points=None):
+        """
+        Returns the pixel coordinates (x0, y0, x1, y1) of a box
+        holding everything drawn for vmobject, clipped to the frame,
+        or None if that is empty.
+        """
+        if points is None:
+            points = self.transform_points_pre_display(
+                vmobject, vmobject.points
+            )
+        if len(points) == 0:
+            return None
+        matrix = self.get_cairo_matrix()
+        corners = [
+            matrix.transform_point(*point)
+            for point in [points[:, :2].min(0), points[:, :2].max(0)]
+        ]
+        max_width = max(
+            vmobject.get_stroke_width(),
+            vmobject.get_stroke_width(background=True),
+        )
+        line_width = max_width * self.cairo_line_width_multiple * \
+            (self.get_frame_width() / FRAME_WIDTH)
+        # Mitered corners can reach beyond half the line width
+        buff = 5 * line_width * abs(matrix.xx) + 2
+        xs, ys = zip(*corners)
+        x0 = max(int(np.floor(min(xs) - buff)), 0)
+        y0 = max(int(np.floor(min(ys) - buff)), 0)
+        x1 = min(int(np.ceil(max(xs) + buff)), self.get_pixel_width())
+        y1 = min(int(np.ceil(max(ys) + buff)), self.get_pixel_height())
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return (x0, y0, x1, y1)
+
+    def evict_from_rasterization_cache(self):
+        entries = [
+            entry for entry in self.rasterization_cache.values()
+            if entry["tile"] is not None
+        ]
+        total_size = sum([entry["tile"][3] for entry in entries])
+        entries.sort(key=lambda entry: entry["last_used"])
+        for entry in entries:
+            if total_size <= self.max_rasterization_cache_size:
+                break
+            total_size -= entry["tile"][3]
+            entry["tile"] = None
+
+    def rasterize_vmobjects_layer(self, vmobjects):
+        """
+        Draws vmobjects onto a transparent surface the size of the
+        frame, which paint_layer can later lay over a pixel array.
+        """
+        surface = cairo.ImageSurface(
+            cairo.FORMAT_ARGB32,
+            self.get_pixel_width(),
+            self.get_pixel_height(),
+        )
+        ctx = cairo.Context(surface)
+        ctx.set_matrix(self.get_cairo_matrix())
         for vmobject in vmobjects:
             self.display_vectorized(vmobject, ctx)
+        surface.flush()
+        return surface
+
+    def paint_layer(self, surface, pixel_array):
+        ctx = self.get_cairo_context(pixel_array)
+        ctx.save()
+        ctx.identity_matrix()
+        ctx.set_source_surface(surface, 0, 0)
+        ctx.paint()
+        ctx.restore()
+        return self
 
     def display_vectorized(self, vmobject, ctx):
+        if isinstance(vmobject, ParametricSurface) and vmobject.has_mesh():
+            return self.display_surface_mesh(vmobject, ctx)
         self.set_cairo_context_path(ctx, vmobject)
         self.apply_stroke(ctx, vmobject, background=True)
         self.apply_fill(ctx, vmobject)
@@ -338,16 +555,27 @@ class Camera(object):
             return
 
         ctx.new_path()
-        subpaths = vmobject.gen_subpaths_from_points_2d(points)
-        for subpath in subpaths:
-            quads = vmobject.gen_cubic_bezier_tuples_from_points(subpath)
+        cached = self.cairo_path_cache.get(vmobject)
+        if cached is not None and np.array_equal(cached[0], points):
+            ctx.append_path(cached[1])
+            return self
+
+        nppcc = vmobject.n_points_per_cubic_curve
+        n_curves = len(points) // nppcc
+        # Each row is the handles and end anchor of one curve,
+        # i.e. the arguments to ctx.curve_to
+        curves = points[:nppcc * n_curves, :2].reshape(
+            (n_curves, 2 * nppcc)
+        )[:, 2:].tolist()
+        starts, ends, closed = vmobject.get_subpath_bounds_2d(points)
+        for start, end, is_closed in zip(starts, ends, closed):
             ctx.new_sub_path()
-            start = subpath[0]
-            ctx.move_to(*start[:2])
-            for p0, p1, p2, p3 in quads:
-                ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
-            if vmobject.consider_points_equals_2d(subpath[0], subpath[-1]):
+            ctx.move_to(*points[start, :2])
+            for curve in curves[start // nppcc:end // nppcc]:
+                ctx.curve_to(*curve)
+            if is_closed:
                 ctx.close_path()
+        self.cairo_path_cache[vmobject] = (np.array(points), ctx.copy_path())
         return self
 
     def set_cairo_context_color(self, ctx, rgbas, vmobject):
@@ -399,6 +627,100 @@ class Camera(object):
         ctx.stroke_preserve()
         return self
 
+    def display_surface_mesh(self, surface, ctx):
+        """
+        Draws each face of the mesh of a ParametricSurface as
+        display_vectorized would draw it as a vmobject of its own,
+        in the order given by get_mesh_face_order.
+        """
+        points = self.transform_points_pre_display(surface, surface.points)
+        if len(points) == 0:
+            return self
+        face_points = points.reshape((*surface.get_mesh_shape(), 3))
+        n_faces = len(face_points)
+        nppcc = surface.n_points_per_cubic_curve
+        starts = face_points[:, 0, :2].tolist()
+        # Each row is the handles and end anchor of one curve
+        curves = face_points[:, :, :2].reshape(
+            (n_faces, -1, 2 * nppcc)
+        )[:, :, 2:].tolist()
+        closed = np.all(np.isclose(
+            face_points[:, 0, :2], face_points[:, -1, :2],
+            atol=surface.tolerance_for_point_equality,
+        ), axis=1).tolist()
+
+        # The same layers as display_vectorized
+        layers = []
+        for kind in ["background_stroke", "fill", "stroke"]:
+            if kind == "fill":
+                width = None
+            else:
+                width = surface.get_stroke_width(kind == "background_stroke")
+                if width == 0:
+                    continue
+                width *= self.cairo_line_width_multiple * \
+                    (self.get_frame_width() / FRAME_WIDTH)
+            layers.append((width, self.get_mesh_face_sources(
+                surface, face_points, kind
+            )))
+
+        for index in self.get_mesh_face_order(surface):
+            ctx.new_path()
+            ctx.move_to(*starts[index])
+            for curve in curves[index]:
+                ctx.curve_to(*curve)
+            if closed[index]:
+                ctx.close_path()
+            for width, sources in layers:
+                ctx.set_source(sources[index])
+                if width is None:
+                    ctx.fill_preserve()
+                else:
+                    ctx.set_line_width(width)
+                    ctx.stroke_preserve()
+        return self
+
+    def get_mesh_face_rgbas(self, surface, kind):
+        """
+        Returns an array of shape (n_faces, n_colors, 4), where
+        kind is "fill", "stroke" or "background_stroke".  Faces of a
+        mesh have no sheen, see ParametricSurface.set_sheen.
+        """
+        return surface.get_face_rgbas(kind)[:, np.newaxis, :]
+
+    def get_mesh_gradient_points(self, surface, face_points):
+        # As get_3d_vmob_gradient_start_and_end_points for each face
+        end_index = get_3d_end_corner_index(face_points.shape[1])
+        return face_points[:, 0], face_points[:, end_index]
+
+    def get_mesh_face_sources(self, surface, face_points, kind):
+        """
+        The cairo source for each face, as set_cairo_context_color
+        would set it.
+        """
+        rgbas = self.get_mesh_face_rgbas(surface, kind)
+        # Cairo's surface encodes rgb in reverse order
+        rgbas = np.concatenate([
+            rgbas[:, :, 2::-1], rgbas[:, :, 3:]
+        ], axis=2).tolist()
+        if len(rgbas[0]) == 1:
+            return [cairo.SolidPattern(*rgba[0]) for rgba in rgbas]
+        starts, ends = [
+            points[:, :2].tolist()
+            for points in self.get_mesh_gradient_points(surface, face_points)
+        ]
+        offsets = np.linspace(0, 1, len(rgbas[0]))
+        sources = []
+        for start, end, face_rgbas in zip(starts, ends, rgbas):
+            pat = cairo.LinearGradient(*start, *end)
+            for rgba, offset in zip(face_rgbas, offsets):
+                pat.add_color_stop_rgba(offset, *rgba)
+            sources.append(pat)
+        return sources
+
+    def get_mesh_face_order(self, surface):
+        return range(surface.get_mesh_shape()[0])
+
     def get_stroke_rgbas(self, vmobject, background=False):
         return vmobject.get_stroke_rgbas(background)
 
@@ -415,7 +737,12 @@ class Camera(object):
     def display_multiple_background_colored_vmobject(self, cvmobjects, pixel_array):
         displayer = self.get_background_colored_vmobject_displayer()
         cvmobject_pixel_array = displayer.display(*cvmobjects)
-        self.overlay_rgba_array(pixel_array, cvmobject_pixel_array)
+        if displayer.bounding_box is None:
+            return self
+        self.overlay_rgba_array(
+            pixel_array, cvmobject_pixel_array,
+            bounding_box=displayer.bounding_box,
+        )
         return self
 
     # Methods for other rendering
@@ -473,63 +800,102 @@ class Camera(object):
         ul_coords, ur_coords, dl_coords = corner_coords
         right_vect = ur_coords - ul_coords
         down_vect = dl_coords - ul_coords
-        center_coords = ul_coords + (right_vect + down_vect) / 2
 
+        # Resize first, so that shrinking an image averages
+        # its pixels rather than skipping over them
         sub_image = Image.fromarray(
             image_mobject.get_pixel_array(),
             mode="RGBA"
         )
-
-        # Reshape
-        pixel_width = max(int(pdist([ul_coords, ur_coords])), 1)
-        pixel_height = max(int(pdist([ul_coords, dl_coords])), 1)
-        sub_image = sub_image.resize(
-            (pixel_width, pixel_height), resample=Image.BICUBIC
-        )
-
-        # Rotate
-        angle = angle_of_vector(right_vect)
-        adjusted_angle = -int(360 * angle / TAU)
-        if adjusted_angle != 0:
-            sub_image = sub_image.rotate(
-                adjusted_angle, resample=Image.BICUBIC, expand=1
+        pixel_width = max(int(get_norm(right_vect)), 1)
+        pixel_height = max(int(get_norm(down_vect)), 1)
+        if sub_image.size != (pixel_width, pixel_height):
+            sub_image = sub_image.resize(
+                (pixel_width, pixel_height), resample=Image.BICUBIC
             )
+        sub_pixel_array = np.array(sub_image.convert("RGBa"))
+
+        # Affine map taking coordinates in the sub image
+        # to coordinates in pixel_array, shear included
+        matrix = np.array([
+            right_vect / pixel_width,
+            down_vect / pixel_height,
+        ]).T
+        if abs(np.linalg.det(matrix)) < 1e-8:
+            return
+        inverse = np.linalg.inv(matrix)
+
+        # Only the bounding box of the image's corners is touched
+        corners = [ul_coords, ur_coords, dl_coords, ur_coords + down_vect]
+        x_min, y_min = np.floor(np.min(corners, axis=0)).astype(int)
+        x_max, y_max = np.ceil(np.max(corners, axis=0)).astype(int) + 1
+        x_min, x_max = np.clip([x_min, x_max], 0, self.get_pixel_width())
+        y_min, y_max = np.clip([y_min, y_max], 0, self.get_pixel_height())
+        if x_min >= x_max or y_min >= y_max:
+            return
 
-        # TODO, there is no accounting for a shear...
-
-        # Paste into an image as large as the camear's pixel array
-        full_image = Image.fromarray(
-            np.zeros((self.get_pixel_height(), self.get_pixel_width())),
-            mode="RGBA"
-        )
-        new_ul_coords = center_coords - np.array(sub_image.size) / 2
-        new_ul_coords = new_ul_coords.astype(int)
-        full_image.paste(
-            sub_image,
-            box=(
-                new_ul_coords[0],
-                new_ul_coords[1],
-                new_ul_coords[0] + sub_image.size[0],
-                new_ul_coords[1] + sub_image.size[1],
+        if np.all(matrix == np.identity(2)):
+            # Axis aligned at its own size, so no resampling is needed
+            x_start, y_start = ul_coords
+            x_min, y_min = max(x_start, 0), max(y_start, 0)
+            x_max = min(x_start + pixel_width, self.get_pixel_width())
+            y_max = min(y_start + pixel_height, self.get_pixel_height())
+            self.overlay_premultiplied_rgba(
+                pixel_array[y_min:y_max, x_min:x_max],
+                sub_pixel_array[
+                    y_min - y_start:y_max - y_start,
+                    x_min - x_start:x_max - x_start,
+                ]
             )
-        )
-        # Paint on top of existing pixel array
-        self.overlay_PIL_image(pixel_array, full_image)
+            return
 
-    def overlay_rgba_array(self, pixel_array, new_array):
-        self.overlay_PIL_image(
-            pixel_array,
-            self.get_image(new_array),
+        # Pixel centers sit half a pixel in from the corners
+        xs = np.arange(x_min, x_max, dtype=np.float32) + 0.5 - ul_coords[0]
+        ys = np.arange(y_min, y_max, dtype=np.float32) + 0.5 - ul_coords[1]
+        xs, ys = xs[np.newaxis, :], ys[:, np.newaxis]
+        inverse = inverse.astype(np.float32)
+        sub_xs = (inverse[0, 0] * xs - 0.5) + inverse[0, 1] * ys
+        sub_ys = (inverse[1, 0] * xs - 0.5) + inverse[1, 1] * ys
+        # Pixels further than one sub pixel from the image are left alone
+        in_range = reduce(op.and_, [
+            sub_xs > -1, sub_xs < pixel_width,
+            sub_ys > -1, sub_ys < pixel_height,
+        ])
+        warped = sample_bilinear(
+            sub_pixel_array, sub_xs[in_range], sub_ys[in_range]
+        )
+        pixel_region = pixel_array[y_min:y_max, x_min:x_max]
+        region_pixels = pixel_region[in_range]
+        self.overlay_premultiplied_rgba(region_pixels, warped)
+        pixel_region[in_range] = region_pixels
+
+    def get_compositing_buffers(self):
+        # Scratch space for compositing, allocated once per pixel shape
+        shape = (self.get_pixel_height(), self.get_pixel_width(), 4)
+        buffers = getattr(self, "compositing_buffers", None)
+        if buffers is None or buffers[0] != shape:
+            buffers = (shape, *get_compositing_buffers(shape))
+            self.compositing_buffers = buffers
+        return buffers[1:]
+
+    def overlay_premultiplied_rgba(self, pixels, rgba):
+        composite_premultiplied(pixels, rgba, *self.get_compositing_buffers())
+
+    def overlay_rgba_array(self, pixel_array, new_array,
+                           premultiplied=False, bounding_box=None):
+        scratch, accumulator = self.get_compositing_buffers()
+        overlay_rgba_array(
+            pixel_array, new_array,
+            premultiplied=premultiplied,
+            bounding_box=bounding_box,
+            scratch=scratch,
+            accumulator=accumulator,
         )
 
     def overlay_PIL_image(self, pixel_array, image):
-        pixel_array[:, :] = np.array(
-            Image.alpha_composite(
-                self.get_image(pixel_array),
-                image
-            ),
-            dtype='uint8'
-        )
+        if image.mode != "RGBA":
+            image = image.convert("RGBA")
+        self.overlay_rgba_array(pixel_array, np.asarray(image))
 
     def adjust_out_of_range_points(self, points):
         if not np.any(points > self.max_allowable_norm):
@@ -654,6 +1020,11 @@ class BackgroundColoredVMobjectDisplayer(object):
         self.file_name_to_pixel_array_map = {}
         self.pixel_array = np.array(camera.get_pixel_array())
         self.reset_pixel_array()
+        # What display returns, of which only the region
+        # bounding_box, a pair of slices (rows, columns),
+        # can be nonzero
+        self.output_array = np.zeros_like(self.pixel_array)
+        self.bounding_box = None
 
     def reset_pixel_array(self):
         self.pixel_array[:, :] = 0
@@ -689,24 +1060,61 @@ class BackgroundColoredVMobjectDisplayer(object):
         self.file_name_to_pixel_array_map[file_name] = back_array
         return back_array
 
+    def get_batch_bounding_box(self, batch):
+        boxes = [
+            box for box in map(self.camera.get_pixel_bounding_box, batch)
+            if box is not None
+        ]
+        if len(boxes) == 0:
+            return None
+        x0, y0 = np.min(boxes, axis=0)[:2]
+        x1, y1 = np.max(boxes, axis=0)[2:]
+        return (slice(y0, y1), slice(x0, x1))
+
     def display(self, *cvmobjects):
+        if self.bounding_box is not None:
+            # Clear what was drawn last time
+            self.output_array[self.bounding_box] = 0
+        self.bounding_box = None
         batch_image_file_pairs = batch_by_property(
             cvmobjects, lambda cv: cv.get_background_image_file()
         )
-        curr_array = None
+        scratch = self.camera.get_compositing_buffers()[0]
         for batch, image_file in batch_image_file_pairs:
+            bounding_box = self.get_batch_bounding_box(batch)
+            if bounding_box is None:
+                continue
             background_array = self.get_background_array(image_file)
-            pixel_array = self.pixel_array
             self.camera.display_multiple_non_background_colored_vmobjects(
-                batch, pixel_array
+                batch, self.pixel_array
             )
-            new_array = np.array(
-                (background_array * pixel_array.astype('float') / 255),
-                dtype=self.camera.pixel_array_dtype
+            # Everything drawn lies in bounding_box, so only
+            # that region is multiplied and cleared
+            drawn = self.pixel_array[bounding_box]
+            new_array, rest = get_scratch_array(scratch, drawn.shape, np.uint16)
+            shifted = get_scratch_array(rest, drawn.shape, np.uint16)[0]
+            np.multiply(
+                background_array[bounding_box], drawn,
+                out=new_array, dtype=np.uint16,
             )
-            if curr_array is None:
-                curr_array = new_array
-            else:
-                curr_array = np.maximum(curr_array, new_array)
-            self.reset_pixel_array()
-        return curr_array
+            # Floor division by 255
+            np.right_shift(new_array, 8, out=shifted)
+            new_array += shifted
+            new_array += 1
+            new_array >>= 8
+            output = self.output_array[bounding_box]
+            np.maximum(output, new_array, out=new_array)
+            output[:] = new_array
+            drawn[:] = 0
+            self.bounding_box = self.get_union_bounding_box(
+                self.bounding_box, bounding_box
+            )
+        return self.output_array
+
+    def get_union_bounding_box(self, box1, box2):
+        if box1 is None:
+            return box2
+        return tuple([
+            slice(min(s1.start, s2.start), max(s1.stop, s2.stop))
+            for s1, s2 in zip(box1, box2)
+        ])
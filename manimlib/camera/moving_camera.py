@@ -1,3 +1,5 @@
+import numpy as np
+
 from manimlib.camera.camera import Camera
 from manimlib.constants import FRAME_HEIGHT
 from manimlib.constants import FRAME_WIDTH
@@ -46,6 +48,15 @@ class MovingCamera(Camera):
         self.frame = frame
         Camera.__init__(self, **kwargs)
 
+    def get_configuration(self):
+        result = Camera.get_configuration(self)
+        result["frame_points"] = self.frame.get_all_points()
+        return result
+
+    def copy_view_from(self, camera):
+        self.frame.points = np.array(camera.frame.points)
+        return self
+
     # TODO, make these work for a rotated frame
     def get_frame_height(self):
         return self.frame.get_height()
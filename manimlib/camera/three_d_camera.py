@@ -2,13 +2,20 @@ import numpy as np
 
 from manimlib.camera.camera import Camera
 from manimlib.constants import *
+from manimlib.mobject.mobject import Mobject
+from manimlib.mobject.three_d_utils import get_3d_end_corner_index
+from manimlib.mobject.three_d_utils import get_3d_unit_normals
 from manimlib.mobject.three_d_utils import get_3d_vmob_end_corner
 from manimlib.mobject.three_d_utils import get_3d_vmob_end_corner_unit_normal
 from manimlib.mobject.three_d_utils import get_3d_vmob_start_corner
 from manimlib.mobject.three_d_utils import get_3d_vmob_start_corner_unit_normal
+from manimlib.mobject.three_dimensions import ParametricSurface
 from manimlib.mobject.types.point_cloud_mobject import Point
+from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.mobject.value_tracker import ValueTracker
 from manimlib.utils.color import get_shaded_rgb
+from manimlib.utils.color import get_shaded_rgbs
+from manimlib.utils.hashing import get_hash_of_objects
 from manimlib.utils.simple_functions import clip_in_place
 from manimlib.utils.space_ops import rotation_about_z
 from manimlib.utils.space_ops import rotation_matrix
@@ -39,11 +46,56 @@ class ThreeDCamera(Camera):
         self.frame_center = Point(self.frame_center)
         self.fixed_orientation_mobjects = dict()
         self.fixed_in_frame_mobjects = set()
+        # Projected points for the frame being captured,
+        # see project_points_in_batch
+        self.projected_points = dict()
+        # Runs of faces of the surface meshes drawn in several
+        # pieces this frame, see sort_in_mesh_faces
+        self.mesh_face_runs = dict()
+        self.is_capturing = False
         self.reset_rotation_matrix()
 
     def capture_mobjects(self, mobjects, **kwargs):
         self.reset_rotation_matrix()
-        Camera.capture_mobjects(self, mobjects, **kwargs)
+        self.is_capturing = True
+        try:
+            Camera.capture_mobjects(self, mobjects, **kwargs)
+        finally:
+            self.is_capturing = False
+            self.projected_points = dict()
+            self.mesh_face_runs = dict()
+
+    def get_configuration(self):
+        result = Camera.get_configuration(self)
+        result.update({
+            "phi": self.get_phi(),
+            "theta": self.get_theta(),
+            "distance": self.get_distance(),
+            "gamma": self.get_gamma(),
+            "light_source": self.light_source.get_center(),
+            # Which mobjects these are, by their points, in an
+            # order which doesn't depend on where they are in memory
+            "fixed_in_frame_mobjects": sorted([
+                get_hash_of_objects(mob.points)
+                for mob in self.fixed_in_frame_mobjects
+            ]),
+            "fixed_orientation_mobjects": sorted([
+                get_hash_of_objects(mob.points, center_func())
+                for mob, center_func in self.fixed_orientation_mobjects.items()
+            ]),
+        })
+        return result
+
+    def copy_view_from(self, camera):
+        self.set_phi(camera.get_phi())
+        self.set_theta(camera.get_theta())
+        self.set_distance(camera.get_distance())
+        self.set_gamma(camera.get_gamma())
+        self.set_frame_center(camera.get_frame_center())
+        self.light_source.move_to(camera.light_source.get_center())
+        self.fixed_orientation_mobjects = dict(camera.fixed_orientation_mobjects)
+        self.fixed_in_frame_mobjects = set(camera.fixed_in_frame_mobjects)
+        return self
 
     def get_value_trackers(self):
         return [
@@ -87,22 +139,227 @@ class ThreeDCamera(Camera):
             vmobject, vmobject.get_fill_rgbas()
         )
 
+    def get_mesh_face_rgbas(self, surface, kind):
+        rgbas = surface.get_face_rgbas(kind)
+        if not (self.should_apply_shading and surface.shade_in_3d):
+            return rgbas[:, np.newaxis, :]
+        # As modified_rgbas, for every face at once
+        face_points = surface.get_face_points()
+        light_source_point = self.light_source.points[0]
+        shaded_rgbas = rgbas[:, np.newaxis, :].repeat(2, axis=1)
+        corner_indices = [0, get_3d_end_corner_index(face_points.shape[1])]
+        for k, index in enumerate(corner_indices):
+            shaded_rgbas[:, k, :3] = get_shaded_rgbs(
+                shaded_rgbas[:, k, :3],
+                face_points[:, index],
+                get_3d_unit_normals(face_points, index),
+                light_source_point,
+            )
+        return shaded_rgbas
+
+    def get_mesh_face_order(self, surface):
+        runs = self.mesh_face_runs.get(surface)
+        if runs:
+            return runs.pop(0)
+        if not self.has_depth_sorted_faces(surface):
+            return Camera.get_mesh_face_order(self, surface)
+        # Faces are sorted among themselves as get_mobjects_to_display
+        # would have sorted them as separate mobjects
+        z_values = self.get_mesh_face_z_values(surface)
+        return np.argsort(z_values, kind="stable").tolist()
+
+    def has_depth_sorted_faces(self, mobject):
+        return isinstance(mobject, ParametricSurface) and \
+            mobject.shade_in_3d and \
+            "z_index_group" not in mobject.__dict__ and \
+            mobject.has_mesh()
+
+    def get_mesh_face_z_values(self, surface):
+        return np.dot(
+            surface.get_face_centers(), self.get_rotation_matrix()[2]
+        )
+
+    def display_vectorized_using_cache(self, vmobject, ctx):
+        # A tile only holds one run of faces of a surface
+        if vmobject in self.mesh_face_runs:
+            return self.display_vectorized(vmobject, ctx)
+        return Camera.display_vectorized_using_cache(self, vmobject, ctx)
+
     def get_mobjects_to_display(self, *args, **kwargs):
         mobjects = Camera.get_mobjects_to_display(
             self, *args, **kwargs
         )
-        rot_matrix = self.get_rotation_matrix()
+        # The points of all mobjects in one array, with the
+        # rows of mobjects[i] starting at starts[i]
+        if len(mobjects) == 0:
+            return mobjects
+        lengths = np.array([len(mob.points) for mob in mobjects], dtype=int)
+        starts = np.cumsum(lengths) - lengths
+        points = np.concatenate([mob.points for mob in mobjects])
+
+        z_values = self.get_z_values(mobjects, points, starts, lengths)
+        if self.is_capturing:
+            self.project_points_in_batch(mobjects, points, starts, lengths)
+            return self.sort_in_mesh_faces(mobjects, z_values)
+        order = np.argsort(z_values, kind="stable")
+        return [mobjects[i] for i in order]
+
+    def sort_in_mesh_faces(self, mobjects, z_values):
+        """
+        Sorts mobjects by z_values, with the faces of each surface
+        mesh sorted in among them as if every face were a mobject of
+        its own.  A surface whose faces end up between other mobjects
+        is listed once for each run of its faces, and those runs are
+        kept in mesh_face_runs for get_mesh_face_order to hand out
+        as the surface gets drawn.
+        """
+        self.mesh_face_runs = dict()
+        # Entry k of the sort is face faces[k] of mobjects[owners[k]],
+        # or all of that mobject when faces[k] is -1
+        counts = np.ones(len(mobjects), dtype=int)
+        face_z_values = dict()
+        for index, mob in enumerate(mobjects):
+            if self.has_depth_sorted_faces(mob):
+                face_z_values[index] = self.get_mesh_face_z_values(mob)
+                counts[index] = len(face_z_values[index])
+        if len(face_z_values) == 0:
+            order = np.argsort(z_values, kind="stable")
+            return [mobjects[i] for i in order]
+        owners = np.repeat(np.arange(len(mobjects)), counts)
+        faces = np.full(len(owners), -1)
+        all_z_values = np.repeat(z_values, counts)
+        starts = np.cumsum(counts) - counts
+        for index, values in face_z_values.items():
+            start = starts[index]
+            faces[start:start + len(values)] = np.arange(len(values))
+            all_z_values[start:start + len(values)] = values
+
+        order = np.argsort(all_z_values, kind="stable")
+        owners = owners[order]
+        faces = faces[order]
+        breaks = np.flatnonzero(owners[1:] != owners[:-1]) + 1
+        result = []
+        runs = dict()
+        for start, end in zip([0, *breaks], [*breaks, len(owners)]):
+            mob = mobjects[owners[start]]
+            result.append(mob)
+            if faces[start] >= 0:
+                runs.setdefault(mob, []).append(faces[start:end].tolist())
+        self.mesh_face_runs = {
+            mob: mob_runs
+            for mob, mob_runs in runs.items()
+            if len(mob_runs) > 1
+        }
+        return result
 
-        def z_key(mob):
-            if not (hasattr(mob, "shade_in_3d") and mob.shade_in_3d):
-                return np.inf
-            # Assign a number to a three dimensional mobjects
-            # based on how close it is to the camera
-            return np.dot(
-                mob.get_z_index_reference_point(),
-                rot_matrix.T
-            )[2]
-        return sorted(mobjects, key=z_key)
+    def get_z_values(self, mobjects, points, starts, lengths):
+        """
+        Assigns a number to each three dimensional mobject based on
+        how close its z index reference point is to the camera, and
+        inf to every other mobject, so sorting by these draws them
+        back to front.
+        """
+        z_values = np.full(len(mobjects), np.inf)
+        indices = [
+            i for i, mob in enumerate(mobjects)
+            if hasattr(mob, "shade_in_3d") and mob.shade_in_3d
+        ]
+        if len(indices) == 0:
+            return z_values
+        reference_points = self.get_z_index_reference_points(
+            [mobjects[i] for i in indices],
+            points, starts[indices], lengths[indices],
+        )
+        z_values[indices] = np.dot(
+            reference_points, self.get_rotation_matrix()[2]
+        )
+        return z_values
+
+    def get_z_index_reference_points(self, mobjects, points, starts, lengths):
+        """
+        mob.get_z_index_reference_point() for each of mobjects, where
+        those which are just the center of the box bounding their own
+        points (or anchors) are found together from the rows of points.
+        """
+        result = np.zeros((len(mobjects), 3))
+        # Number of points per curve for each mobject in the batch,
+        # or 1 when all its points count towards its boundary
+        batch = []
+        batch_nppccs = []
+        for index, mob in enumerate(mobjects):
+            nppcc = get_boundary_points_per_curve(mob)
+            if nppcc is None:
+                result[index] = mob.get_z_index_reference_point()
+            else:
+                batch.append(index)
+                batch_nppccs.append(nppcc)
+        if len(batch) == 0:
+            return result
+
+        # Rows of points holding the boundary of each mobject, with
+        # every handle swapped for the anchor starting its curve
+        starts = starts[batch]
+        lengths = lengths[batch]
+        segment_starts = np.cumsum(lengths) - lengths
+        local_rows = np.arange(lengths.sum()) - np.repeat(segment_starts, lengths)
+        nppccs = np.repeat(batch_nppccs, lengths)
+        offsets = local_rows % nppccs
+        offsets[offsets == nppccs - 1] = 0
+        boundary = points[np.repeat(starts, lengths) + local_rows - offsets]
+        result[batch] = 0.5 * (
+            np.minimum.reduceat(boundary, segment_starts) +
+            np.maximum.reduceat(boundary, segment_starts)
+        )
+        return result
+
+    def project_points_in_batch(self, mobjects, points, starts, lengths):
+        """
+        Projects the points of all mobjects together, and keeps a
+        view into the result for each of them, which
+        transform_points_pre_display hands back instead of projecting
+        them again for the rest of the frame.
+        """
+        self.projected_points = dict()
+        if len(points) == 0:
+            return
+        row_is_finite = np.isfinite(points).all(1)
+        # Mobjects without points are only here when submobjects
+        # weren't included, and don't need their own segment
+        is_finite = np.logical_and.reduceat(
+            row_is_finite, np.minimum(starts, len(points) - 1)
+        ) & (lengths > 0)
+        # Mobjects with invalid points are left to
+        # transform_points_pre_display
+        points[~row_is_finite] = 0
+
+        fixed_in_frame = np.array([
+            mob in self.fixed_in_frame_mobjects for mob in mobjects
+        ])
+        fixed_orientation = np.array([
+            mob in self.fixed_orientation_mobjects for mob in mobjects
+        ])
+        if not fixed_orientation.any():
+            projected = self.project_points(points)
+        else:
+            is_fixed = np.repeat(fixed_orientation, lengths)
+            projected = np.array(points)
+            projected[~is_fixed] = self.project_points(points[~is_fixed])
+            centers = np.array([
+                self.fixed_orientation_mobjects[mob]()
+                for mob, fixed in zip(mobjects, fixed_orientation)
+                if fixed
+            ])
+            shifts = self.project_points(centers) - centers
+            projected[is_fixed] += np.repeat(
+                shifts, lengths[fixed_orientation], axis=0
+            )
+
+        for mob, start, length, keep in zip(
+                mobjects, starts, lengths, is_finite & ~fixed_in_frame):
+            if keep:
+                self.projected_points[mob] = (
+                    mob.points, projected[start:start + length]
+                )
 
     def get_phi(self):
         return self.phi_tracker.get_value()
@@ -162,27 +419,29 @@ class ThreeDCamera(Camera):
         points = points - frame_center
         points = np.dot(points, rot_matrix.T)
         zs = points[:, 2]
-        for i in 0, 1:
-            if self.exponential_projection:
-                # Proper projedtion would involve multiplying
-                # x and y by d / (d-z).  But for points with high
-                # z value that causes weird artifacts, and applying
-                # the exponential helps smooth it out.
-                factor = np.exp(zs / distance)
-                lt0 = zs < 0
-                factor[lt0] = (distance / (distance - zs[lt0]))
-            else:
-                factor = (distance / (distance - zs))
-                factor[(distance - zs) < 0] = 10**6
-                # clip_in_place(factor, 0, 10**6)
-            points[:, i] *= factor
-        points = points + frame_center
+        if self.exponential_projection:
+            # Proper projedtion would involve multiplying
+            # x and y by d / (d-z).  But for points with high
+            # z value that causes weird artifacts, and applying
+            # the exponential helps smooth it out.
+            factor = np.exp(zs / distance)
+            lt0 = zs < 0
+            factor[lt0] = (distance / (distance - zs[lt0]))
+        else:
+            factor = (distance / (distance - zs))
+            factor[(distance - zs) < 0] = 10**6
+            # clip_in_place(factor, 0, 10**6)
+        points[:, :2] *= factor[:, np.newaxis]
+        points += frame_center
         return points
 
     def project_point(self, point):
         return self.project_points(point.reshape((1, 3)))[0, :]
 
     def transform_points_pre_display(self, mobject, points):
+        cached = self.projected_points.get(mobject)
+        if cached is not None and cached[0] is points:
+            return cached[1]
         points = super().transform_points_pre_display(mobject, points)
         fixed_orientation = mobject in self.fixed_orientation_mobjects
         fixed_in_frame = mobject in self.fixed_in_frame_mobjects
@@ -230,3 +489,29 @@ class ThreeDCamera(Camera):
         for mobject in self.extract_mobject_family_members(mobjects):
             if mobject in self.fixed_in_frame_mobjects:
                 self.fixed_in_frame_mobjects.remove(mobject)
+
+
+def get_boundary_points_per_curve(mobject):
+    """
+    When the z index reference point of mobject is the center of the
+    box bounding its own points, returns the number of points per
+    curve whose first and last points make up that boundary (1 when
+    it's all of them), and None otherwise.
+    """
+    cls = type(mobject)
+    if any([
+        cls.get_z_index_reference_point is not Mobject.get_z_index_reference_point,
+        getattr(mobject, "z_index_group", mobject) is not mobject,
+        len(mobject.submobjects) > 0,
+        len(mobject.points) == 0,
+    ]):
+        return None
+    if cls.get_points_defining_boundary is Mobject.get_points_defining_boundary:
+        return 1
+    if cls.get_points_defining_boundary is VMobject.get_points_defining_boundary:
+        nppcc = mobject.n_points_per_cubic_curve
+        if len(mobject.points) == 1:
+            return 1
+        if len(mobject.points) % nppcc == 0:
+            return nppcc
+    return None
@@ -50,11 +50,28 @@ def parse_cli():
             action="store_true",
             help="Render at a high quality",
         ),
+        parser.add_argument(
+            "--also_render_at",
+            action="append",
+            choices=["low", "medium", "high", "production"],
+            help="Also write a movie at this quality, from the same "
+                 "run through the scene.  May be repeated",
+        ),
         parser.add_argument(
             "-g", "--save_pngs",
             action="store_true",
             help="Save each frame as a png",
         ),
+        parser.add_argument(
+            "--frame_sink",
+            action="append",
+            choices=["null", "ring", "raw", "png"],
+            help="Also hand every frame to this sink: null just counts "
+                 "them, ring keeps the last few in memory, raw writes "
+                 "them uncompressed to one memory mapped file, png "
+                 "saves each one.  Unless -w is passed, no movie is "
+                 "written when a sink is given.  May be repeated",
+        ),
         parser.add_argument(
             "-i", "--save_as_gif",
             action="store_true",
@@ -110,6 +127,50 @@ def parse_cli():
             action="store_true",
             help="Leave progress bars displayed in terminal",
         )
+        parser.add_argument(
+            "--use_partial_movie_cache",
+            action="store_true",
+            help="Reuse the partial movie files of earlier renders "
+                 "for animations which have not changed",
+        )
+        parser.add_argument(
+            "--write_frames_in_thread",
+            action="store_true",
+            help="Pipe frames to FFMPEG from a separate thread, "
+                 "so rendering overlaps with encoding",
+        )
+        parser.add_argument(
+            "--defer_encoding",
+            action="store_true",
+            help="Store the frames of each animation uncompressed, and "
+                 "encode them all in parallel at the end of the scene",
+        )
+        parser.add_argument(
+            "--encoding_workers",
+            type=int,
+            help="Number of FFMPEG processes encoding at once "
+                 "with --defer_encoding, cpu count by default",
+        )
+        parser.add_argument(
+            "--keep_raw_frames",
+            action="store_true",
+            help="With --defer_encoding, keep the uncompressed frames, "
+                 "which manimlib/scene/raw_encoding.py can encode again",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes to split the animations "
+                 "of a scene across when writing it to a movie",
+        )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Time the updaters, interpolation, rasterization and "
+                 "frame writing of each animation, and write a report "
+                 "next to the movie",
+        )
         parser.add_argument(
             "--media_dir",
             help="directory to write media",
@@ -155,7 +216,10 @@ def get_configuration(args):
     module = get_module(args.file)
     file_writer_config = {
         # By default, write to file
-        "write_to_movie": args.write_to_movie or not args.save_last_frame,
+        "write_to_movie": args.write_to_movie or not any([
+            args.save_last_frame,
+            args.frame_sink,
+        ]),
         "save_last_frame": args.save_last_frame,
         "save_pngs": args.save_pngs,
         "save_as_gif": args.save_as_gif,
@@ -164,6 +228,12 @@ def get_configuration(args):
         "movie_file_extension": ".mov" if args.transparent else ".mp4",
         "file_name": args.file_name,
         "input_file_path": args.file,
+        "use_partial_movie_cache": args.use_partial_movie_cache,
+        "write_frames_in_thread": args.write_frames_in_thread,
+        "frame_sinks": args.frame_sink or [],
+        "defer_encoding": args.defer_encoding,
+        "encoding_workers": args.encoding_workers,
+        "keep_raw_frames": args.keep_raw_frames,
     }
     if hasattr(module, "OUTPUT_DIRECTORY"):
         file_writer_config["output_directory"] = module.OUTPUT_DIRECTORY
@@ -180,6 +250,8 @@ def get_configuration(args):
         "end_at_animation_number": None,
         "sound": args.sound,
         "leave_progress_bars": args.leave_progress_bars,
+        "workers": args.workers,
+        "profile": args.profile,
         "media_dir": args.media_dir,
         "video_dir": args.video_dir,
         "video_output_dir": args.video_output_dir,
@@ -188,6 +260,10 @@ def get_configuration(args):
 
     # Camera configuration
     config["camera_config"] = get_camera_configuration(args)
+    config["extra_camera_configs"] = [
+        QUALITY_CAMERA_CONFIGS[quality]
+        for quality in args.also_render_at or []
+    ]
 
     # Arguments related to skipping
     stan = config["start_at_animation_number"]
@@ -206,6 +282,14 @@ def get_configuration(args):
     return config
 
 
+QUALITY_CAMERA_CONFIGS = {
+    "low": manimlib.constants.LOW_QUALITY_CAMERA_CONFIG,
+    "medium": manimlib.constants.MEDIUM_QUALITY_CAMERA_CONFIG,
+    "high": manimlib.constants.HIGH_QUALITY_CAMERA_CONFIG,
+    "production": manimlib.constants.PRODUCTION_QUALITY_CAMERA_CONFIG,
+}
+
+
 def get_camera_configuration(args):
     camera_config = {}
     if args.low_quality:
@@ -1,14 +1,19 @@
 import inspect
 import itertools as it
+import multiprocessing as mp
 import os
 import platform
 import subprocess as sp
 import sys
 import traceback
 
+import numpy as np
+
 from manimlib.scene.scene import Scene
+from manimlib.scene.scene_file_writer import SceneFileWriter
 from manimlib.utils.sounds import play_error_sound
 from manimlib.utils.sounds import play_finish_sound
+import manimlib.config
 import manimlib.constants
 
 
@@ -132,6 +137,151 @@ def get_scene_classes_from_module(module):
         ]
 
 
+def should_render_in_parallel(config):
+    file_writer_config = config["file_writer_config"]
+    return all([
+        config["workers"] > 1,
+        file_writer_config["write_to_movie"],
+        not file_writer_config["save_last_frame"],
+        # Frame sinks number frames from the start of their process
+        not file_writer_config["frame_sinks"],
+        not file_writer_config["save_pngs"],
+        # Only the main movie is combined from the workers' files
+        not config["extra_camera_configs"],
+        # Each worker needs to import the scene's module on its own
+        file_writer_config["input_file_path"] != "-",
+    ])
+
+
+def get_animation_ranges(start, end, n_workers):
+    """
+    Splits the animation indices in [start, end) into at most
+    n_workers contiguous ranges of nearly equal length.
+    """
+    n_ranges = max(min(n_workers, end - start), 1)
+    bounds = np.linspace(start, end, n_ranges + 1).astype(int)
+    return [
+        (lo, hi)
+        for lo, hi in zip(bounds[:-1], bounds[1:])
+        if hi > lo
+    ]
+
+
+def init_render_worker(directories):
+    for name, value in directories.items():
+        setattr(manimlib.constants, name, value)
+
+
+def render_animation_range(task):
+    """
+    Renders the partial movie files for the animations
+    in [start, end) of a scene.  Everything before start is
+    played with skip_animations on, which reproduces the state
+    of the scene at that play boundary, and the scene ends
+    early upon reaching end.
+    """
+    input_file_path, scene_name, scene_kwargs, start, end = task
+    module = manimlib.config.get_module(input_file_path)
+    SceneClass = getattr(module, scene_name)
+    kwargs = dict(scene_kwargs)
+    kwargs["file_writer_config"] = dict(
+        scene_kwargs["file_writer_config"],
+        combine_partial_movie_files=False,
+    )
+    kwargs.update({
+        "skip_animations": start > 0,
+        "start_at_animation_number": start,
+        "end_at_animation_number": end,
+        "leave_progress_bars": False,
+    })
+    SceneClass(**kwargs)
+
+
+def render_scene_in_parallel(SceneClass, scene_kwargs, config):
+    """
+    Renders a scene by first running through construct with all
+    animations skipped to count its play-like calls, then handing
+    out ranges of those animations to a pool of processes which
+    each write their own partial movie files.  These are then
+    concatenated as usual.
+    """
+    file_writer_config = scene_kwargs["file_writer_config"]
+    first_pass_kwargs = dict(scene_kwargs)
+    first_pass_kwargs.update({
+        "file_writer_config": dict(
+            file_writer_config,
+            write_to_movie=False,
+            save_last_frame=False,
+        ),
+        "skip_animations": True,
+        "start_at_animation_number": None,
+        "end_at_animation_number": None,
+        "profile": False,
+    })
+    scene = SceneClass(**first_pass_kwargs)
+
+    start = scene_kwargs["start_at_animation_number"] or 0
+    end = scene_kwargs["end_at_animation_number"] or scene.num_plays
+    end = min(end, scene.num_plays)
+    ranges = get_animation_ranges(start, end, config["workers"])
+    # Each worker skips to the start of its range, which only gives
+    # the state a sequential render has there if no play it skips
+    # (that the sequential render wouldn't) steps time based updaters.
+    # Sounds are only kept by the writer of each worker, which
+    # doesn't know where its movie starts in the combined one.
+    last_start = max([start] + [lo for lo, hi in ranges])
+    reason = None
+    if any([
+        start <= n < last_start
+        for n in scene.plays_with_time_based_updaters
+    ]):
+        reason = "time based updaters, which can't be skipped through"
+    elif any([start <= n <= end for n in scene.sound_play_numbers]):
+        reason = "sounds, which can't be split between workers"
+    if reason is not None:
+        print(
+            "{} has {}, so it is rendered without --workers".format(
+                SceneClass.__name__, reason
+            ),
+            file=sys.stderr
+        )
+        return SceneClass(**scene_kwargs).file_writer
+    tasks = [
+        (
+            file_writer_config["input_file_path"],
+            SceneClass.__name__,
+            scene_kwargs,
+            lo, hi,
+        )
+        for lo, hi in ranges
+    ]
+    directories = dict([
+        (name, getattr(manimlib.constants, name))
+        for name in [
+            "MEDIA_DIR",
+            "VIDEO_DIR",
+            "VIDEO_OUTPUT_DIR",
+            "TEX_DIR",
+            "TEXT_DIR",
+        ]
+    ])
+    with mp.Pool(
+        processes=len(tasks) or 1,
+        initializer=init_render_worker,
+        initargs=(directories,),
+    ) as pool:
+        pool.map(render_animation_range, tasks)
+
+    # The first pass scene stands in for the scene which would have
+    # written these files, so the writer finds the same directories
+    # and animation range.
+    scene.start_at_animation_number = scene_kwargs["start_at_animation_number"]
+    scene.end_at_animation_number = scene_kwargs["end_at_animation_number"]
+    file_writer = SceneFileWriter(scene, **file_writer_config)
+    file_writer.combine_movie_files()
+    return file_writer
+
+
 def main(config):
     module = config["module"]
     all_scene_classes = get_scene_classes_from_module(module)
@@ -146,14 +296,22 @@ def main(config):
             "start_at_animation_number",
             "end_at_animation_number",
             "leave_progress_bars",
+            "profile",
+            "extra_camera_configs",
         ]
     ])
 
     for SceneClass in scene_classes_to_render:
         try:
-            # By invoking, this renders the full scene
-            scene = SceneClass(**scene_kwargs)
-            open_file_if_needed(scene.file_writer, **config)
+            if should_render_in_parallel(config):
+                file_writer = render_scene_in_parallel(
+                    SceneClass, scene_kwargs, config
+                )
+            else:
+                # By invoking, this renders the full scene
+                scene = SceneClass(**scene_kwargs)
+                file_writer = scene.file_writer
+            open_file_if_needed(file_writer, **config)
             if config["sound"]:
                 play_finish_sound()
         except Exception:
@@ -7,6 +7,7 @@ from manimlib.mobject.geometry import Arrow
 from manimlib.mobject.geometry import Line
 from manimlib.mobject.number_line import NumberLine
 from manimlib.mobject.svg.tex_mobject import TexMobject
+from manimlib.mobject.types.vectorized_mobject import PackedVGroup
 from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.utils.config_ops import digest_config
 from manimlib.utils.config_ops import merge_dicts_recursively
@@ -281,6 +282,9 @@ class NumberPlane(Axes):
         "y_line_frequency": 1,
         "faded_line_ratio": 1,
         "make_smooth_after_applying_functions": True,
+        # Store the background lines in PackedVGroups, which makes
+        # moving or recoloring dense planes much cheaper
+        "pack_background_lines": False,
     }
 
     def __init__(self, **kwargs):
@@ -323,8 +327,9 @@ class NumberPlane(Axes):
             y_axis, x_axis, y_freq,
             self.faded_line_ratio,
         )
-        lines1 = VGroup(*x_lines1, *y_lines1)
-        lines2 = VGroup(*x_lines2, *y_lines2)
+        group_class = PackedVGroup if self.pack_background_lines else VGroup
+        lines1 = group_class(*x_lines1, *y_lines1)
+        lines2 = group_class(*x_lines2, *y_lines2)
         return lines1, lines2
 
     def get_lines_parallel_to_axis(self, axis1, axis2, freq, ratio):
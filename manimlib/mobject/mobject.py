@@ -5,6 +5,7 @@ import operator as op
 import os
 import random
 import sys
+import weakref
 
 from colour import Color
 import numpy as np
@@ -23,6 +24,51 @@ from manimlib.utils.space_ops import get_norm
 from manimlib.utils.space_ops import rotation_matrix
 
 
+class FamilyCache(object):
+    """
+    Holds a mobject's family once it's been computed, along with
+    the mobjects whose cached families include it, which have to
+    be told when it changes.  Copies of a mobject start over with
+    an empty cache.
+    """
+    __slots__ = ["family", "parents"]
+
+    def __init__(self):
+        self.family = None
+        self.parents = weakref.WeakSet()
+
+    def __reduce__(self):
+        return (FamilyCache, ())
+
+
+class SubmobjectList(list):
+    """
+    The list behind Mobject.submobjects, which lets its mobject
+    know whenever it's modified in place.
+    """
+
+    def __init__(self, mobject, submobjects=()):
+        list.__init__(self, submobjects)
+        self.mobject = mobject
+
+
+def _note_changed_family_after(method):
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.mobject.note_changed_family()
+        return result
+    return wrapper
+
+
+for _name in ["__setitem__", "__delitem__", "__iadd__", "__imul__",
+              "append", "extend", "insert", "pop", "remove",
+              "clear", "sort", "reverse"]:
+    setattr(
+        SubmobjectList, _name,
+        _note_changed_family_after(getattr(list, _name))
+    )
+
+
 # TODO: Explain array_attrs
 
 class Mobject(Container):
@@ -51,6 +97,40 @@ class Mobject(Container):
     def __str__(self):
         return str(self.name)
 
+    @property
+    def submobjects(self):
+        return self.submobject_list
+
+    @submobjects.setter
+    def submobjects(self, submobjects):
+        self.submobject_list = SubmobjectList(self, submobjects)
+        self.note_changed_family()
+
+    def __copy__(self):
+        # The shallow copy needs its own submobjects list and family
+        # cache, or changes to one would go unnoticed by the other
+        result = self.__class__.__new__(self.__class__)
+        result.__dict__.update(self.__dict__)
+        result.family_cache = FamilyCache()
+        if "submobject_list" in self.__dict__:
+            result.submobjects = self.submobjects
+        return result
+
+    def get_family_cache(self):
+        # Subclasses can set submobjects before Mobject.__init__ is called
+        if "family_cache" not in self.__dict__:
+            self.family_cache = FamilyCache()
+        return self.family_cache
+
+    def note_changed_family(self):
+        cache = self.get_family_cache()
+        if cache.family is None:
+            # Nothing cached here, so nothing cached above either
+            return
+        cache.family = None
+        for parent in list(cache.parents):
+            parent.note_changed_family()
+
     def reset_points(self):
         self.points = np.zeros((0, self.dim))
 
@@ -77,6 +157,7 @@ class Mobject(Container):
         for mobject in mobjects:
             if mobject in self.submobjects:
                 self.submobjects.remove(mobject)
+                mobject.get_family_cache().parents.discard(self)
         return self
 
     def get_array_attrs(self):
@@ -925,9 +1006,16 @@ class Mobject(Container):
         return result + self.submobjects
 
     def get_family(self):
-        sub_families = list(map(Mobject.get_family, self.submobjects))
-        all_mobjects = [self] + list(it.chain(*sub_families))
-        return remove_list_redundancies(all_mobjects)
+        # The returned list is cached, so it shouldn't be modified
+        cache = self.get_family_cache()
+        if cache.family is None:
+            sub_families = []
+            for submob in self.submobjects:
+                submob.get_family_cache().parents.add(self)
+                sub_families.append(submob.get_family())
+            all_mobjects = [self] + list(it.chain(*sub_families))
+            cache.family = remove_list_redundancies(all_mobjects)
+        return cache.family
 
     def family_members_with_points(self):
         return [m for m in self.get_family() if m.get_num_points() > 0]
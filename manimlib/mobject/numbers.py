@@ -33,6 +33,7 @@ class DecimalNumber(VMobject):
             else:
                 num_string = num_string[1:]
 
+        SingleStringTexMobject.compile_tex_strings(num_string, **kwargs)
         self.add(*[
             SingleStringTexMobject(char, **kwargs)
             for char in num_string
@@ -1,3 +1,4 @@
+import hashlib
 import itertools as it
 import re
 import string
@@ -6,6 +7,7 @@ import warnings
 from xml.dom import minidom
 
 from manimlib.constants import *
+import manimlib.constants as consts
 from manimlib.mobject.geometry import Circle
 from manimlib.mobject.geometry import Rectangle
 from manimlib.mobject.geometry import RoundedRectangle
@@ -26,6 +28,11 @@ def string_to_numbers(num_string):
     ]
 
 
+# Maps keys from SVGMobject.get_svg_cache_key to the mobjects
+# parsed from that file, which are copied for each new SVGMobject
+SVG_CACHE = {}
+
+
 class SVGMobject(VMobject):
     CONFIG = {
         "should_center": True,
@@ -37,6 +44,10 @@ class SVGMobject(VMobject):
         "stroke_width": DEFAULT_STROKE_WIDTH,
         "fill_opacity": 1.0,
         # "fill_color" : LIGHT_GREY,
+        # Parse each file only once, then copy the resulting mobjects
+        "use_svg_cache": True,
+        # Also save what's parsed to .npz files reused by later runs
+        "use_svg_disk_cache": False,
     }
 
     def __init__(self, file_name=None, **kwargs):
@@ -63,6 +74,74 @@ class SVGMobject(VMobject):
                       self.file_name)
 
     def generate_points(self):
+        if not self.use_svg_cache:
+            return self.parse_svg_file()
+        key = self.get_svg_cache_key()
+        if key not in SVG_CACHE:
+            mobjects = None
+            if self.use_svg_disk_cache:
+                mobjects = self.load_from_svg_disk_cache(key)
+            if mobjects is None:
+                n_before = len(self.submobjects)
+                self.parse_svg_file()
+                mobjects = [m.copy() for m in self.submobjects[n_before:]]
+                SVG_CACHE[key] = mobjects
+                if self.use_svg_disk_cache:
+                    self.save_to_svg_disk_cache(key, mobjects)
+                return
+            SVG_CACHE[key] = mobjects
+        self.add(*[m.copy() for m in SVG_CACHE[key]])
+
+    def get_svg_cache_key(self):
+        with open(self.file_path, "rb") as fp:
+            file_hash = hashlib.sha256(fp.read()).hexdigest()
+        # Subclasses can change how elements become mobjects
+        cls = self.__class__
+        return (file_hash, cls.__module__, cls.__qualname__, self.unpack_groups, self.dim)
+
+    def get_svg_disk_cache_path(self, key):
+        key_hash = hashlib.sha256(repr(key).encode()).hexdigest()[:16]
+        return os.path.join(consts.MEDIA_DIR, "svg_cache", key_hash + ".npz")
+
+    def save_to_svg_disk_cache(self, key, mobjects):
+        # Only plain lists of paths are stored, which covers Tex and Text
+        path_class = type(self.path_string_to_mobject(""))
+        if len(mobjects) == 0 or not all([
+            type(mob) is path_class and len(mob.submobjects) == 0
+            for mob in mobjects
+        ]):
+            return
+        path = self.get_svg_disk_cache_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = "{}.{}.tmp.npz".format(path[:-len(".npz")], os.getpid())
+        np.savez(
+            temp_path,
+            points=np.vstack([mob.points for mob in mobjects]),
+            lengths=np.array([len(mob.points) for mob in mobjects]),
+            path_strings=np.array([mob.path_string for mob in mobjects]),
+        )
+        os.replace(temp_path, path)
+
+    def load_from_svg_disk_cache(self, key):
+        path = self.get_svg_disk_cache_path(key)
+        if not os.path.exists(path):
+            return None
+        with np.load(path, allow_pickle=False) as data:
+            all_points = data["points"]
+            lengths = data["lengths"]
+            path_strings = data["path_strings"]
+        mobjects = []
+        for points, path_string in zip(
+            np.split(all_points, np.cumsum(lengths)[:-1]),
+            path_strings
+        ):
+            mob = self.path_string_to_mobject("")
+            mob.path_string = str(path_string)
+            mob.points = np.array(points)
+            mobjects.append(mob)
+        return mobjects
+
+    def parse_svg_file(self):
         doc = minidom.parse(self.file_path)
         self.ref_to_element = {}
         for svg in doc.getElementsByTagName("svg"):
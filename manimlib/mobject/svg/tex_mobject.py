@@ -9,7 +9,10 @@ from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VectorizedPoint
 from manimlib.utils.config_ops import digest_config
 from manimlib.utils.strings import split_string_list_to_isolate_substrings
+from manimlib.utils.tex_file_writing import compile_tex_expressions
+from manimlib.utils.tex_file_writing import queue_tex_expressions
 from manimlib.utils.tex_file_writing import tex_to_svg_file
+from manimlib.utils.tex_file_writing import tex_to_svg_files
 
 
 TEX_MOB_SCALE_FACTOR = 0.05
@@ -49,6 +52,43 @@ class SingleStringTexMobject(SVGMobject):
         if self.organize_left_to_right:
             self.organize_submobjects_left_to_right()
 
+    @classmethod
+    def prefetch(cls, *tex_strings, **kwargs):
+        """
+        Queues what building cls(*tex_strings, **kwargs) would
+        compile, so it gets compiled in the same latex run as
+        everything else queued, once any tex has to be compiled.
+        """
+        tex_mob = cls.__new__(cls)
+        digest_config(tex_mob, kwargs)
+        for expression, template in tex_mob.get_expressions_to_compile(tex_strings):
+            queue_tex_expressions([expression], template)
+
+    def get_expressions_to_compile(self, tex_strings):
+        """
+        The (expression, template_tex_file_body) pairs compiled
+        when building this mobject from tex_strings.
+        """
+        return [
+            (self.get_modified_expression(tex_string), self.template_tex_file_body)
+            for tex_string in tex_strings
+        ]
+
+    @classmethod
+    def compile_tex_strings(cls, tex_strings, **kwargs):
+        """
+        Compiles all at once each of the tex_strings which would be
+        compiled by building a SingleStringTexMobject with kwargs,
+        so that building these mobjects afterwards doesn't have to
+        call latex for each one.
+        """
+        tex_mob = cls.__new__(cls)
+        digest_config(tex_mob, kwargs)
+        return tex_to_svg_files(
+            [tex_mob.get_modified_expression(s) for s in tex_strings],
+            tex_mob.template_tex_file_body,
+        )
+
     def get_modified_expression(self, tex_string):
         result = self.alignment + " " + tex_string
         result = result.strip()
@@ -142,6 +182,9 @@ class TexMobject(SingleStringTexMobject):
 
     def __init__(self, *tex_strings, **kwargs):
         digest_config(self, kwargs)
+        # The whole expression and each of its parts, which
+        # break_up_by_substrings builds on their own
+        compile_tex_expressions(self.get_expressions_to_compile(tex_strings))
         tex_strings = self.break_up_tex_strings(tex_strings)
         self.tex_strings = tex_strings
         SingleStringTexMobject.__init__(
@@ -153,6 +196,14 @@ class TexMobject(SingleStringTexMobject):
         if self.organize_left_to_right:
             self.organize_submobjects_left_to_right()
 
+    def get_expressions_to_compile(self, tex_strings):
+        tex_strings = self.break_up_tex_strings(tex_strings)
+        sub_tex_mob = SingleStringTexMobject.__new__(SingleStringTexMobject)
+        digest_config(sub_tex_mob, self.get_sub_tex_mobject_config())
+        return SingleStringTexMobject.get_expressions_to_compile(
+            self, [self.arg_separator.join(tex_strings)]
+        ) + sub_tex_mob.get_expressions_to_compile(tex_strings)
+
     def break_up_tex_strings(self, tex_strings):
         substrings_to_isolate = op.add(
             self.substrings_to_isolate,
@@ -175,8 +226,7 @@ class TexMobject(SingleStringTexMobject):
         """
         new_submobjects = []
         curr_index = 0
-        config = dict(self.CONFIG)
-        config["alignment"] = ""
+        config = self.get_sub_tex_mobject_config()
         for tex_string in self.tex_strings:
             sub_tex_mob = SingleStringTexMobject(tex_string, **config)
             num_submobs = len(sub_tex_mob.submobjects)
@@ -195,6 +245,11 @@ class TexMobject(SingleStringTexMobject):
         self.submobjects = new_submobjects
         return self
 
+    def get_sub_tex_mobject_config(self):
+        config = dict(self.CONFIG)
+        config["alignment"] = ""
+        return config
+
     def get_parts_by_tex(self, tex, substring=True, case_sensitive=True):
         def test(tex1, tex2):
             if not case_sensitive:
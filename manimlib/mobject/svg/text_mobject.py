@@ -14,6 +14,10 @@ from manimlib.utils.config_ops import digest_config
 
 TEXT_MOB_SCALE_FACTOR = 0.05
 
+# Maps (char, font, slant, weight, size) to the points of that glyph's
+# outline, drawn from the origin, and how far it advances the pen
+TEXT_GLYPH_CACHE = {}
+
 
 class TextSetting(object):
     def __init__(self, start, end, font, slant, weight, line_num=-1):
@@ -48,6 +52,9 @@ class Text(SVGMobject):
         't2s': {},
         't2w': {},
         'tab_width': 4,
+        # Build text from cached glyph outlines, instead of
+        # writing an svg for each text and parsing it
+        'use_glyph_cache': True,
     }
 
     def __init__(self, text, **config):
@@ -59,8 +66,11 @@ class Text(SVGMobject):
         self.text = text_without_tabs
         self.lsh = self.size if self.lsh == -1 else self.lsh
 
-        file_name = self.text2svg()
-        self.remove_last_M(file_name)
+        if self.use_glyph_cache:
+            file_name = None
+        else:
+            file_name = self.text2svg()
+            self.remove_last_M(file_name)
         SVGMobject.__init__(self, file_name, **config)
         self.apply_front_and_end_spaces()
         self.text = text
@@ -91,7 +101,91 @@ class Text(SVGMobject):
         if self.height is None and self.width is None:
             self.scale(TEXT_MOB_SCALE_FACTOR)
 
+    def ensure_valid_file(self):
+        if self.use_glyph_cache:
+            # There's no file to read points from
+            return
+        SVGMobject.ensure_valid_file(self)
+
+    def generate_points(self):
+        if not self.use_glyph_cache:
+            return SVGMobject.generate_points(self)
+        size = self.size * 10
+        lsh = self.lsh * 10
+
+        if self.font == '':
+            if NOT_SETTING_FONT_MSG != '':
+                print(NOT_SETTING_FONT_MSG)
+
+        # Lay out glyphs just as text2svg has cairo lay them out
+        glyphs = []
+        offset_x = 0
+        last_line_num = 0
+        for setting in self.text2settings():
+            text = self.text[setting.start:setting.end].replace('\n', ' ')
+            if setting.line_num != last_line_num:
+                offset_x = 0
+                last_line_num = setting.line_num
+            y = START_Y + lsh * setting.line_num
+            for char in text:
+                points, x_advance = self.get_glyph(
+                    char, setting.font, setting.slant, setting.weight, size
+                )
+                if len(points) > 0:
+                    glyph = self.path_string_to_mobject("")
+                    # Flipped, as svg y-coordinates point down
+                    glyph.points = points + np.array([START_X + offset_x, -y, 0])
+                    glyphs.append(glyph)
+                offset_x += x_advance
+        self.add(*glyphs)
+
+    def get_glyph(self, char, font, slant, weight, size):
+        key = (char, font, slant, weight, size)
+        if key not in TEXT_GLYPH_CACHE:
+            surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 1, 1)
+            context = cairo.Context(surface)
+            context.set_font_size(size)
+            context.select_font_face(font, self.str2slant(slant), self.str2weight(weight))
+            context.move_to(0, 0)
+            context.text_path(char)
+            glyph = self.path_string_to_mobject("")
+            self.add_cairo_path_to_glyph(context.copy_path(), glyph)
+            # people treat y-coordinate differently
+            glyph.rotate(np.pi, RIGHT, about_point=ORIGIN)
+            TEXT_GLYPH_CACHE[key] = (glyph.points, context.text_extents(char)[4])
+        points, x_advance = TEXT_GLYPH_CACHE[key]
+        return np.array(points), x_advance
+
+    def add_cairo_path_to_glyph(self, path, glyph):
+        elements = list(path)
+        for index, (kind, coords) in enumerate(elements):
+            points = np.array(coords).reshape((-1, 2))
+            points = np.hstack([points, np.zeros((len(points), 1))])
+            if kind == cairo.PathDataType.MOVE_TO:
+                # Cairo moves back to the start of each closed subpath,
+                # which shouldn't start a new path (c.f. remove_last_M)
+                next_kind = elements[index + 1][0] if index + 1 < len(elements) else None
+                if next_kind in [cairo.PathDataType.LINE_TO, cairo.PathDataType.CURVE_TO]:
+                    glyph.start_new_path(points[0])
+            elif kind == cairo.PathDataType.LINE_TO:
+                glyph.add_line_to(points[0])
+            elif kind == cairo.PathDataType.CURVE_TO:
+                glyph.add_cubic_bezier_curve_to(*points)
+        return glyph
+
     def get_space_width(self):
+        if self.use_glyph_cache:
+            points = self.get_glyph(
+                "_", self.font, self.slant, self.weight, self.size * 10
+            )[0]
+            width, height = np.ptp(points[:, :2], axis=0)
+            # Mimic how SVGMobject would have resized it
+            if self.height is not None:
+                width *= self.height / height
+            if self.width is not None:
+                width = self.width
+            return width
+
         size = self.size * 10
 
         dir_name = consts.TEXT_DIR
@@ -18,7 +18,11 @@ def get_3d_vmob_start_corner_index(vmob):
 
 
 def get_3d_vmob_end_corner_index(vmob):
-    return ((len(vmob.points) - 1) // 6) * 3
+    return get_3d_end_corner_index(len(vmob.points))
+
+
+def get_3d_end_corner_index(n_points):
+    return ((n_points - 1) // 6) * 3
 
 
 def get_3d_vmob_start_corner(vmob):
@@ -59,3 +63,25 @@ def get_3d_vmob_end_corner_unit_normal(vmob):
     return get_3d_vmob_unit_normal(
         vmob, get_3d_vmob_end_corner_index(vmob)
     )
+
+
+def get_3d_unit_normals(points_array, point_index):
+    """
+    get_3d_vmob_unit_normal for many vmobjects with the same
+    number of points at once, where points_array has shape
+    (n_vmobjects, n_points, 3).
+    """
+    n_points = points_array.shape[1]
+    i = point_index
+    im3 = i - 3 if i > 2 else (n_points - 4)
+    ip3 = i + 3 if i < (n_points - 3) else 3
+    corners = points_array[:, i]
+    normals = np.cross(
+        points_array[:, ip3] - corners,
+        points_array[:, im3] - corners,
+    )
+    norms = np.linalg.norm(normals, axis=1)
+    result = np.repeat([UP], len(normals), axis=0).astype(float)
+    nonzero = norms > 0
+    result[nonzero] = normals[nonzero] / norms[nonzero, np.newaxis]
+    return result
@@ -2,6 +2,11 @@ from manimlib.constants import *
 from manimlib.mobject.geometry import Square
 from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.bezier import integer_interpolate
+from manimlib.utils.bezier import interpolate
+from manimlib.utils.bezier import partial_bezier_points_array
+from manimlib.utils.color import color_gradient
+from manimlib.utils.color import color_to_rgb
 from manimlib.utils.iterables import tuplify
 from manimlib.utils.space_ops import z_to_vector
 
@@ -15,6 +20,20 @@ class ThreeDVMobject(VMobject):
 
 
 class ParametricSurface(VGroup):
+    """
+    A surface made of one ThreeDVMobject face per cell of a grid in
+    uv space.
+
+    The faces start out as a mesh: their points are stored one after
+    another in the surface's own points, as an array of shape
+    (n_faces * points_per_face, 3), with their fill and stroke colors
+    in face_fill_rgbas and face_stroke_rgbas.  Moving, coloring,
+    creating and transforming the surface then works on whole arrays,
+    and cameras draw the mesh directly.  The faces only become
+    submobjects of their own once something asks for them, e.g. by
+    indexing or iterating over the surface, after which it's an
+    ordinary VGroup.
+    """
     CONFIG = {
         "u_min": 0,
         "u_max": 1,
@@ -29,13 +48,16 @@ class ParametricSurface(VGroup):
         "stroke_width": 0.5,
         "should_make_jagged": False,
         "pre_function_handle_to_anchor_scale_factor": 0.00001,
+        "shade_in_3d": True,
     }
+    FACE_RGBA_NAMES = ["face_fill_rgbas", "face_stroke_rgbas"]
 
     def __init__(self, func, **kwargs):
         VGroup.__init__(self, **kwargs)
         self.func = func
+        self.mesh_shape = None
         self.setup_in_uv_space()
-        self.apply_function(lambda p: func(p[0], p[1]))
+        self.apply_function_over_uv_space(func)
         if self.should_make_jagged:
             self.make_jagged()
 
@@ -57,44 +79,326 @@ class ParametricSurface(VGroup):
 
     def setup_in_uv_space(self):
         u_values, v_values = self.get_u_values_and_v_values()
-        faces = VGroup()
-        for i in range(len(u_values) - 1):
-            for j in range(len(v_values) - 1):
-                u1, u2 = u_values[i:i + 2]
-                v1, v2 = v_values[j:j + 2]
-                face = ThreeDVMobject()
-                face.set_points_as_corners([
-                    [u1, v1, 0],
-                    [u2, v1, 0],
-                    [u2, v2, 0],
-                    [u1, v2, 0],
-                    [u1, v1, 0],
-                ])
-                faces.add(face)
-                face.u_index = i
-                face.v_index = j
-                face.u1 = u1
-                face.u2 = u2
-                face.v1 = v1
-                face.v2 = v2
-        faces.set_fill(
+        # Faces are ordered by u index, then v index
+        u1, v1 = np.meshgrid(u_values[:-1], v_values[:-1], indexing="ij")
+        u2, v2 = np.meshgrid(u_values[1:], v_values[1:], indexing="ij")
+        corners = np.array([
+            [u1, v1], [u2, v1], [u2, v2], [u1, v2], [u1, v1],
+        ]).reshape((5, 2, -1)).transpose((2, 0, 1))
+        n_faces = len(corners)
+        # As in set_points_as_corners, with each edge a cubic curve
+        # whose handles are a third of the way along it
+        nppcc = self.n_points_per_cubic_curve
+        points = np.zeros((n_faces, 4, nppcc, self.dim))
+        for index, alpha in enumerate(np.linspace(0, 1, nppcc)):
+            points[:, :, index, :2] = interpolate(
+                corners[:, :-1], corners[:, 1:], alpha
+            )
+        self.points = points.reshape((-1, self.dim))
+        self.mesh_shape = (n_faces, 4 * nppcc)
+
+        self.u_indices, self.v_indices = [
+            indices.flatten() for indices in np.meshgrid(
+                np.arange(len(u_values) - 1),
+                np.arange(len(v_values) - 1),
+                indexing="ij",
+            )
+        ]
+        self.face_fill_rgbas = np.zeros((n_faces, 4))
+        self.face_stroke_rgbas = np.zeros((n_faces, 4))
+        self.set_fill(
             color=self.fill_color,
             opacity=self.fill_opacity
         )
-        faces.set_stroke(
+        self.set_stroke(
             color=self.stroke_color,
             width=self.stroke_width,
             opacity=self.stroke_opacity,
         )
-        self.add(*faces)
         if self.checkerboard_colors:
             self.set_fill_by_checkerboard(*self.checkerboard_colors)
 
+    def apply_function_over_uv_space(self, func):
+        """
+        Replaces each point (u, v, 0) with func(u, v), calling func
+        on whole arrays of u and v values when it works with those.
+        As in VMobject.apply_function, handles are pulled in to their
+        anchors first, so that they end up along the tangents.
+        """
+        factor = self.pre_function_handle_to_anchor_scale_factor
+        self.scale_handle_to_anchor_distances(factor)
+        us, vs = self.points[:, 0], self.points[:, 1]
+        try:
+            values = np.array(func(us, vs), dtype=float)
+        except Exception:
+            # Not written for arrays, e.g. using math.sin
+            values = None
+        if values is not None and values.shape == (self.dim, len(us)):
+            self.points = values.T
+        else:
+            # Corners and edges are shared between faces,
+            # so only evaluate func once at each
+            uvs, inverse = np.unique(
+                self.points[:, :2], axis=0, return_inverse=True
+            )
+            values = np.array([func(u, v) for u, v in uvs], dtype=float)
+            self.points = values[inverse.flatten()]
+        self.scale_handle_to_anchor_distances(1. / factor)
+        return self
+
     def set_fill_by_checkerboard(self, *colors, opacity=None):
         n_colors = len(colors)
+        if self.has_mesh():
+            c_indices = (self.u_indices + self.v_indices) % n_colors
+            rgbs = np.array(list(map(color_to_rgb, colors)))
+            self.face_fill_rgbas[:, :3] = rgbs[c_indices]
+            if opacity is not None:
+                self.face_fill_rgbas[:, 3] = opacity
+            return self
         for face in self:
             c_index = (face.u_index + face.v_index) % n_colors
             face.set_fill(colors[c_index], opacity=opacity)
+        return self
+
+    def set_submobject_colors_by_gradient(self, *colors):
+        if len(colors) < 2 or not self.has_only_mesh():
+            self.unpack_mesh()
+            return VGroup.set_submobject_colors_by_gradient(self, *colors)
+        rgbs = np.array(list(map(
+            color_to_rgb, color_gradient(colors, self.mesh_shape[0])
+        )))
+        self.set_face_rgbs(rgbs)
+        return self
+
+    def set_submobject_colors_by_radial_gradient(self, center=None, radius=1,
+                                                 inner_color=WHITE, outer_color=BLACK):
+        if not self.has_only_mesh():
+            self.unpack_mesh()
+            return VGroup.set_submobject_colors_by_radial_gradient(
+                self, center, radius, inner_color, outer_color
+            )
+        if center is None:
+            center = self.get_center()
+        ts = np.linalg.norm(self.get_face_centers() - center, axis=1) / radius
+        ts = np.minimum(ts, 1)
+        rgbs = interpolate(
+            color_to_rgb(inner_color), color_to_rgb(outer_color),
+            ts[:, np.newaxis],
+        )
+        self.set_face_rgbs(rgbs)
+        return self
+
+    # Mesh
+
+    def has_mesh(self):
+        if self.__dict__.get("mesh_shape") is None:
+            return False
+        return len(self.points) == self.mesh_shape[0] * self.mesh_shape[1]
+
+    def get_mesh_shape(self):
+        return self.mesh_shape
+
+    def get_face_points(self):
+        """
+        The points of the mesh as an array of shape
+        (n_faces, points_per_face, 3).
+        """
+        return self.points.reshape((*self.mesh_shape, self.dim))
+
+    def get_face_centers(self):
+        # As get_center for each face, from the box bounding its anchors
+        nppcc = self.n_points_per_cubic_curve
+        face_points = self.get_face_points()
+        anchors = np.concatenate([
+            face_points[:, 0::nppcc], face_points[:, nppcc - 1::nppcc]
+        ], axis=1)
+        return 0.5 * (anchors.min(1) + anchors.max(1))
+
+    def has_only_mesh(self):
+        # Whether the faces are all there is to color
+        return self.has_mesh() and \
+            len(self.family_members_with_points()) == 1
+
+    def set_face_rgbs(self, rgbs):
+        # Fill and stroke, as set_color does for each face
+        for name in self.FACE_RGBA_NAMES:
+            getattr(self, name)[:, :3] = rgbs
+        return self
+
+    def get_face_rgbas(self, kind="fill"):
+        """
+        One rgba for each face of the mesh, where kind is
+        "fill", "stroke" or "background_stroke".
+        """
+        if kind == "background_stroke":
+            rgba = self.get_stroke_rgbas(background=True)[:1]
+            return rgba.repeat(self.mesh_shape[0], axis=0)
+        return getattr(self, "face_{}_rgbas".format(kind))
+
+    def has_mesh_like(self, mobject):
+        return all([
+            self.has_mesh(),
+            isinstance(mobject, ParametricSurface),
+            mobject.has_mesh(),
+            mobject.__dict__.get("mesh_shape") == self.mesh_shape,
+        ])
+
+    def unpack_mesh(self):
+        """
+        Turns the mesh into ThreeDVMobject faces, added as
+        submobjects ahead of any others.
+        """
+        if self.__dict__.get("mesh_shape") is None:
+            return self
+        faces = []
+        if self.has_mesh():
+            for index, face_points in enumerate(self.get_face_points()):
+                face = ThreeDVMobject(shade_in_3d=self.shade_in_3d)
+                face.points = np.array(face_points)
+                face.fill_rgbas = np.array(self.face_fill_rgbas[index:index + 1])
+                face.stroke_rgbas = np.array(self.face_stroke_rgbas[index:index + 1])
+                face.background_stroke_rgbas = np.array(self.background_stroke_rgbas)
+                face.stroke_width = self.stroke_width
+                face.background_stroke_width = self.background_stroke_width
+                if "z_index_group" in self.__dict__:
+                    face.z_index_group = self.z_index_group
+                faces.append(face)
+            self.set_face_uv_attributes(faces)
+            self.clear_points()
+        # Otherwise something changed the number of points, and they
+        # no longer split into faces, so they're left to self
+        self.mesh_shape = None
+        for name in self.FACE_RGBA_NAMES:
+            delattr(self, name)
+        self.submobjects = faces + list(self.submobjects)
+        return self
+
+    def set_face_uv_attributes(self, faces):
+        u_values, v_values = self.get_u_values_and_v_values()
+        for face, i, j in zip(faces, self.u_indices, self.v_indices):
+            face.u_index = i
+            face.v_index = j
+            face.u1, face.u2 = u_values[i:i + 2]
+            face.v1, face.v2 = v_values[j:j + 2]
+
+    def update_face_rgbas(self, array_name, color=None, opacity=None):
+        if not self.has_mesh():
+            return
+        colors = tuplify(color) if color is not None else ()
+        opacities = tuplify(opacity) if opacity is not None else ()
+        if len(colors) > 1 or len(opacities) > 1:
+            # Each face would get its own gradient
+            self.unpack_mesh()
+            return
+        rgbas = getattr(self, array_name)
+        if len(colors) == 1:
+            rgbas[:, :3] = color_to_rgb(colors[0])
+        if len(opacities) == 1:
+            rgbas[:, 3] = opacities[0]
+
+    # Overrides which keep the mesh as it is, or unpack it
+    # where it can't be kept
+
+    def split(self):
+        self.unpack_mesh()
+        return VGroup.split(self)
+
+    # The faces of a mesh are the surface's own points, so these
+    # apply to them whether or not family is set
+
+    def set_fill(self, color=None, opacity=None, family=True):
+        self.update_face_rgbas("face_fill_rgbas", color, opacity)
+        return VGroup.set_fill(self, color, opacity, family)
+
+    def set_stroke(self, color=None, width=None, opacity=None,
+                   background=False, family=True):
+        if not background:
+            self.update_face_rgbas("face_stroke_rgbas", color, opacity)
+        return VGroup.set_stroke(
+            self, color, width, opacity, background, family
+        )
+
+    def set_sheen(self, factor, direction=None, family=True):
+        # A mesh has one color per face, leaving no room for the
+        # second, lighter one which sheen adds
+        if factor != 0:
+            self.unpack_mesh()
+        return VGroup.set_sheen(self, factor, direction, family)
+
+    def fade(self, darkness=0.5, family=True):
+        if not self.has_mesh():
+            return VGroup.fade(self, darkness, family)
+        # Each face fades from its own opacity, rather
+        # than from that of the surface
+        opacities = [
+            (1.0 - darkness) * getattr(self, name)[:, 3]
+            for name in self.FACE_RGBA_NAMES
+        ]
+        VGroup.fade(self, darkness, family)
+        for name, face_opacities in zip(self.FACE_RGBA_NAMES, opacities):
+            getattr(self, name)[:, 3] = face_opacities
+        return self
+
+    def change_anchor_mode(self, mode):
+        if not (self.has_mesh() and mode == "jagged"):
+            self.unpack_mesh()
+            return VGroup.change_anchor_mode(self, mode)
+        nppcc = self.n_points_per_cubic_curve
+        curves = self.points.reshape((-1, nppcc, self.dim))
+        anchors1, anchors2 = curves[:, 0], curves[:, -1]
+        for index, alpha in enumerate(np.linspace(0, 1, nppcc)):
+            curves[:, index] = interpolate(anchors1, anchors2, alpha)
+        return self
+
+    def align_data(self, mobject):
+        if self.has_mesh_like(mobject):
+            return
+        self.unpack_mesh()
+        if isinstance(mobject, ParametricSurface):
+            mobject.unpack_mesh()
+        VGroup.align_data(self, mobject)
+
+    def interpolate_color(self, mobject1, mobject2, alpha):
+        VGroup.interpolate_color(self, mobject1, mobject2, alpha)
+        if self.has_mesh_like(mobject1) and self.has_mesh_like(mobject2):
+            for name in self.FACE_RGBA_NAMES:
+                setattr(self, name, interpolate(
+                    getattr(mobject1, name), getattr(mobject2, name), alpha
+                ))
+
+    def pointwise_become_partial(self, vmobject, a, b):
+        if not self.has_mesh_like(vmobject):
+            return VGroup.pointwise_become_partial(self, vmobject, a, b)
+        # Each face becomes the same part of its own boundary, with
+        # the curves it no longer needs collapsed onto its end point
+        # so that every face keeps the same number of points
+        nppcc = self.n_points_per_cubic_curve
+        n_faces, n_face_points = self.mesh_shape
+        n_curves = n_face_points // nppcc
+        curves = vmobject.points.reshape((n_faces, n_curves, nppcc, self.dim))
+        if a <= 0 and b >= 1:
+            self.points = np.array(vmobject.points)
+            return self
+        lower_index, lower_residue = integer_interpolate(0, n_curves, a)
+        upper_index, upper_residue = integer_interpolate(0, n_curves, b)
+        new_curves = np.array(curves[:, lower_index:upper_index + 1])
+        if lower_index == upper_index:
+            new_curves[:, 0] = partial_bezier_points_array(
+                curves[:, lower_index], lower_residue, upper_residue
+            )
+        else:
+            new_curves[:, 0] = partial_bezier_points_array(
+                curves[:, lower_index], lower_residue, 1
+            )
+            new_curves[:, -1] = partial_bezier_points_array(
+                curves[:, upper_index], 0, upper_residue
+            )
+        face_points = new_curves.reshape((n_faces, -1, self.dim))
+        padding = np.repeat(
+            face_points[:, -1:], n_face_points - face_points.shape[1], axis=1
+        )
+        self.points = np.hstack([face_points, padding]).reshape((-1, self.dim))
+        return self
 
 
 # Specific shapes
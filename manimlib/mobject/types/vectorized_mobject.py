@@ -1,4 +1,6 @@
+from functools import reduce
 import itertools as it
+import operator as op
 import sys
 
 from colour import Color
@@ -10,7 +12,7 @@ from manimlib.utils.bezier import bezier
 from manimlib.utils.bezier import get_smooth_handle_points
 from manimlib.utils.bezier import interpolate
 from manimlib.utils.bezier import integer_interpolate
-from manimlib.utils.bezier import partial_bezier_points
+from manimlib.utils.bezier import partial_bezier_points_array
 from manimlib.utils.color import color_to_rgba
 from manimlib.utils.iterables import make_even
 from manimlib.utils.iterables import stretch_array_to_length
@@ -612,7 +614,11 @@ class VMobject(Mobject):
 
     # Information about line
     def get_cubic_bezier_tuples_from_points(self, points):
-        return np.array(list(self.gen_cubic_bezier_tuples_from_points(points)))
+        nppcc = VMobject.CONFIG["n_points_per_cubic_curve"]
+        points = np.array(points)
+        remainder = len(points) % nppcc
+        points = points[:len(points) - remainder]
+        return points.reshape((len(points) // nppcc, nppcc) + points.shape[1:])
 
     def gen_cubic_bezier_tuples_from_points(self, points):
         """
@@ -659,6 +665,35 @@ class VMobject(Mobject):
                     points[n - 1], points[n]
                 ))
 
+    def get_subpath_bounds_2d(self, points):
+        """
+        Array version of gen_subpaths_from_points_2d, used when
+        drawing.  Returns the start and end index into points of
+        each subpath (trimmed to a whole number of cubic curves),
+        and whether each subpath is closed.
+        """
+        nppcc = self.n_points_per_cubic_curve
+        rtol = 1.e-5  # default from np.isclose()
+        atol = self.tolerance_for_point_equality
+
+        def are_equal_2d(p0, p1):
+            return np.all(
+                np.abs(p0[:, :2] - p1[:, :2]) <= atol + rtol * np.abs(p1[:, :2]),
+                axis=1,
+            )
+        n_points = len(points)
+        indices = np.arange(nppcc, n_points, nppcc)
+        is_split = ~are_equal_2d(points[indices - 1], points[indices])
+        split_indices = np.concatenate([[0], indices[is_split], [n_points]])
+        starts = split_indices[:-1]
+        ends = split_indices[1:]
+        long_enough = (ends - starts) >= nppcc
+        starts = starts[long_enough]
+        ends = ends[long_enough]
+        closed = are_equal_2d(points[starts], points[ends - 1])
+        ends = starts + nppcc * ((ends - starts) // nppcc)
+        return starts, ends, closed
+
     def get_subpaths(self):
         return self.get_subpaths_from_points(self.get_points())
 
@@ -790,6 +825,8 @@ class VMobject(Mobject):
             return np.repeat(points, nppcc * n, 0)
         bezier_quads = self.get_cubic_bezier_tuples_from_points(points)
         curr_num = len(bezier_quads)
+        if curr_num == 0:
+            return np.zeros((0, self.dim))
         target_num = curr_num + n
         # This is an array with values ranging from 0
         # up to curr_num,  with repeats such that
@@ -802,22 +839,19 @@ class VMobject(Mobject):
         # that the nth curve of our path should be split
         # into k pieces.  In the above example, this would
         # be [2, 1, 2, 1, 2, 1, 2, 1, 2, 1]
-        split_factors = [
-            sum(repeat_indices == i)
-            for i in range(curr_num)
-        ]
-        new_points = np.zeros((0, self.dim))
-        for quad, sf in zip(bezier_quads, split_factors):
-            # What was once a single cubic curve defined
-            # by "quad" will now be broken into sf
-            # smaller cubic curves
-            alphas = np.linspace(0, 1, sf + 1)
-            for a1, a2 in zip(alphas, alphas[1:]):
-                new_points = np.append(
-                    new_points,
-                    partial_bezier_points(quad, a1, a2),
-                    axis=0
-                )
+        split_factors = np.bincount(repeat_indices, minlength=curr_num)
+        # Which of the sf pieces of its curve each new curve is
+        piece_indices = np.arange(target_num) - \
+            (np.cumsum(split_factors) - split_factors)[repeat_indices]
+        piece_counts = split_factors[repeat_indices]
+        # What was once a single cubic curve defined by a
+        # quad will now be broken into sf smaller cubic curves,
+        # all of which are computed at once
+        new_points = partial_bezier_points_array(
+            bezier_quads[repeat_indices],
+            piece_indices / piece_counts,
+            (piece_indices + 1) / piece_counts,
+        ).reshape((-1, self.dim))
         return new_points
 
     def align_rgbas(self, vmobject):
@@ -861,42 +895,70 @@ class VMobject(Mobject):
 
     def pointwise_become_partial(self, vmobject, a, b):
         assert(isinstance(vmobject, VMobject))
-        # Partial curve includes three portions:
-        # - A middle section, which matches the curve exactly
-        # - A start, which is some ending portion of an inner cubic
-        # - An end, which is the starting portion of a later inner cubic
+        batch_pointwise_become_partial([self], [vmobject], [(a, b)])
+        return self
+
+    def get_subcurve(self, a, b):
+        vmob = self.copy()
+        vmob.pointwise_become_partial(self, a, b)
+        return vmob
+
+
+def batch_pointwise_become_partial(vmobjects, start_vmobjects, bounds,
+                                   bezier_quads_list=None):
+    """
+    Does vmobject.pointwise_become_partial(start, a, b) for each vmobject,
+    start and (a, b) from the lists passed in, computing the partial
+    curves at the ends of all of them in one go.  The cubic bezier tuples
+    of the start vmobjects can be passed in if they're already known.
+    """
+    # Partial curve includes three portions:
+    # - A middle section, which matches the curve exactly
+    # - A start, which is some ending portion of an inner cubic
+    # - An end, which is the starting portion of a later inner cubic
+    plans = []
+    partial_quads = []
+    lower_alphas = []
+    upper_alphas = []
+    for i, (vmobject, start, (a, b)) in enumerate(zip(vmobjects, start_vmobjects, bounds)):
         if a <= 0 and b >= 1:
-            self.set_points(vmobject.points)
-            return self
-        bezier_quads = vmobject.get_cubic_bezier_tuples()
+            vmobject.set_points(start.points)
+            continue
+        if bezier_quads_list is None:
+            bezier_quads = start.get_cubic_bezier_tuples()
+        else:
+            bezier_quads = bezier_quads_list[i]
         num_cubics = len(bezier_quads)
+        if num_cubics == 0:
+            vmobject.clear_points()
+            continue
 
         lower_index, lower_residue = integer_interpolate(0, num_cubics, a)
         upper_index, upper_residue = integer_interpolate(0, num_cubics, b)
-
-        self.clear_points()
-        if num_cubics == 0:
-            return self
+        plans.append((vmobject, bezier_quads, lower_index, upper_index, len(partial_quads)))
         if lower_index == upper_index:
-            self.append_points(partial_bezier_points(
-                bezier_quads[lower_index],
-                lower_residue, upper_residue
-            ))
+            partial_quads.append(bezier_quads[lower_index])
+            lower_alphas.append(lower_residue)
+            upper_alphas.append(upper_residue)
         else:
-            self.append_points(partial_bezier_points(
-                bezier_quads[lower_index], lower_residue, 1
-            ))
-            for quad in bezier_quads[lower_index + 1:upper_index]:
-                self.append_points(quad)
-            self.append_points(partial_bezier_points(
-                bezier_quads[upper_index], 0, upper_residue
-            ))
-        return self
-
-    def get_subcurve(self, a, b):
-        vmob = self.copy()
-        vmob.pointwise_become_partial(self, a, b)
-        return vmob
+            partial_quads += [bezier_quads[lower_index], bezier_quads[upper_index]]
+            lower_alphas += [lower_residue, 0]
+            upper_alphas += [1, upper_residue]
+    if len(plans) == 0:
+        return
+    partials = partial_bezier_points_array(
+        partial_quads, lower_alphas, upper_alphas
+    )
+    for vmobject, bezier_quads, lower_index, upper_index, index in plans:
+        if lower_index == upper_index:
+            vmobject.points = partials[index]
+        else:
+            dim = bezier_quads.shape[-1]
+            vmobject.points = np.vstack([
+                partials[index],
+                bezier_quads[lower_index + 1:upper_index].reshape((-1, dim)),
+                partials[index + 1],
+            ])
 
 
 class VGroup(VMobject):
@@ -907,6 +969,164 @@ class VGroup(VMobject):
         self.add(*vmobjects)
 
 
+class PackedVGroup(VGroup):
+    """
+    A VGroup meant for large numbers of similar pieces, like the
+    cells of a grid or the lines of a NumberPlane.
+
+    The points and rgbas of every member of the family are stored
+    in a few contiguous arrays, and each member's points, fill_rgbas,
+    stroke_rgbas and background_stroke_rgbas are views into them.
+    Shifting, scaling, rotating or recoloring the whole group then
+    takes a single numpy operation instead of one per submobject.
+
+    Members stay ordinary VMobjects.  Anything that replaces one of
+    their arrays outright (adding points, animating a single member,
+    copying...) just detaches it, and the group is repacked the next
+    time it's changed as a whole.
+    """
+    PACKED_ARRAY_NAMES = [
+        "points",
+        "fill_rgbas",
+        "stroke_rgbas",
+        "background_stroke_rgbas",
+    ]
+
+    def __init__(self, *vmobjects, **kwargs):
+        VGroup.__init__(self, *vmobjects, **kwargs)
+        self.pack()
+
+    def pack(self):
+        members = list(self.get_family())
+        self.packed_members = members
+        self.packed_arrays = dict()
+        self.packed_views = dict()
+        self.packed_lengths = dict()
+        for name in self.PACKED_ARRAY_NAMES:
+            arrays = [getattr(mob, name) for mob in members]
+            lengths = np.array([len(array) for array in arrays], dtype=int)
+            packed = np.vstack(arrays).astype('float')
+            ends = np.cumsum(lengths)
+            views = []
+            for mob, start, end in zip(members, ends - lengths, ends):
+                view = packed[start:end]
+                setattr(mob, name, view)
+                views.append(view)
+            self.packed_arrays[name] = packed
+            self.packed_views[name] = views
+            self.packed_lengths[name] = lengths
+        return self
+
+    def is_packed(self):
+        if not hasattr(self, "packed_members"):
+            return False
+        family = self.get_family()
+        members = self.packed_members
+        if len(family) != len(members):
+            return False
+        if not all(m1 is m2 for m1, m2 in zip(family, members)):
+            return False
+        for name, views in self.packed_views.items():
+            packed = self.packed_arrays[name]
+            for mob, view in zip(members, views):
+                # A deepcopy keeps views shared, but not their base
+                if getattr(mob, name) is not view or view.base is not packed:
+                    return False
+        return True
+
+    def ensure_packed(self):
+        if not self.is_packed():
+            self.pack()
+        return self
+
+    def get_packed_array(self, name):
+        self.ensure_packed()
+        return self.packed_arrays[name]
+
+    # Point functions
+
+    def shift(self, *vectors):
+        total_vector = reduce(op.add, vectors)
+        self.get_packed_array("points")[:] += total_vector
+        return self
+
+    def apply_points_function_about_point(self, func, about_point=None, about_edge=None):
+        if about_point is None:
+            if about_edge is None:
+                about_edge = ORIGIN
+            about_point = self.get_critical_point(about_edge)
+        points = self.get_packed_array("points")
+        if len(points) == 0:
+            return self
+        points -= about_point
+        points[:] = func(points)
+        points += about_point
+        return self
+
+    def get_all_points(self):
+        return np.array(self.get_packed_array("points"))
+
+    def get_points_defining_boundary(self):
+        points = self.get_packed_array("points")
+        nppcc = self.n_points_per_cubic_curve
+        if (self.packed_lengths["points"] % nppcc).any():
+            return VGroup.get_points_defining_boundary(self)
+        # Every member's curves line up with those of the packed
+        # array, so its anchors are just the packed array's anchors
+        return np.vstack([points[0::nppcc], points[nppcc - 1::nppcc]])
+
+    # Colors
+
+    def update_packed_rgbas(self, array_name, color=None, opacity=None):
+        """
+        Does what update_rgbas_array would do for each member in
+        one go, and returns False when that isn't possible, i.e.
+        when members have differing sheen factors or rgbas arrays
+        of a different length than the new one.
+        """
+        if not hasattr(self, "packed_members"):
+            # Still in VGroup.__init__
+            return False
+        packed = self.get_packed_array(array_name)
+        sheen_factor = self.get_sheen_factor()
+        if any(mob.get_sheen_factor() != sheen_factor for mob in self.packed_members):
+            return False
+        rgbas = self.generate_rgbas_array(
+            color if (color is not None) else BLACK,
+            opacity if (opacity is not None) else 0,
+        )
+        if not (self.packed_lengths[array_name] == len(rgbas)).all():
+            return False
+        per_member = packed.reshape((-1, len(rgbas), 4))
+        if color is not None:
+            per_member[:, :, :3] = rgbas[:, :3]
+        if opacity is not None:
+            per_member[:, :, 3] = rgbas[:, 3]
+        return True
+
+    def set_fill(self, color=None, opacity=None, family=True):
+        if not (family and self.update_packed_rgbas("fill_rgbas", color, opacity)):
+            VGroup.set_fill(self, color, opacity, family)
+        return self
+
+    def set_stroke(self, color=None, width=None, opacity=None,
+                   background=False, family=True):
+        if background:
+            array_name = "background_stroke_rgbas"
+            width_name = "background_stroke_width"
+        else:
+            array_name = "stroke_rgbas"
+            width_name = "stroke_width"
+        if not (family and self.update_packed_rgbas(array_name, color, opacity)):
+            return VGroup.set_stroke(
+                self, color, width, opacity, background, family
+            )
+        if width is not None:
+            for mob in self.packed_members:
+                setattr(mob, width_name, width)
+        return self
+
+
 class VectorizedPoint(VMobject):
     CONFIG = {
         "color": BLACK,
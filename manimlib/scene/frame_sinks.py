@@ -0,0 +1,235 @@
+import json
+import os
+
+import numpy as np
+from PIL import Image
+
+from manimlib.utils.config_ops import digest_config
+from manimlib.utils.file_ops import guarantee_existence
+
+
+class FrameSink(object):
+    """
+    Receives the rendered frames of a scene from its SceneFileWriter,
+    instead of or alongside FFMPEG, e.g. to render without paying for
+    encoding, or to keep the raw frames around for later.
+    """
+    CONFIG = {}
+
+    def __init__(self, file_writer, **kwargs):
+        digest_config(self, kwargs)
+        self.file_writer = file_writer
+        self.n_frames = 0
+
+    def begin_animation(self):
+        pass
+
+    def end_animation(self):
+        pass
+
+    def write_frame(self, frame):
+        self.n_frames += 1
+
+    def write_static_frames(self, frame, n_frames):
+        for x in range(n_frames):
+            self.write_frame(frame)
+
+    def finish(self):
+        pass
+
+
+class NullFrameSink(FrameSink):
+    """
+    Only counts frames, so the whole raster pipeline runs
+    but nothing is encoded or stored.
+    """
+
+    def write_static_frames(self, frame, n_frames):
+        self.n_frames += n_frames
+
+
+class RingBufferFrameSink(FrameSink):
+    """
+    Keeps the last ring_size frames in a preallocated array.
+    """
+    CONFIG = {
+        "ring_size": 60,
+    }
+
+    def write_frame(self, frame):
+        if not hasattr(self, "frame_ring"):
+            self.frame_ring = np.zeros(
+                (self.ring_size, *frame.shape), dtype=frame.dtype
+            )
+        np.copyto(self.frame_ring[self.n_frames % self.ring_size], frame)
+        self.n_frames += 1
+
+    def get_frames(self):
+        """
+        Returns the frames held, oldest first.
+        """
+        if self.n_frames == 0:
+            return np.zeros((0,))
+        if self.n_frames <= self.ring_size:
+            return self.frame_ring[:self.n_frames]
+        start = self.n_frames % self.ring_size
+        return np.roll(self.frame_ring, -start, axis=0)
+
+
+class RawFileFrameSink(FrameSink):
+    """
+    Writes frames uncompressed into a single file, through a memory
+    map which grows by frames_per_chunk frames at a time.  Their
+    shape and dtype are written to a json file next to it, which
+    read_raw_frame_file uses to map the frames back in.
+
+    When the frames start with a run of static frames, that frame is
+    only stored once, and only copied out if other frames follow.
+    The json file records the number of frames meant, "n_frames",
+    so a file of one stored frame may stand for many.
+    """
+    CONFIG = {
+        "frames_per_chunk": 64,
+        # Defaults to <scene name>.raw in the frames directory
+        "file_path": None,
+        "print_file_ready_message": True,
+    }
+
+    def __init__(self, file_writer, **kwargs):
+        FrameSink.__init__(self, file_writer, **kwargs)
+        if self.file_path is None:
+            self.file_path = os.path.join(
+                file_writer.get_frames_directory(),
+                file_writer.get_default_scene_name() + ".raw",
+            )
+        self.frame_map = None
+        self.capacity = 0
+        self.n_stored_frames = 0
+
+    def grow_frame_map(self, frame):
+        if self.frame_map is not None:
+            self.frame_map.flush()
+            self.frame_map = None
+        self.capacity += self.frames_per_chunk
+        mode = "r+b" if os.path.exists(self.file_path) else "wb"
+        with open(self.file_path, mode) as fp:
+            fp.truncate(self.capacity * frame.nbytes)
+        self.frame_map = np.memmap(
+            self.file_path, dtype=frame.dtype, mode="r+",
+            shape=(self.capacity, *frame.shape),
+        )
+
+    def store_frame(self, frame):
+        if self.n_stored_frames == 0 and os.path.exists(self.file_path):
+            # Left over from an earlier render
+            os.remove(self.file_path)
+        if self.n_stored_frames >= self.capacity:
+            self.grow_frame_map(frame)
+        self.frame_map[self.n_stored_frames] = frame
+        self.n_stored_frames += 1
+
+    def write_frame(self, frame):
+        while self.n_stored_frames < self.n_frames:
+            # Copy out the leading static frame
+            self.store_frame(self.frame_map[0])
+        self.store_frame(frame)
+        self.n_frames += 1
+
+    def write_static_frames(self, frame, n_frames):
+        if self.n_frames == 0 and n_frames > 0:
+            self.store_frame(frame)
+            self.n_frames = n_frames
+        else:
+            FrameSink.write_static_frames(self, frame, n_frames)
+
+    def finish(self):
+        if self.frame_map is None:
+            return
+        frame_shape = self.frame_map.shape[1:]
+        dtype = self.frame_map.dtype
+        self.frame_map.flush()
+        self.frame_map = None
+        with open(self.file_path, "r+b") as fp:
+            fp.truncate(
+                self.n_stored_frames * int(np.prod(frame_shape)) * dtype.itemsize
+            )
+        with open(get_raw_frame_metadata_path(self.file_path), "w") as fp:
+            json.dump({
+                "shape": [self.n_stored_frames, *frame_shape],
+                "dtype": dtype.str,
+                "n_frames": self.n_frames,
+                "frame_rate": self.file_writer.get_camera().frame_rate,
+            }, fp)
+        if self.print_file_ready_message:
+            self.file_writer.print_file_ready_message(self.file_path)
+
+
+class PngSequenceFrameSink(FrameSink):
+    """
+    Saves each frame as a png, in the file writer's png_mode.
+    """
+
+    def __init__(self, file_writer, **kwargs):
+        FrameSink.__init__(self, file_writer, **kwargs)
+        scene_name = file_writer.get_default_scene_name()
+        self.png_directory = guarantee_existence(os.path.join(
+            file_writer.get_frames_directory(), scene_name,
+        ))
+        self.file_name_template = scene_name + "_{:05d}.png"
+
+    def write_frame(self, frame):
+        file_path = os.path.join(
+            self.png_directory,
+            self.file_name_template.format(self.n_frames),
+        )
+        image = Image.fromarray(frame, "RGBA")
+        image.convert(self.file_writer.png_mode).save(file_path)
+        self.n_frames += 1
+
+    def finish(self):
+        if self.n_frames > 0:
+            self.file_writer.print_file_ready_message(self.png_directory)
+
+
+FRAME_SINK_CLASSES = {
+    "null": NullFrameSink,
+    "ring": RingBufferFrameSink,
+    "raw": RawFileFrameSink,
+    "png": PngSequenceFrameSink,
+}
+
+
+def get_frame_sink(sink, file_writer):
+    """
+    sink can be a FrameSink, or one of the names in
+    FRAME_SINK_CLASSES.
+    """
+    if isinstance(sink, FrameSink):
+        return sink
+    if sink not in FRAME_SINK_CLASSES:
+        raise Exception("Unknown frame sink {}, use one of {}".format(
+            sink, ", ".join(FRAME_SINK_CLASSES)
+        ))
+    return FRAME_SINK_CLASSES[sink](file_writer)
+
+
+def get_raw_frame_metadata_path(file_path):
+    return os.path.splitext(file_path)[0] + ".json"
+
+
+def read_raw_frame_metadata(file_path):
+    with open(get_raw_frame_metadata_path(file_path), "r") as fp:
+        return json.load(fp)
+
+
+def read_raw_frame_file(file_path):
+    """
+    Returns a read-only memory map of the frames stored
+    by a RawFileFrameSink.  If it only stored a leading
+    static frame, this has just that one frame.
+    """
+    metadata = read_raw_frame_metadata(file_path)
+    return np.memmap(
+        file_path, dtype=np.dtype(metadata["dtype"]), mode="r",
+        shape=tuple(metadata["shape"]),
+    )
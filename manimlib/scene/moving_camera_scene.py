@@ -24,6 +24,9 @@ class MovingCameraScene(Scene):
         # willd default to a full-sized frame.  Is that okay?
         return self
 
+    def get_mobjects_indicating_camera_movement(self):
+        return self.camera.get_mobjects_indicating_movement()
+
     def get_moving_mobjects(self, *animations):
         """
         This method returns a list of all of the Mobjects in the Scene that
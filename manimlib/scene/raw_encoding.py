@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+"""
+Encodes the raw frame files which SceneFileWriter keeps when
+defer_encoding and keep_raw_frames are set, so a scene which was
+rendered once can be encoded again with other settings, e.g.
+
+    python -m manimlib.scene.raw_encoding \\
+        media/videos/example_scenes/1440p60/raw_frames/SquareToCircle \\
+        preview.mp4 --crf 35 --preset ultrafast
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import os
+import shutil
+import subprocess
+import tempfile
+
+from manimlib.constants import FFMPEG_BIN
+from manimlib.scene.frame_sinks import read_raw_frame_metadata
+from manimlib.utils.file_ops import get_sorted_integer_files
+
+
+def get_default_codec_args(movie_file_extension):
+    # TODO, the test for a transparent background should not be based on
+    # the file extension.
+    if movie_file_extension == ".mov":
+        # This is if the background of the exported
+        # video should be transparent.
+        return ['-vcodec', 'qtrle']
+    return ['-vcodec', 'libx264', '-pix_fmt', 'yuv420p']
+
+
+def get_raw_frame_encoding_command(raw_file_path, output_path, codec_args):
+    metadata = read_raw_frame_metadata(raw_file_path)
+    n_stored_frames, height, width = metadata["shape"][:3]
+    command = [
+        FFMPEG_BIN,
+        '-y',  # overwrite output file if it exists
+        '-f', 'rawvideo',
+        '-s', '%dx%d' % (width, height),  # size of one frame
+        '-pix_fmt', 'rgba',
+        '-r', str(metadata["frame_rate"]),
+        '-i', raw_file_path,
+        '-an',  # Tells FFMPEG not to expect any audio
+        '-loglevel', 'error',
+    ]
+    n_frames = metadata.get("n_frames", n_stored_frames)
+    if n_frames > n_stored_frames:
+        # Only the leading static frame was stored
+        command += [
+            '-vf', 'tpad=stop_mode=clone:stop={}'.format(n_frames - 1),
+        ]
+    return command + list(codec_args) + [output_path]
+
+
+def encode_raw_frame_file(raw_file_path, output_path, codec_args):
+    """
+    Encodes a raw frame file to output_path, going through a
+    temporary file so that output_path is never half written.
+    """
+    root, extension = os.path.splitext(output_path)
+    temp_path = root + "_temp" + extension
+    command = get_raw_frame_encoding_command(
+        raw_file_path, temp_path, codec_args
+    )
+    return_code = subprocess.call(command)
+    if return_code != 0:
+        raise Exception("FFMPEG failed to encode {}".format(raw_file_path))
+    shutil.move(temp_path, output_path)
+    return output_path
+
+
+def encode_raw_frame_files(path_pairs, codec_args, n_workers=None):
+    """
+    Encodes each (raw_file_path, output_path) pair, running up
+    to n_workers FFMPEG processes at once (cpu count by default).
+    """
+    n_workers = n_workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = [
+            executor.submit(encode_raw_frame_file, raw, output, codec_args)
+            for raw, output in path_pairs
+        ]
+        return [future.result() for future in futures]
+
+
+def concatenate_movie_files(file_paths, output_path):
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as fp:
+        for file_path in file_paths:
+            file_path = os.path.abspath(file_path)
+            if os.name == 'nt':
+                file_path = file_path.replace('\\', '/')
+            fp.write("file \'file:{}\'\n".format(file_path))
+        file_list = fp.name
+    try:
+        subprocess.call([
+            FFMPEG_BIN,
+            '-y',
+            '-f', 'concat',
+            '-safe', '0',
+            '-i', file_list,
+            '-loglevel', 'error',
+            '-c', 'copy',
+            output_path,
+        ])
+    finally:
+        os.remove(file_list)
+
+
+def encode_raw_frame_directory(directory, output_path, codec_args, n_workers=None):
+    """
+    Encodes every raw frame file in directory (one per play-like
+    call, named by its index) and concatenates them to output_path.
+    """
+    raw_file_paths = get_sorted_integer_files(directory, extension=".raw")
+    if len(raw_file_paths) == 0:
+        raise Exception("No raw frame files in {}".format(directory))
+    extension = os.path.splitext(output_path)[1]
+    temp_dir = tempfile.mkdtemp()
+    try:
+        movie_paths = encode_raw_frame_files([
+            (
+                raw_file_path,
+                os.path.join(temp_dir, "{:05}{}".format(index, extension)),
+            )
+            for index, raw_file_path in enumerate(raw_file_paths)
+        ], codec_args, n_workers)
+        concatenate_movie_files(movie_paths, output_path)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("\nFile ready at {}\n".format(output_path))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Encode the raw frames kept from a render"
+    )
+    parser.add_argument(
+        "directory",
+        help="Directory of raw frame files, as written with "
+             "--defer_encoding --keep_raw_frames",
+    )
+    parser.add_argument("output_path")
+    parser.add_argument("--vcodec", help="e.g. libx264, libx265, prores_ks")
+    parser.add_argument("--crf", help="Constant rate factor of the encoder")
+    parser.add_argument("--preset", help="Encoder preset, e.g. ultrafast")
+    parser.add_argument("--pix_fmt", default="yuv420p")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of FFMPEG processes to run at once",
+    )
+    args = parser.parse_args()
+
+    extension = os.path.splitext(args.output_path)[1]
+    if args.vcodec is None:
+        codec_args = get_default_codec_args(extension)
+    else:
+        codec_args = ['-vcodec', args.vcodec, '-pix_fmt', args.pix_fmt]
+    if args.crf is not None:
+        codec_args += ['-crf', args.crf]
+    if args.preset is not None:
+        codec_args += ['-preset', args.preset]
+    encode_raw_frame_directory(
+        args.directory, args.output_path, codec_args, args.workers
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import inspect
+import itertools as it
 import random
 import warnings
 import platform
@@ -12,8 +13,17 @@ from manimlib.camera.camera import Camera
 from manimlib.constants import *
 from manimlib.container.container import Container
 from manimlib.mobject.mobject import Mobject
+from manimlib.mobject.svg.tex_mobject import TexMobject
+from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.scene.scene_file_writer import SceneFileWriter
+from manimlib.utils.config_ops import merge_dicts_recursively
+from manimlib.utils.hashing import UninspectableObjectException
+from manimlib.utils.hashing import get_hash_of_objects
+from manimlib.utils.iterables import batch_by_property
 from manimlib.utils.iterables import list_update
+from manimlib.utils.iterables import remove_list_redundancies
+from manimlib.utils.profiling import RenderProfiler
+from manimlib.utils.profiling import time_phase
 
 
 class Scene(Container):
@@ -51,19 +61,45 @@ class Scene(Container):
         "start_at_animation_number": None,
         "end_at_animation_number": None,
         "leave_progress_bars": False,
+        # When True, mobjects which are drawn above a moving mobject
+        # but don't move themselves are no longer redrawn every frame
+        "split_static_mobjects_into_layers": False,
+        # Runs of fewer static mobjects than this are cheaper to redraw
+        # than to lay over the frame as a full sized layer
+        "min_static_layer_size": 4,
+        # When True, time spent in updaters, interpolation,
+        # rasterization and writing is recorded for each
+        # play-like call, and reported once the scene is done
+        "profile": False,
+        "profile_summary_size": 10,
+        # Each of these is merged into camera_config to make another
+        # camera, which films the scene alongside the main one to its
+        # own movie, e.g. [LOW_QUALITY_CAMERA_CONFIG] for a preview.
+        # Construct, updaters and interpolation all run once per frame
+        # for all of them.  Their frame rates must divide the main one.
+        "extra_camera_configs": [],
     }
 
     def __init__(self, **kwargs):
         Container.__init__(self, **kwargs)
-        self.camera = self.camera_class(**self.camera_config)
+        self.profiler = RenderProfiler() if self.profile else None
+        self.camera = self.camera_class(
+            profiler=self.profiler, **self.camera_config
+        )
         self.file_writer = SceneFileWriter(
             self, **self.file_writer_config,
         )
+        self.init_extra_cameras()
 
         self.mobjects = []
         # TODO, remove need for foreground mobjects
         self.foreground_mobjects = []
         self.num_plays = 0
+        # Numbers of the play-like calls which stepped time based
+        # updaters, which skipping through can't reproduce
+        self.plays_with_time_based_updaters = []
+        # Values of num_plays whenever add_sound was called
+        self.sound_play_numbers = []
         self.time = 0
         self.original_skipping_status = self.skip_animations
         if self.random_seed is not None:
@@ -76,7 +112,10 @@ class Scene(Container):
         except EndSceneEarlyException:
             pass
         self.tear_down()
-        self.file_writer.finish()
+        for file_writer in self.get_file_writers():
+            file_writer.finish()
+        if self.profiler is not None:
+            self.report_profile()
         self.print_end_message()
 
     def setup(self):
@@ -112,6 +151,59 @@ class Scene(Container):
         """
         print("Played {} animations".format(self.num_plays))
 
+    def init_extra_cameras(self):
+        """
+        Makes the cameras of extra_camera_configs, each with a
+        file writer of its own.
+        """
+        self.extra_cameras = []
+        self.extra_file_writers = []
+        self.n_frames_added = 0
+        for config in self.extra_camera_configs:
+            camera = self.camera_class(**merge_dicts_recursively(
+                self.camera_config, config
+            ))
+            if self.camera.frame_rate % camera.frame_rate != 0:
+                raise Exception(
+                    "Frame rate {} of an extra camera does not divide the "
+                    "scene's frame rate {}".format(
+                        camera.frame_rate, self.camera.frame_rate
+                    )
+                )
+            file_writer = SceneFileWriter(self, **merge_dicts_recursively(
+                self.file_writer_config, {
+                    "camera": camera,
+                    # These would overwrite those of the main camera
+                    "save_last_frame": False,
+                    "save_pngs": False,
+                    "frame_sinks": [],
+                },
+            ))
+            self.extra_cameras.append(camera)
+            self.extra_file_writers.append(file_writer)
+
+    def get_file_writers(self):
+        return [self.file_writer, *self.extra_file_writers]
+
+    def report_profile(self):
+        """
+        Prints a summary of the times recorded by the profiler, and
+        writes all of them as json and csv next to the scene's output.
+        """
+        self.profiler.print_summary(self.profile_summary_size)
+        file_path_stem = self.file_writer.get_output_file_path_stem()
+        if file_path_stem is None:
+            return
+        if self.start_at_animation_number is not None or \
+                self.end_at_animation_number is not None:
+            # Only part of the scene was rendered, e.g. by a worker
+            file_path_stem += "_{}_{}".format(
+                self.start_at_animation_number or 0,
+                self.end_at_animation_number or self.num_plays,
+            )
+        for file_path in self.profiler.write_report(file_path_stem):
+            print("Profile written to {}".format(file_path))
+
     def set_variables_as_attrs(self, *objects, **newly_named_objects):
         """
         This method is slightly hacky, making it a little easier
@@ -152,6 +244,7 @@ class Scene(Container):
         camera: Union[Camera, MappingCamera,MovingCamera,MultiCamera,ThreeDCamera]
             Camera object to use.
         """
+        camera.profiler = self.profiler
         self.camera = camera
 
     def get_frame(self):
@@ -161,9 +254,18 @@ class Scene(Container):
         Returns
         -------
         np.array
-            NumPy array of pixel values of each pixel in screen
-        """
-        return np.array(self.camera.get_pixel_array())
+            NumPy array of pixel values of each pixel in screen.
+            With extra cameras, this is a MultiCameraFrame whose
+            extra_frames hold what each of those sees.
+        """
+        frame = np.array(self.camera.get_pixel_array())
+        if self.extra_cameras:
+            frame = frame.view(MultiCameraFrame)
+            frame.extra_frames = [
+                np.array(camera.get_pixel_array())
+                for camera in self.extra_cameras
+            ]
+        return frame
 
     def get_image(self):
         """
@@ -247,6 +349,24 @@ class Scene(Container):
 
         kwargs["include_submobjects"] = include_submobjects
         self.capture_mobjects_in_camera(mobjects, **kwargs)
+        if self.extra_cameras:
+            self.update_extra_camera_frames(mobjects, background, **kwargs)
+
+    def update_extra_camera_frames(self, mobjects, background, **kwargs):
+        """
+        Does for the extra cameras what update_frame does for the
+        main one, after matching their view to that of the main
+        camera.  Frames from get_frame carry the matching frames of
+        the extra cameras, which are used as their backgrounds.
+        """
+        extra_backgrounds = getattr(background, "extra_frames", None)
+        for index, camera in enumerate(self.extra_cameras):
+            camera.copy_view_from(self.camera)
+            if extra_backgrounds is not None:
+                camera.set_pixel_array(extra_backgrounds[index])
+            else:
+                camera.reset()
+            camera.capture_mobjects(mobjects, **kwargs)
 
     def freeze_background(self):
         self.update_frame()
@@ -263,6 +383,11 @@ class Scene(Container):
         dt: Union[int,float]
             Change in time between updates. Defaults (mostly) to 1/frames_per_second
         """
+        if self.profiler is not None:
+            for mobject in self.mobjects:
+                with time_phase(self.profiler, "updaters", type(mobject).__name__):
+                    mobject.update(dt)
+            return
         for mobject in self.mobjects:
             mobject.update(dt)
 
@@ -642,6 +767,137 @@ class Scene(Container):
                 return mobjects[i:]
         return []
 
+    def get_mobjects_indicating_camera_movement(self):
+        """
+        Returns the mobjects whose movement means that every
+        mobject on screen should be considered as moving.
+        """
+        return []
+
+    def get_precisely_moving_mobjects(self, *animations):
+        """
+        Unlike get_moving_mobjects, this only returns the family
+        members which can actually change from one frame to the next,
+        or None if that can't be known, e.g. when the camera moves.
+
+        Parameters
+        ----------
+        *animations
+            The animations to check for moving mobjects.
+
+        Returns
+        ------
+        set or None
+            The set of mobjects which could be moving in
+            the Animation(s)
+        """
+        movers = [anim.mobject for anim in animations]
+        movers += [
+            mob
+            for mob in self.get_mobject_family_members()
+            if len(mob.get_updaters()) > 0
+        ]
+        movers += self.foreground_mobjects
+        moving_set = set(self.camera.extract_mobject_family_members(movers))
+        indicators = self.get_mobjects_indicating_camera_movement()
+        if any([indicator in moving_set for indicator in indicators]):
+            return None
+        return moving_set
+
+    def get_moving_mobject_render_groups(self, moving_mobjects, *animations):
+        """
+        Splits moving_mobjects, in drawing order, into runs of mobjects
+        which move and runs which don't.  Static runs of plain VMobjects
+        are drawn once onto a transparent layer here, so that each frame
+        only has to lay it over the frame instead of redrawing them.
+
+        Parameters
+        ----------
+        moving_mobjects : list
+            The mobjects returned by get_moving_mobjects
+
+        *animations
+            The animations being played.
+
+        Returns
+        ------
+        list or None
+            A list of (units, layer) pairs, where units are those of
+            get_render_units and layer is None for units to be drawn
+            every frame, or None if all of moving_mobjects should
+            simply be drawn every frame.
+        """
+        if not self.split_static_mobjects_into_layers or self.extra_cameras:
+            # Layers are drawn for the main camera only
+            return None
+        moving_set = self.get_precisely_moving_mobjects(*animations)
+        if moving_set is None:
+            return None
+        units = remove_list_redundancies(list(it.chain(*[
+            self.get_render_units(mob, moving_set)
+            for mob in moving_mobjects
+        ])))
+        batches = batch_by_property(units, lambda unit: unit[1])
+        render_groups = []
+        for batch, is_moving in batches:
+            mobjects = [mob for mob, is_unit_moving in batch]
+            can_be_layered = all([
+                isinstance(mob, VMobject) and not mob.get_background_image_file()
+                for mob in mobjects
+            ])
+            if is_moving or not can_be_layered or len(batch) < self.min_static_layer_size:
+                if render_groups and render_groups[-1][1] is None:
+                    render_groups[-1][0].extend(batch)
+                else:
+                    render_groups.append((list(batch), None))
+            else:
+                layer = self.camera.rasterize_vmobjects_layer(mobjects)
+                render_groups.append((batch, layer))
+        if len(render_groups) == 1 and render_groups[0][1] is None:
+            return None
+        return render_groups
+
+    def get_render_units(self, mobject, moving_set):
+        """
+        Splits the family of mobject, in drawing order, into
+        (mob, is_moving) pairs.  A moving mob stands for its whole
+        family, which is extracted again for each frame since it can
+        change during the animation (e.g. the digits of a changing
+        DecimalNumber).  Any other mob stands only for its own points.
+        """
+        if mobject in moving_set:
+            return [(mobject, True)]
+        result = [(mobject, False)] if mobject.has_points() else []
+        for submob in mobject.submobjects:
+            result += self.get_render_units(submob, moving_set)
+        return result
+
+    def get_render_unit_members(self, units):
+        """
+        The mobjects to draw for units from get_render_units,
+        as they are now.
+        """
+        return remove_list_redundancies(list(it.chain(*[
+            mob.family_members_with_points() if is_moving else [mob]
+            for mob, is_moving in units
+        ])))
+
+    def update_frame_from_render_groups(self, render_groups, background):
+        """
+        Draws the render groups from get_moving_mobject_render_groups
+        on top of background.
+        """
+        self.set_camera_pixel_array(background)
+        for units, layer in render_groups:
+            if layer is None:
+                self.capture_mobjects_in_camera(
+                    self.get_render_unit_members(units),
+                    include_submobjects=False,
+                )
+            else:
+                with time_phase(self.profiler, "rasterization", "layer"):
+                    self.camera.paint_layer(layer, self.camera.pixel_array)
+
     def get_time_progression(self, run_time, n_iterations=None, override_skip_animations=False):
         """
         You will hardly use this when making your own animations.
@@ -843,13 +1099,109 @@ class Scene(Container):
         """
         def wrapper(self, *args, **kwargs):
             self.update_skipping_status()
+            if self.has_time_based_updaters(*args):
+                self.plays_with_time_based_updaters.append(self.num_plays)
             allow_write = not self.skip_animations
-            self.file_writer.begin_animation(allow_write)
+            play_hash = None
+            if allow_write and self.can_use_partial_movie_cache(*args):
+                play_hash = self.get_play_hash(func, *args, **kwargs)
+            if play_hash is not None:
+                n_frames = self.file_writer.get_cached_partial_movie_frame_count(
+                    play_hash
+                )
+                if n_frames is not None:
+                    self.play_from_partial_movie_cache(
+                        func, play_hash, n_frames, *args, **kwargs
+                    )
+                    self.num_plays += 1
+                    return
+            if self.profiler is not None:
+                self.profiler.begin_animation(self.num_plays, func.__name__)
+            for file_writer in self.get_file_writers():
+                file_writer.begin_animation(allow_write, play_hash)
             func(self, *args, **kwargs)
-            self.file_writer.end_animation(allow_write)
+            for file_writer in self.get_file_writers():
+                file_writer.end_animation(allow_write)
+            if self.profiler is not None:
+                self.profiler.end_animation()
             self.num_plays += 1
         return wrapper
 
+    def has_time_based_updaters(self, *args):
+        """
+        Whether a play-like call with these arguments steps time
+        based updaters.  Skipping through such a call steps them by
+        the full run time at once, which leaves the scene in a
+        different state from a frame by frame render.
+        """
+        if self.always_update_mobjects:
+            return True
+        mobjects = list(self.mobjects)
+        for arg in args:
+            if isinstance(arg, Animation):
+                mobjects.append(arg.mobject)
+            elif inspect.ismethod(arg) and isinstance(arg.__self__, Mobject):
+                mobjects.append(arg.__self__)
+        return any([
+            mob.has_time_based_updater()
+            for mob in self.camera.extract_mobject_family_members(mobjects)
+        ])
+
+    def can_use_partial_movie_cache(self, *args):
+        """
+        Whether a play-like call with these arguments may be looked
+        up in the partial movie cache.  Calls with time based
+        updaters are always rendered, see has_time_based_updaters.
+        """
+        file_writer = self.file_writer
+        if not (file_writer.write_to_movie and file_writer.use_partial_movie_cache):
+            return False
+        if file_writer.frame_sinks:
+            # These need every frame rendered
+            return False
+        if self.extra_cameras:
+            return False
+        return not self.has_time_based_updaters(*args)
+
+    def get_play_hash(self, func, *args, **kwargs):
+        """
+        Returns a hash of everything which determines the frames
+        written by a play-like call: the camera's configuration,
+        the state of every mobject in the scene, the arguments of
+        the call, and the random state.  Returns None when some of
+        that can't be hashed, so the call can't use the cache.
+        """
+        try:
+            return get_hash_of_objects(
+                type(self.camera),
+                self.camera.get_configuration(),
+                self.file_writer.movie_file_extension,
+                self.mobjects,
+                self.foreground_mobjects,
+                func.__name__,
+                args,
+                kwargs,
+                random.getstate(),
+                np.random.get_state(),
+                opaque_objects=[self, self.camera, self.file_writer],
+            )
+        except UninspectableObjectException:
+            return None
+
+    def play_from_partial_movie_cache(self, func, play_hash, n_frames, *args, **kwargs):
+        """
+        Runs a play-like call with animations skipped, so that
+        the scene ends up in the same state, and uses the cached
+        partial movie in place of its frames.
+        """
+        start_time = self.time
+        self.skip_animations = True
+        func(self, *args, **kwargs)
+        self.skip_animations = False
+        # Skipping only counts a single frame
+        self.time = start_time + n_frames / self.camera.frame_rate
+        self.file_writer.use_cached_partial_movie(play_hash)
+
     def begin_animations(self, animations):
         """
         This method begins the list of animations that is passed,
@@ -862,6 +1214,10 @@ class Scene(Container):
             List of involved animations.
 
         """
+        if self.profiler is not None:
+            self.profiler.name_animation(", ".join([
+                type(animation).__name__ for animation in animations
+            ]))
         curr_mobjects = self.get_mobject_family_members()
         for animation in animations:
             # Begin animation
@@ -888,16 +1244,25 @@ class Scene(Container):
         moving_mobjects = self.get_moving_mobjects(*animations)
         self.update_frame(excluded_mobjects=moving_mobjects)
         static_image = self.get_frame()
+        render_groups = self.get_moving_mobject_render_groups(
+            moving_mobjects, *animations
+        )
         last_t = 0
         for t in self.get_animation_time_progression(animations):
             dt = t - last_t
             last_t = t
             for animation in animations:
-                animation.update_mobjects(dt)
+                mobject_type = type(animation.mobject).__name__
+                with time_phase(self.profiler, "updaters", mobject_type):
+                    animation.update_mobjects(dt)
                 alpha = t / animation.run_time
-                animation.interpolate(alpha)
+                with time_phase(self.profiler, "interpolation", mobject_type):
+                    animation.interpolate(alpha)
             self.update_mobjects(dt)
-            self.update_frame(moving_mobjects, static_image)
+            if render_groups is None:
+                self.update_frame(moving_mobjects, static_image)
+            else:
+                self.update_frame_from_render_groups(render_groups, static_image)
             self.add_frames(self.get_frame())
 
     def finish_animations(self, animations):
@@ -1131,8 +1496,43 @@ class Scene(Container):
         self.increment_time(len(frames) * dt)
         if self.skip_animations:
             return
-        for frame in frames:
-            self.file_writer.write_frame(frame)
+        with time_phase(self.profiler, "writing"):
+            if self.extra_file_writers:
+                self.add_frames_to_extra_file_writers(frames)
+            self.n_frames_added += len(frames)
+            if len(frames) > 1 and all([frame is frames[0] for frame in frames]):
+                # e.g. from a wait with nothing updating
+                self.file_writer.write_static_frames(frames[0], len(frames))
+                return
+            for frame in frames:
+                self.file_writer.write_frame(frame)
+
+    def add_frames_to_extra_file_writers(self, frames):
+        """
+        Writes the extra camera frames carried by frames to the extra
+        file writers.  A camera at a lower frame rate only gets every
+        n-th frame of the scene.
+        """
+        start = self.n_frames_added
+        is_static = all([frame is frames[0] for frame in frames])
+        for index, (camera, file_writer) in enumerate(zip(
+                self.extra_cameras, self.extra_file_writers)):
+            step = self.camera.frame_rate // camera.frame_rate
+            kept_frames = [
+                frame
+                for frame_index, frame in enumerate(frames, start)
+                if frame_index % step == 0 and
+                getattr(frame, "extra_frames", None) is not None
+            ]
+            if len(kept_frames) == 0:
+                continue
+            if is_static:
+                file_writer.write_static_frames(
+                    kept_frames[0].extra_frames[index], len(kept_frames)
+                )
+                continue
+            for frame in kept_frames:
+                file_writer.write_frame(frame.extra_frames[index])
 
     def add_sound(self, sound_file, time_offset=0, gain=None, **kwargs):
         """
@@ -1151,10 +1551,37 @@ class Scene(Container):
         **kwargs : Present for excess? 
 
         """
+        # Noted even when skipping, so that a pass through construct
+        # with everything skipped finds out where sounds are added
+        self.sound_play_numbers.append(self.num_plays)
         if self.skip_animations:
             return
         time = self.get_time() + time_offset
-        self.file_writer.add_sound(sound_file, time, gain, **kwargs)
+        for file_writer in self.get_file_writers():
+            file_writer.add_sound(sound_file, time, gain, **kwargs)
+
+    def prefetch_tex(self, *tex_strings, tex_mobject_class=None, **kwargs):
+        """
+        Queues the tex which building tex_mobject_class(*tex_strings, **kwargs)
+        would compile.  Everything queued is compiled in a single latex
+        and dvisvgm run as soon as any tex mobject needs a new expression,
+        so calling this at the start of construct for the tex of a scene
+        saves running latex once for each tex mobject.
+
+        Parameters
+        ----------
+        *tex_strings : str
+            The strings the tex mobject will be built from.
+
+        tex_mobject_class : type = TexMobject
+            The class of the tex mobject, e.g. TextMobject.
+
+        **kwargs
+            The configuration it will be built with.
+        """
+        if tex_mobject_class is None:
+            tex_mobject_class = TexMobject
+        tex_mobject_class.prefetch(*tex_strings, **kwargs)
 
     def show_frame(self):
         """
@@ -1165,5 +1592,15 @@ class Scene(Container):
         self.get_image().show()
 
 
+class MultiCameraFrame(np.ndarray):
+    """
+    A frame of the main camera, which also carries the
+    frames of a scene's extra cameras in extra_frames.
+    """
+
+    def __array_finalize__(self, obj):
+        self.extra_frames = getattr(obj, "extra_frames", None)
+
+
 class EndSceneEarlyException(Exception):
     pass
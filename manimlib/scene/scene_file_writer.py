@@ -1,9 +1,13 @@
 import numpy as np
 from pydub import AudioSegment
+import json
+import queue
 import shutil
 import subprocess
 import os
 import _thread as thread
+import threading
+import time
 from time import sleep
 import datetime
 
@@ -12,6 +16,11 @@ from manimlib.constants import FFMPEG_BIN
 from manimlib.constants import STREAMING_IP
 from manimlib.constants import STREAMING_PORT
 from manimlib.constants import STREAMING_PROTOCOL
+from manimlib.scene.frame_sinks import RawFileFrameSink
+from manimlib.scene.frame_sinks import get_frame_sink
+from manimlib.scene.frame_sinks import get_raw_frame_metadata_path
+from manimlib.scene.raw_encoding import encode_raw_frame_files
+from manimlib.scene.raw_encoding import get_default_codec_args
 from manimlib.utils.config_ops import digest_config
 from manimlib.utils.file_ops import guarantee_existence
 from manimlib.utils.file_ops import add_extension_if_not_present
@@ -37,7 +46,7 @@ class SceneFileWriter(object):
     """
     CONFIG = {
         "write_to_movie": False,
-        # TODO, save_pngs is doing nothing
+        # Same as including "png" in frame_sinks
         "save_pngs": False,
         "png_mode": "RGBA",
         "save_last_frame": False,
@@ -48,14 +57,62 @@ class SceneFileWriter(object):
         "file_name": None,
         "input_file_path": "",  # ??
         "output_directory": None,
+        # Set to False when several processes each render a
+        # slice of the partial movie files, and only the
+        # process which launched them should concatenate.
+        "combine_partial_movie_files": True,
+        # Reuse partial movie files from earlier renders whose
+        # play-like call hashed to the same value.
+        "use_partial_movie_cache": False,
+        # Defaults to partial_movie_cache within MEDIA_DIR
+        "partial_movie_cache_directory": None,
+        # In bytes.  Least recently used files are removed first.
+        "max_partial_movie_cache_size": 2 * 1024**3,
+        # Hand frames to a separate thread which feeds FFMPEG, so that
+        # rendering the next frame overlaps with encoding this one.
+        "write_frames_in_thread": False,
+        # Number of preallocated frame buffers shared with that thread
+        "frame_queue_size": 8,
+        # Names from frame_sinks.FRAME_SINK_CLASSES ("null", "ring",
+        # "raw", "png"), or FrameSink objects, which are handed every
+        # frame written, whether or not a movie is written as well.
+        "frame_sinks": [],
+        # Instead of piping each partial movie to FFMPEG as it's
+        # rendered, store its frames uncompressed in a memory mapped
+        # file, and encode all of them in parallel once the scene is
+        # done, with up to encoding_workers FFMPEG processes (cpu
+        # count by default).
+        "defer_encoding": False,
+        "encoding_workers": None,
+        # Keep those files afterwards, so the scene can be encoded
+        # again with other settings by manimlib/scene/raw_encoding.py
+        "keep_raw_frames": False,
+        # Defaults to libx264, or qtrle for .mov
+        "ffmpeg_codec_args": None,
+        # The camera whose frames are written, when it's not the
+        # scene's own camera
+        "camera": None,
     }
 
     def __init__(self, scene, **kwargs):
         digest_config(self, kwargs)
         self.scene = scene
         self.stream_lock = False
+        self.frame_writer_stats = {
+            "frames_queued": 0,
+            "frames_written": 0,
+            "queue_wait_time": 0.0,
+            "pipe_write_time": 0.0,
+            "max_queue_depth": 0,
+        }
         self.init_output_directories()
         self.init_audio()
+        self.init_frame_sinks()
+
+    def get_camera(self):
+        if self.camera is not None:
+            return self.camera
+        return self.scene.camera
 
     # Output directories and files
     def init_output_directories(self):
@@ -108,6 +165,43 @@ class SceneFileWriter(object):
                 "partial_movie_files",
                 scene_name,
             ))
+            if self.defer_encoding:
+                self.raw_frame_directory = guarantee_existence(os.path.join(
+                    movie_dir,
+                    "raw_frames",
+                    scene_name,
+                ))
+                self.deferred_partial_movies = []
+            if self.use_partial_movie_cache:
+                self.partial_movie_cache_directory = guarantee_existence(
+                    self.partial_movie_cache_directory or os.path.join(
+                        consts.MEDIA_DIR or movie_dir,
+                        "partial_movie_cache",
+                    )
+                )
+
+    def get_frames_directory(self):
+        """
+        Returns the directory which frame sinks write frames to,
+        next to where the movie would be written.
+        """
+        module_directory = self.output_directory or self.get_default_module_directory()
+        if consts.VIDEO_DIR != "":
+            return guarantee_existence(os.path.join(
+                consts.VIDEO_DIR,
+                module_directory,
+                self.get_resolution_directory(),
+                "frames",
+            ))
+        return guarantee_existence(os.path.join(
+            consts.VIDEO_OUTPUT_DIR, "frames",
+        ))
+
+    def init_frame_sinks(self):
+        sinks = list(self.frame_sinks)
+        if self.save_pngs and "png" not in sinks:
+            sinks.append("png")
+        self.frame_sinks = [get_frame_sink(sink, self) for sink in sinks]
 
     def get_default_module_directory(self):
         """
@@ -162,8 +256,8 @@ class SceneFileWriter(object):
         str
             The name of the directory.
         """
-        pixel_height = self.scene.camera.pixel_height
-        frame_rate = self.scene.camera.frame_rate
+        pixel_height = self.get_camera().pixel_height
+        frame_rate = self.get_camera().frame_rate
         return "{}p{}".format(
             pixel_height, frame_rate
         )
@@ -205,6 +299,31 @@ class SceneFileWriter(object):
         )
         return result
 
+    def get_cached_partial_movie_path(self, play_hash):
+        """
+        Returns the path at which the partial movie for a
+        play-like call with the given hash is cached.
+        """
+        return os.path.join(
+            self.partial_movie_cache_directory,
+            play_hash + self.movie_file_extension,
+        )
+
+    def get_cached_partial_movie_frame_count(self, play_hash):
+        """
+        Returns the number of frames in the cached partial movie
+        for the given hash, or None if there is no such movie.
+        """
+        movie_path = self.get_cached_partial_movie_path(play_hash)
+        info_path = os.path.splitext(movie_path)[0] + ".json"
+        if not (os.path.exists(movie_path) and os.path.exists(info_path)):
+            return None
+        try:
+            with open(info_path, "r") as fp:
+                return json.load(fp)["n_frames"]
+        except (ValueError, KeyError):
+            return None
+
     def get_movie_file_path(self):
         """
         Returns the final path of the written video file.
@@ -216,6 +335,19 @@ class SceneFileWriter(object):
         """
         return self.movie_file_path
 
+    def get_output_file_path_stem(self):
+        """
+        Returns the path of the movie file, or else of the image
+        file, without its extension, so that other outputs like
+        profiling reports can be written next to it.  Returns
+        None if neither is being written.
+        """
+        if self.write_to_movie:
+            return os.path.splitext(self.movie_file_path)[0]
+        if self.save_last_frame:
+            return os.path.splitext(self.image_file_path)[0]
+        return None
+
     # Sound
     def init_audio(self):
         """
@@ -296,7 +428,7 @@ class SceneFileWriter(object):
         self.add_audio_segment(new_segment, time, **kwargs)
 
     # Writers
-    def begin_animation(self, allow_write=False):
+    def begin_animation(self, allow_write=False, play_hash=None):
         """
         Used internally by manim to stream the animation to FFMPEG for
         displaying or writing to a file.
@@ -305,9 +437,16 @@ class SceneFileWriter(object):
         ----------
         allow_write (bool=False)
             Whether or not to write to a video file.
+        play_hash (str=None)
+            If given, the finished partial movie is also added to
+            the partial movie cache under this hash.
         """
+        self.partial_movie_hash = play_hash
         if self.write_to_movie and allow_write:
             self.open_movie_pipe()
+        if allow_write:
+            for sink in self.frame_sinks:
+                sink.begin_animation()
 
     def end_animation(self, allow_write=False):
         """
@@ -321,11 +460,14 @@ class SceneFileWriter(object):
         """
         if self.write_to_movie and allow_write:
             self.close_movie_pipe()
+        if allow_write:
+            for sink in self.frame_sinks:
+                sink.end_animation()
 
     def write_frame(self, frame):
         """
         Used internally by Manim to write a frame to
-        the FFMPEG input buffer.
+        the FFMPEG input buffer, and to any frame sinks.
 
         Parameters
         ----------
@@ -333,7 +475,159 @@ class SceneFileWriter(object):
             Pixel array of the frame.
         """
         if self.write_to_movie:
-            self.writing_process.stdin.write(frame.tobytes())
+            self.write_frame_to_movie(frame)
+        for sink in self.frame_sinks:
+            sink.write_frame(frame)
+
+    def write_frame_to_movie(self, frame):
+        if self.defer_encoding:
+            self.raw_frame_sink.write_frame(frame)
+            self.partial_movie_frame_count += 1
+            return
+        if self.writing_process is None:
+            self.start_writing_process()
+            # Other frames follow the leading static frames,
+            # so those have to be piped after all
+            self.pipe_pending_static_frames()
+        self.pipe_frame(frame)
+        self.partial_movie_frame_count += 1
+
+    def write_static_frames(self, frame, n_frames):
+        """
+        Writes the same frame n_frames times.  If these are the
+        first frames of the partial movie, they're held back, and
+        if no other frames follow them, the frame is only piped
+        to FFMPEG once, and FFMPEG is told to repeat it.  Frame
+        sinks are handed the frame along with n_frames.
+
+        Parameters
+        ----------
+        frame (np.ndarray)
+            Pixel array of the frame.
+        n_frames (int)
+            Number of times the frame should appear in the movie.
+        """
+        if n_frames == 0:
+            return
+        for sink in self.frame_sinks:
+            sink.write_static_frames(frame, n_frames)
+        if not self.write_to_movie:
+            return
+        if self.defer_encoding:
+            self.raw_frame_sink.write_static_frames(frame, n_frames)
+            self.partial_movie_frame_count += n_frames
+            return
+        if self.writing_process is not None or n_frames == 1 or \
+                self.pending_static_frame is not None:
+            for x in range(n_frames):
+                self.write_frame_to_movie(frame)
+            return
+        # Whether FFMPEG can repeat the frame is only known
+        # once the partial movie is closed
+        self.pending_static_frame = np.array(frame)
+        self.n_pending_static_frames = n_frames
+        self.partial_movie_frame_count += n_frames
+
+    def pipe_pending_static_frames(self):
+        if self.pending_static_frame is None:
+            return
+        for x in range(self.n_pending_static_frames):
+            self.pipe_frame(self.pending_static_frame)
+        self.pending_static_frame = None
+        self.n_pending_static_frames = 0
+
+    def pipe_frame(self, frame):
+        if self.write_frames_in_thread:
+            self.queue_frame(frame)
+        else:
+            self.writing_process.stdin.write(
+                np.ascontiguousarray(frame).data
+            )
+
+    def init_frame_writer_thread(self, frame_shape):
+        """
+        Starts the thread which writes queued frames to FFMPEG.
+
+        Frames are copied into one of a fixed ring of buffers, and
+        the indices of filled buffers are passed to the thread, which
+        writes them straight from memory and hands the index back.
+        When every buffer is waiting on FFMPEG, queue_frame blocks.
+        """
+        if getattr(self, "frame_buffer_shape", None) != frame_shape:
+            self.frame_buffers = [
+                np.zeros(frame_shape, dtype='uint8')
+                for x in range(self.frame_queue_size)
+            ]
+            self.frame_buffer_shape = frame_shape
+        self.free_buffer_indices = queue.Queue()
+        for index in range(self.frame_queue_size):
+            self.free_buffer_indices.put(index)
+        self.filled_buffer_indices = queue.Queue()
+        self.frame_writer_error = None
+        self.frame_writer_thread = threading.Thread(
+            target=self.run_frame_writer_thread,
+            args=(self.writing_process.stdin,),
+            daemon=True,
+        )
+        self.frame_writer_thread.start()
+
+    def run_frame_writer_thread(self, stdin):
+        stats = self.frame_writer_stats
+        while True:
+            index = self.filled_buffer_indices.get()
+            if index is None:
+                return
+            try:
+                start = time.perf_counter()
+                stdin.write(self.frame_buffers[index].data)
+                stats["pipe_write_time"] += time.perf_counter() - start
+                stats["frames_written"] += 1
+            except Exception as err:
+                # Reraised from the rendering thread
+                self.frame_writer_error = err
+                return
+            finally:
+                self.free_buffer_indices.put(index)
+
+    def queue_frame(self, frame):
+        if not hasattr(self, "frame_writer_thread"):
+            self.init_frame_writer_thread(frame.shape)
+        self.raise_frame_writer_error()
+        stats = self.frame_writer_stats
+        start = time.perf_counter()
+        index = self.free_buffer_indices.get()
+        stats["queue_wait_time"] += time.perf_counter() - start
+        np.copyto(self.frame_buffers[index], frame)
+        self.filled_buffer_indices.put(index)
+        stats["frames_queued"] += 1
+        stats["max_queue_depth"] = max(
+            stats["max_queue_depth"],
+            self.filled_buffer_indices.qsize(),
+        )
+
+    def close_frame_writer_thread(self):
+        if not hasattr(self, "frame_writer_thread"):
+            return
+        self.filled_buffer_indices.put(None)
+        self.frame_writer_thread.join()
+        del self.frame_writer_thread
+        self.raise_frame_writer_error()
+
+    def raise_frame_writer_error(self):
+        if self.frame_writer_error is not None:
+            err = self.frame_writer_error
+            self.frame_writer_error = None
+            raise err
+
+    def get_frame_writer_stats(self):
+        """
+        Returns a dict with counts of frames queued and written
+        to FFMPEG, the seconds the rendering thread spent blocked
+        waiting for a free frame buffer (back-pressure from the
+        encoder), the seconds the writer thread spent in pipe writes,
+        and the largest number of frames which were waiting at once.
+        """
+        return dict(self.frame_writer_stats)
 
     def save_final_image(self, image):
         """
@@ -361,7 +655,7 @@ class SceneFileWriter(object):
             self.add_frames(*[frame] * n_frames)
             b = datetime.datetime.now()
             time_diff = (b - a).total_seconds()
-            frame_duration = 1 / self.scene.camera.frame_rate
+            frame_duration = 1 / self.get_camera().frame_rate
             if time_diff < frame_duration:
                 sleep(frame_duration - time_diff)
 
@@ -374,28 +668,60 @@ class SceneFileWriter(object):
         frame in the default image directory.
         """
         if self.write_to_movie:
-            if hasattr(self, "writing_process"):
+            if getattr(self, "writing_process", None) is not None:
                 self.writing_process.terminate()
-            self.combine_movie_files()
+            if self.defer_encoding:
+                self.encode_deferred_partial_movies()
+            if self.combine_partial_movie_files:
+                self.combine_movie_files()
+        for sink in self.frame_sinks:
+            sink.finish()
         if self.save_last_frame:
             self.scene.update_frame(ignore_skipping=True)
             self.save_final_image(self.scene.get_image())
 
     def open_movie_pipe(self):
         """
-        Used internally by Manim to initalise
-        FFMPEG and begin writing to FFMPEG's input
-        buffer.
+        Used internally by Manim to prepare writing the next
+        partial movie.  FFMPEG itself is only started once the
+        first frames arrive, since how it is invoked depends on
+        whether those frames are all the same.
         """
         file_path = self.get_next_partial_movie_path()
         temp_file_path = os.path.splitext(file_path)[0] + '_temp' + self.movie_file_extension
 
         self.partial_movie_file_path = file_path
         self.temp_partial_movie_file_path = temp_file_path
+        self.partial_movie_frame_count = 0
+        self.pending_static_frame = None
+        self.n_pending_static_frames = 0
+        self.writing_process = None
+        if self.defer_encoding:
+            self.raw_frame_sink = RawFileFrameSink(
+                self,
+                file_path=os.path.join(
+                    self.raw_frame_directory,
+                    "{:05}.raw".format(self.scene.num_plays),
+                ),
+                print_file_ready_message=False,
+            )
+
+    def start_writing_process(self, n_static_frames=None):
+        """
+        Used internally by Manim to initalise
+        FFMPEG and begin writing to FFMPEG's input
+        buffer.
 
-        fps = self.scene.camera.frame_rate
-        height = self.scene.camera.get_pixel_height()
-        width = self.scene.camera.get_pixel_width()
+        Parameters
+        ----------
+        n_static_frames (int=None)
+            If given, FFMPEG will expect a single frame, and
+            repeat it to fill this many frames.
+        """
+        camera = self.get_camera()
+        fps = camera.frame_rate
+        height = camera.get_pixel_height()
+        width = camera.get_pixel_width()
 
         command = [
             FFMPEG_BIN,
@@ -408,34 +734,154 @@ class SceneFileWriter(object):
             '-an',  # Tells FFMPEG not to expect any audio
             '-loglevel', 'error',
         ]
-        # TODO, the test for a transparent background should not be based on
-        # the file extension.
-        if self.movie_file_extension == ".mov":
-            # This is if the background of the exported
-            # video should be transparent.
+        if n_static_frames is not None:
+            # Clone the last (and only) frame of the input
             command += [
-                '-vcodec', 'qtrle',
+                '-vf', 'tpad=stop_mode=clone:stop={}'.format(
+                    n_static_frames - 1
+                ),
             ]
-        else:
-            command += [
-                '-vcodec', 'libx264',
-                '-pix_fmt', 'yuv420p',
-            ]
-        command += [temp_file_path]
+        command += self.get_ffmpeg_codec_args()
+        command += [self.temp_partial_movie_file_path]
         self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
 
+    def get_ffmpeg_codec_args(self):
+        if self.ffmpeg_codec_args is not None:
+            return list(self.ffmpeg_codec_args)
+        return get_default_codec_args(self.movie_file_extension)
+
     def close_movie_pipe(self):
         """
         Used internally by Manim to gracefully stop writing to FFMPEG's
         input buffer, and move the temporary files into their permanent
         locations
         """
+        if self.defer_encoding:
+            self.close_raw_frame_file()
+            return
+        if self.writing_process is None:
+            if self.pending_static_frame is not None:
+                # Only the static frames were written
+                self.start_writing_process(
+                    n_static_frames=self.n_pending_static_frames
+                )
+                self.pipe_frame(self.pending_static_frame)
+                self.pending_static_frame = None
+            else:
+                self.start_writing_process()
+        if self.write_frames_in_thread:
+            self.close_frame_writer_thread()
         self.writing_process.stdin.close()
         self.writing_process.wait()
         shutil.move(
             self.temp_partial_movie_file_path,
             self.partial_movie_file_path,
         )
+        if self.use_partial_movie_cache and self.partial_movie_hash is not None:
+            self.add_partial_movie_to_cache(
+                self.partial_movie_hash,
+                self.partial_movie_file_path,
+                self.partial_movie_frame_count,
+            )
+
+    def close_raw_frame_file(self):
+        """
+        Used in place of close_movie_pipe when encoding is deferred,
+        noting down the raw frame file to encode later.
+        """
+        sink = self.raw_frame_sink
+        self.raw_frame_sink = None
+        sink.finish()
+        if sink.n_frames == 0:
+            return
+        self.deferred_partial_movies.append((
+            sink.file_path,
+            self.partial_movie_file_path,
+            self.partial_movie_hash,
+            self.partial_movie_frame_count,
+        ))
+
+    def encode_deferred_partial_movies(self):
+        """
+        Encodes the raw frame files of all partial movies rendered,
+        running several FFMPEG processes at once.
+        """
+        deferred = self.deferred_partial_movies
+        self.deferred_partial_movies = []
+        encode_raw_frame_files(
+            [(raw_path, movie_path) for raw_path, movie_path, h, n in deferred],
+            self.get_ffmpeg_codec_args(),
+            self.encoding_workers,
+        )
+        for raw_path, movie_path, play_hash, n_frames in deferred:
+            if self.use_partial_movie_cache and play_hash is not None:
+                self.add_partial_movie_to_cache(play_hash, movie_path, n_frames)
+            if not self.keep_raw_frames:
+                os.remove(raw_path)
+                os.remove(get_raw_frame_metadata_path(raw_path))
+        if self.keep_raw_frames and self.scene.end_at_animation_number is None:
+            # Drop files from earlier renders of more animations
+            get_sorted_integer_files(
+                self.raw_frame_directory,
+                remove_indices_greater_than=self.scene.num_plays - 1,
+            )
+
+    def add_partial_movie_to_cache(self, play_hash, partial_movie_file_path, n_frames):
+        """
+        Copies a partial movie which was just written into the
+        partial movie cache, along with its frame count, then
+        evicts old entries if the cache has grown too large.
+        """
+        cached_path = self.get_cached_partial_movie_path(play_hash)
+        root = os.path.splitext(cached_path)[0]
+        # Write to temporary files first so that other processes
+        # never see a half written entry
+        temp_path = root + "_temp" + self.movie_file_extension
+        shutil.copyfile(partial_movie_file_path, temp_path)
+        with open(root + "_temp.json", "w") as fp:
+            json.dump({"n_frames": n_frames}, fp)
+        shutil.move(root + "_temp.json", root + ".json")
+        shutil.move(temp_path, cached_path)
+        self.evict_from_partial_movie_cache()
+
+    def use_cached_partial_movie(self, play_hash):
+        """
+        Used in place of writing frames, copies the cached partial
+        movie with the given hash to where the next partial movie
+        would have been written.
+        """
+        cached_path = self.get_cached_partial_movie_path(play_hash)
+        shutil.copyfile(cached_path, self.get_next_partial_movie_path())
+        # Mark as recently used
+        os.utime(cached_path)
+
+    def evict_from_partial_movie_cache(self):
+        """
+        Removes the least recently used cached partial movies
+        until the cache fits in max_partial_movie_cache_size.
+        """
+        directory = self.partial_movie_cache_directory
+        entries = []
+        for file in os.listdir(directory):
+            root, extension = os.path.splitext(file)
+            if extension == ".json" or root.endswith("_temp"):
+                continue
+            path = os.path.join(directory, file)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # Removed by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        total_size = sum([size for mtime, size, path in entries])
+        for mtime, size, path in entries:
+            if total_size <= self.max_partial_movie_cache_size:
+                break
+            for file_path in [path, os.path.splitext(path)[0] + ".json"]:
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+            total_size -= size
 
     def combine_movie_files(self):
         """
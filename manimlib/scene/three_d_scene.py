@@ -147,6 +147,13 @@ class ThreeDScene(Scene):
             return self.mobjects
         return moving_mobjects
 
+    def get_moving_mobject_render_groups(self, moving_mobjects, *animations):
+        """
+        The ThreeDCamera sorts everything it draws by depth, so the
+        moving mobjects can't be split into separately drawn layers.
+        """
+        return None
+
     def add_fixed_orientation_mobjects(self, *mobjects, **kwargs):
         """
         This method is used to prevent the rotation and tilting
@@ -38,6 +38,29 @@ def partial_bezier_points(points, a, b):
     ])
 
 
+def partial_bezier_points_array(points_array, a, b):
+    """
+    partial_bezier_points for many curves of the same degree at once.
+    points_array has shape (n_curves, degree + 1, dim), and a and b
+    are either numbers or arrays with one value per curve.
+
+    The k-th control point of the portion of a curve on [a, b] is its
+    blossom with k arguments equal to b and the rest equal to a, which
+    is de Casteljau's algorithm using a different t at each step.
+    """
+    points_array = np.array(points_array, dtype=float)
+    degree = points_array.shape[1] - 1
+    a = np.reshape(a, (-1, 1, 1))
+    b = np.reshape(b, (-1, 1, 1))
+    result = np.empty_like(points_array)
+    for k in range(degree + 1):
+        points = points_array
+        for t in [b] * k + [a] * (degree - k):
+            points = (1 - t) * points[:, :-1] + t * points[:, 1:]
+        result[:, k] = points[:, 0]
+    return result
+
+
 # Linear interpolation variants
 
 def interpolate(start, end, alpha):
@@ -109,3 +109,17 @@ def get_shaded_rgb(rgb, point, unit_normal_vect, light_source):
     result = rgb + factor
     clip_in_place(rgb + factor, 0, 1)
     return result
+
+
+def get_shaded_rgbs(rgbs, points, unit_normal_vects, light_source):
+    """
+    get_shaded_rgb for arrays of rgbs, points and unit normals.
+    """
+    to_sun = light_source - points
+    norms = np.linalg.norm(to_sun, axis=1)
+    nonzero = norms > 0
+    to_sun[nonzero] /= norms[nonzero, np.newaxis]
+    to_sun[~nonzero] = 0
+    factors = 0.5 * np.sum(unit_normal_vects * to_sun, axis=1)**3
+    factors[factors < 0] *= 0.5
+    return rgbs + factors[:, np.newaxis]
@@ -0,0 +1,148 @@
+import numpy as np
+
+# Compositing of uint8 rgba arrays directly in NumPy, in place, and
+# only over the pixels involved.  Destination arrays hold straight
+# (not premultiplied) alpha, as camera pixel arrays do, and the
+# results match what PIL's Image.alpha_composite gives.
+#
+# The functions taking scratch and accumulator arrays use them, when
+# given, in place of allocating their temporaries, so a caller which
+# composites every frame can allocate them once.  Either is a 1d
+# array (uint16 and float32 respectively), see get_compositing_buffers
+# for how large they need to be.
+
+RGB_MAX = 255
+
+
+def get_compositing_buffers(shape):
+    """
+    Returns (scratch, accumulator) arrays large enough to
+    composite any region of an rgba array of the given shape.
+    """
+    size = int(np.prod(shape))
+    # Room for two arrays of that shape, and one alpha channel
+    scratch = np.empty(2 * size + size // 4, dtype=np.uint16)
+    return scratch, np.empty(size, dtype=np.float32)
+
+
+def get_scratch_array(buffer, shape, dtype):
+    """
+    Returns the start of buffer as an array of the given shape,
+    and the rest of buffer, or a new array and None when buffer
+    is None or too short.
+    """
+    size = int(np.prod(shape))
+    if buffer is None or len(buffer) < size:
+        return np.empty(shape, dtype=dtype), None
+    return buffer[:size].reshape(shape), buffer[size:]
+
+
+def divide_by_rgb_max(values):
+    # Rounded integer division by 255, for values up to 255**2,
+    # in place on a uint16 array
+    values += 128
+    values += values >> 8
+    values >>= 8
+    return values
+
+
+def get_alpha_bounding_box(rgba_array):
+    """
+    Returns the slices (rows, columns) of the smallest box holding
+    every pixel of rgba_array with nonzero alpha, or None if there
+    are none.
+    """
+    alpha = rgba_array[:, :, 3]
+    rows = np.flatnonzero(alpha.any(axis=1))
+    if len(rows) == 0:
+        return None
+    columns = np.flatnonzero(alpha[rows[0]:rows[-1] + 1].any(axis=0))
+    return (
+        slice(rows[0], rows[-1] + 1),
+        slice(columns[0], columns[-1] + 1),
+    )
+
+
+def premultiply_alpha(rgba, out=None):
+    """
+    Returns the uint8 rgba array with its rgb multiplied by alpha,
+    as a uint16 array, written into out if given.
+    """
+    result = np.empty(rgba.shape, dtype=np.uint16) if out is None else out
+    np.multiply(rgba, rgba[..., 3:], out=result, dtype=np.uint16)
+    divide_by_rgb_max(result)
+    result[..., 3] = rgba[..., 3]
+    return result
+
+
+def composite_premultiplied(pixels, rgba, scratch=None, accumulator=None):
+    """
+    Paints rgba, whose rgb is premultiplied by alpha, over the uint8
+    array of pixels of the same shape, in place.  rgba can be any
+    integer array with values up to 255.
+    """
+    src_alpha = rgba[..., 3:]
+    if np.all(src_alpha == RGB_MAX):
+        pixels[...] = rgba
+        return pixels
+    if np.all(pixels[..., 3] == RGB_MAX):
+        # Over an opaque destination, "over" is the same
+        # for each channel, and stays in integers
+        blended, scratch = get_scratch_array(scratch, pixels.shape, np.uint16)
+        inverse_alpha = get_scratch_array(scratch, src_alpha.shape, np.uint16)[0]
+        np.subtract(RGB_MAX, src_alpha, out=inverse_alpha)
+        np.multiply(pixels, inverse_alpha, out=blended)
+        divide_by_rgb_max(blended)
+        blended += rgba
+        pixels[...] = blended
+        return pixels
+    # Otherwise the result has to be divided back
+    # by its alpha, which happens in floats
+    result = get_scratch_array(accumulator, pixels.shape, np.float32)[0]
+    result[...] = pixels
+    dst_alpha = result[..., 3:]
+    dst_alpha *= (RGB_MAX - src_alpha) / RGB_MAX
+    result[..., :3] *= dst_alpha / RGB_MAX
+    result += rgba
+    out_alpha = result[..., 3:]
+    result[..., :3] *= RGB_MAX / np.maximum(out_alpha, 1)
+    result += 0.5
+    np.minimum(result, RGB_MAX, out=result)
+    pixels[...] = result
+    return pixels
+
+
+def composite_straight(pixels, rgba, scratch=None, accumulator=None):
+    """
+    Paints the uint8 rgba array, with straight alpha, over the
+    uint8 array of pixels of the same shape, in place.
+    """
+    if np.all(rgba[..., 3] == RGB_MAX):
+        pixels[...] = rgba
+        return pixels
+    # The premultiplied source takes the start of scratch,
+    # and composite_premultiplied the rest of it
+    premultiplied, scratch = get_scratch_array(scratch, rgba.shape, np.uint16)
+    premultiply_alpha(rgba, out=premultiplied)
+    return composite_premultiplied(pixels, premultiplied, scratch, accumulator)
+
+
+def overlay_rgba_array(pixel_array, rgba_array, premultiplied=False,
+                       bounding_box=None, scratch=None, accumulator=None):
+    """
+    Paints rgba_array over pixel_array, both (height, width, 4) uint8
+    arrays, in place, touching only the pixels inside bounding_box,
+    a pair of slices (rows, columns).  When bounding_box is None, it
+    is that of the pixels of rgba_array with nonzero alpha.
+    """
+    if bounding_box is None:
+        bounding_box = get_alpha_bounding_box(rgba_array)
+        if bounding_box is None:
+            return pixel_array
+    composite = composite_premultiplied if premultiplied else composite_straight
+    composite(
+        pixel_array[bounding_box],
+        rgba_array[bounding_box],
+        scratch, accumulator,
+    )
+    return pixel_array
@@ -46,6 +46,17 @@ def digest_config(obj, kwargs, caller_locals={}):
     obj.__dict__ = merge_dicts_recursively(*reversed(all_dicts))
 
 
+def get_config_keys(Class):
+    """
+    The keys of the CONFIG dicts of Class and of
+    all its super classes, which digest_config sets
+    """
+    keys = set()
+    for SuperClass in Class.__mro__:
+        keys.update(SuperClass.__dict__.get("CONFIG", {}).keys())
+    return keys
+
+
 def merge_dicts_recursively(*dicts):
     """
     Creates a dict whose keyset is the union of all the
@@ -0,0 +1,201 @@
+import functools
+import hashlib
+import os
+import site
+import sys
+import sysconfig
+import types
+
+from colour import Color
+import numpy as np
+
+
+def get_hash_of_objects(*objects, opaque_objects=()):
+    """
+    Returns a hex digest which only depends on the contents of
+    the objects passed in, so that it is stable across runs.
+
+    Objects are walked recursively through their attributes,
+    containers, and for functions through their code and closure,
+    so two mobjects with the same points, colors and updaters give
+    the same hash.  Classes and functions from user code (anything
+    but manimlib and installed packages) also contribute their code
+    and the globals their code refers to, so editing a scene file
+    changes the hash.  Anything in opaque_objects (e.g. the Scene,
+    whose camera holds the current frame) only contributes the
+    name of its type.
+
+    Raises UninspectableObjectException for objects whose contents
+    can't be seen from python (file handles, generators, cairo
+    contexts...), as two of those which differ would give the
+    same hash.
+    """
+    hasher = hashlib.sha256()
+    memo = dict([(id(obj), "opaque") for obj in opaque_objects])
+    # Keep the objects alive so that ids in memo can't be reused
+    keep_alive = list(opaque_objects)
+    for obj in objects:
+        update_hash_with_object(hasher, obj, memo, keep_alive)
+    return hasher.hexdigest()
+
+
+def update_hash_with_object(hasher, obj, memo, keep_alive):
+    def update(*strings):
+        for string in strings:
+            hasher.update(str(string).encode())
+            hasher.update(b"\x00")
+
+    def recurse(value):
+        update_hash_with_object(hasher, value, memo, keep_alive)
+
+    if obj is None or obj is Ellipsis or isinstance(obj, (bool, int, float, complex, str, bytes, range)):
+        update(type(obj).__name__, repr(obj))
+        return
+    if isinstance(obj, slice):
+        update("slice")
+        recurse((obj.start, obj.stop, obj.step))
+        return
+    if isinstance(obj, np.generic):
+        update(obj.dtype, repr(obj.item()))
+        return
+    if isinstance(obj, np.ndarray):
+        update("ndarray", obj.dtype, obj.shape)
+        if obj.dtype == object:
+            for value in obj.flat:
+                recurse(value)
+        else:
+            hasher.update(np.ascontiguousarray(obj).tobytes())
+        return
+    if isinstance(obj, Color):
+        update("Color", obj.hex_l)
+        return
+    is_library_type = isinstance(obj, type) and not is_user_defined(obj)
+    named_types = (types.ModuleType, types.BuiltinFunctionType, np.ufunc)
+    if is_library_type or isinstance(obj, named_types):
+        name = getattr(obj, "__qualname__", obj.__name__)
+        update(type(obj).__name__, getattr(obj, "__module__", None), name)
+        return
+
+    # Anything below may be self-referential
+    if id(obj) in memo:
+        update("ref", memo[id(obj)])
+        return
+    memo[id(obj)] = len(memo)
+    keep_alive.append(obj)
+
+    if isinstance(obj, type):
+        # Defined in user code, which may have changed
+        update("class", obj.__module__, obj.__qualname__)
+        recurse(obj.__bases__)
+        recurse(dict(vars(obj)))
+    elif isinstance(obj, (list, tuple)):
+        update(type(obj).__name__, len(obj))
+        for value in obj:
+            recurse(value)
+    elif isinstance(obj, (set, frozenset)):
+        update(type(obj).__name__, len(obj))
+        for value in sorted(obj, key=repr):
+            recurse(value)
+    elif isinstance(obj, dict):
+        update("dict", len(obj))
+        for key in sorted(obj.keys(), key=repr):
+            recurse(key)
+            recurse(obj[key])
+    elif isinstance(obj, types.MethodType):
+        update("method")
+        recurse(obj.__func__)
+        recurse(obj.__self__)
+    elif isinstance(obj, types.FunctionType):
+        update("function", obj.__module__, obj.__qualname__)
+        recurse(obj.__code__)
+        recurse(obj.__defaults__)
+        recurse(obj.__kwdefaults__)
+        closure = obj.__closure__ or ()
+        for cell in closure:
+            try:
+                recurse(cell.cell_contents)
+            except ValueError:
+                # Empty cell
+                update("empty_cell")
+        if is_user_defined(obj):
+            for name in sorted(get_global_names(obj.__code__)):
+                if name in obj.__globals__:
+                    update("global", name)
+                    recurse(obj.__globals__[name])
+    elif isinstance(obj, functools.partial):
+        update("partial")
+        recurse(obj.func)
+        recurse(obj.args)
+        recurse(obj.keywords)
+    elif isinstance(obj, types.CodeType):
+        update("code", obj.co_name)
+        hasher.update(obj.co_code)
+        recurse(obj.co_consts)
+        recurse(obj.co_names)
+    elif hasattr(obj, "__dict__"):
+        recurse(type(obj))
+        recurse(vars(obj))
+    else:
+        # Without a __dict__, the only view of the contents is what
+        # pickling would save, e.g. for operator.itemgetter
+        try:
+            reduced = obj.__reduce_ex__(2)
+        except Exception:
+            raise UninspectableObjectException(
+                "Can't hash the contents of {}".format(type(obj).__name__)
+            )
+        update("reduced")
+        recurse(reduced)
+
+
+class UninspectableObjectException(Exception):
+    pass
+
+
+def get_global_names(code):
+    """
+    The names which code, or any code nested in it, looks up
+    outside of its locals, some of which are globals.
+    """
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.update(get_global_names(const))
+    return names
+
+
+LIBRARY_PATHS = [
+    os.path.abspath(path)
+    for path in [
+        *[sysconfig.get_paths()[key] for key in ["stdlib", "purelib", "platlib"]],
+        site.getusersitepackages(),
+    ]
+]
+MODULE_IS_USER_DEFINED = {}
+
+
+def is_user_defined(obj):
+    """
+    Whether a class or function comes from a module outside of
+    manimlib, the standard library and installed packages.
+    """
+    module_name = getattr(obj, "__module__", None)
+    if module_name not in MODULE_IS_USER_DEFINED:
+        module = sys.modules.get(module_name)
+        file_path = getattr(module, "__file__", None)
+        if module_name is None or module_name.split(".")[0] == "manimlib":
+            result = False
+        elif module is None:
+            # Scene files are loaded without being added to sys.modules
+            result = True
+        elif file_path is None:
+            # Built in
+            result = False
+        else:
+            file_path = os.path.abspath(file_path)
+            result = not any([
+                file_path.startswith(path + os.sep)
+                for path in LIBRARY_PATHS
+            ])
+        MODULE_IS_USER_DEFINED[module_name] = result
+    return MODULE_IS_USER_DEFINED[module_name]
@@ -0,0 +1,152 @@
+import csv
+import json
+import time
+
+
+PROFILE_COLUMNS = [
+    "animation_index",
+    "animation",
+    "phase",
+    "mobject_type",
+    "calls",
+    "wall_time",
+    "cpu_time",
+]
+
+
+class PhaseTimer(object):
+    def __init__(self, profiler, phase, mobject_type):
+        self.profiler = profiler
+        self.phase = phase
+        self.mobject_type = mobject_type
+
+    def __enter__(self):
+        self.start_wall = time.perf_counter()
+        self.start_cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.add_time(
+            self.phase,
+            self.mobject_type,
+            time.perf_counter() - self.start_wall,
+            time.process_time() - self.start_cpu,
+        )
+        return False
+
+
+class NullPhaseTimer(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_PHASE_TIMER = NullPhaseTimer()
+
+
+def time_phase(profiler, phase, mobject_type=None):
+    """
+    Returns a context manager which adds the wall and cpu time spent
+    inside it to profiler, or one which does nothing if profiler is None.
+    """
+    if profiler is None:
+        return NULL_PHASE_TIMER
+    return PhaseTimer(profiler, phase, mobject_type)
+
+
+class RenderProfiler(object):
+    """
+    Accumulates the time spent in each phase of rendering (e.g.
+    "updaters", "interpolation", "rasterization", "writing"),
+    keyed by the index of the play-like call it happened in and
+    by the type of mobject involved, where there is one.
+    """
+
+    def __init__(self):
+        # (animation_index, phase, mobject_type) -> [calls, wall, cpu]
+        self.records = dict()
+        self.animation_names = dict()
+        self.animation_index = None
+
+    def begin_animation(self, index, name):
+        self.animation_index = index
+        self.animation_names[index] = name
+
+    def name_animation(self, name):
+        self.animation_names[self.animation_index] = name
+
+    def end_animation(self):
+        self.animation_index = None
+
+    def add_time(self, phase, mobject_type, wall_time, cpu_time):
+        key = (self.animation_index, phase, mobject_type)
+        record = self.records.get(key)
+        if record is None:
+            record = self.records[key] = [0, 0.0, 0.0]
+        record[0] += 1
+        record[1] += wall_time
+        record[2] += cpu_time
+
+    def get_rows(self):
+        def sort_key(key):
+            index, phase, mobject_type = key
+            return (index is not None, index or 0, phase, mobject_type or "")
+
+        rows = []
+        for key in sorted(self.records, key=sort_key):
+            index, phase, mobject_type = key
+            values = [index, self.animation_names.get(index), phase, mobject_type]
+            rows.append(dict(zip(PROFILE_COLUMNS, values + self.records[key])))
+        return rows
+
+    def get_phase_totals(self):
+        totals = dict()
+        for (index, phase, mobject_type), record in self.records.items():
+            total = totals.setdefault(phase, [0, 0.0, 0.0])
+            for i in range(3):
+                total[i] += record[i]
+        return totals
+
+    def write_report(self, file_path_stem):
+        """
+        Writes file_path_stem + "_profile.json" and "_profile.csv",
+        and returns their paths.
+        """
+        rows = self.get_rows()
+        json_path = file_path_stem + "_profile.json"
+        csv_path = file_path_stem + "_profile.csv"
+        with open(json_path, "w") as fp:
+            json.dump({
+                "phase_totals": dict([
+                    (phase, dict(zip(PROFILE_COLUMNS[-3:], total)))
+                    for phase, total in self.get_phase_totals().items()
+                ]),
+                "records": rows,
+            }, fp, indent=2)
+        with open(csv_path, "w", newline="") as fp:
+            writer = csv.DictWriter(fp, fieldnames=PROFILE_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        return json_path, csv_path
+
+    def print_summary(self, n_rows=10):
+        totals = self.get_phase_totals()
+        total_wall_time = sum([total[1] for total in totals.values()]) or 1
+        print("\nTime per phase:")
+        for phase, (calls, wall_time, cpu_time) in sorted(
+                totals.items(), key=lambda item: -item[1][1]):
+            print("  {:<15} {:>9.3f}s wall {:>9.3f}s cpu {:>6.1%}".format(
+                phase, wall_time, cpu_time, wall_time / total_wall_time
+            ))
+        rows = sorted(self.get_rows(), key=lambda row: -row["wall_time"])
+        print("Top {} by wall time:".format(min(n_rows, len(rows))))
+        for row in rows[:n_rows]:
+            print("  {:>9.3f}s  #{}  {:<15} {:<25} {}".format(
+                row["wall_time"],
+                row["animation_index"],
+                row["phase"],
+                row["mobject_type"] or "",
+                row["animation"] or "",
+            ))
@@ -3,6 +3,15 @@ import numpy as np
 from manimlib.utils.bezier import bezier
 from manimlib.utils.simple_functions import sigmoid
 
+# Rate functions below work on arrays of alphas as well as on single
+# alphas, and are marked as such with the attribute supports_arrays.
+# Piecewise ones use np.where, and index with () so that a single
+# alpha still gives back a number rather than a 0-d array.
+
+
+def supports_arrays(rate_func):
+    return getattr(rate_func, "supports_arrays", False)
+
 
 def linear(t):
     return t
@@ -29,25 +38,26 @@ def slow_into(t):
 
 
 def double_smooth(t):
-    if t < 0.5:
-        return 0.5 * smooth(2 * t)
-    else:
-        return 0.5 * (1 + smooth(2 * t - 1))
+    return np.where(
+        np.less(t, 0.5),
+        0.5 * smooth(2 * np.asarray(t)),
+        0.5 * (1 + smooth(2 * np.asarray(t) - 1)),
+    )[()]
 
 
 def there_and_back(t, inflection=10.0):
-    new_t = 2 * t if t < 0.5 else 2 * (1 - t)
-    return smooth(new_t, inflection)
+    new_t = np.where(np.less(t, 0.5), 2 * np.asarray(t), 2 * (1 - np.asarray(t)))
+    return smooth(new_t, inflection)[()]
 
 
 def there_and_back_with_pause(t, pause_ratio=1. / 3):
     a = 1. / pause_ratio
-    if t < 0.5 - pause_ratio / 2:
-        return smooth(a * t)
-    elif t < 0.5 + pause_ratio / 2:
-        return 1
-    else:
-        return smooth(a - a * t)
+    t = np.asarray(t)
+    return np.select(
+        [t < 0.5 - pause_ratio / 2, t < 0.5 + pause_ratio / 2],
+        [smooth(a * t), 1],
+        smooth(a - a * t),
+    )[()]
 
 
 def running_start(t, pull_factor=-0.5):
@@ -57,6 +67,7 @@ def running_start(t, pull_factor=-0.5):
 def not_quite_there(func=smooth, proportion=0.7):
     def result(t):
         return proportion * func(t)
+    result.supports_arrays = supports_arrays(func)
     return result
 
 
@@ -67,15 +78,18 @@ def wiggle(t, wiggles=2):
 def squish_rate_func(func, a=0.4, b=0.6):
     def result(t):
         if a == b:
-            return a
-
-        if t < a:
-            return func(0)
-        elif t > b:
-            return func(1)
-        else:
-            return func((t - a) / (b - a))
-
+            return a if np.ndim(t) == 0 else np.full(np.shape(t), float(a))
+
+        if not supports_arrays(func):
+            if t < a:
+                return func(0)
+            elif t > b:
+                return func(1)
+            else:
+                return func((t - a) / (b - a))
+        return np.asarray(func(np.clip((np.asarray(t) - a) / (b - a), 0, 1)))[()]
+
+    result.supports_arrays = True if a == b else supports_arrays(func)
     return result
 
 # Stylistically, should this take parameters (with default values)?
@@ -85,10 +99,37 @@ def squish_rate_func(func, a=0.4, b=0.6):
 
 
 def lingering(t):
-    return squish_rate_func(lambda t: t, 0, 0.8)(t)
+    return squish_rate_func(linear, 0, 0.8)(t)
 
 
 def exponential_decay(t, half_life=0.1):
     # The half-life should be rather small to minimize
     # the cut-off error at the end
     return 1 - np.exp(-t / half_life)
+
+
+def tabulate_rate_func(func, n_samples=1001):
+    """
+    Samples func at n_samples evenly spaced alphas between 0 and 1, and
+    returns a rate function which linearly interpolates these samples.
+    This is far cheaper to evaluate than rate functions built out of
+    several others, like squish_rate_func(smooth), and works on arrays
+    even when func doesn't.  Alphas outside [0, 1] are clipped.
+    """
+    alphas = np.linspace(0, 1, n_samples)
+    if supports_arrays(func):
+        samples = np.array(func(alphas), dtype=float)
+    else:
+        samples = np.array([func(alpha) for alpha in alphas], dtype=float)
+
+    def result(t):
+        return np.interp(t, alphas, samples)[()]
+    result.supports_arrays = True
+    result.tabulated_func = func
+    return result
+
+
+for _rate_func in [linear, smooth, rush_into, rush_from, slow_into,
+                   double_smooth, there_and_back, there_and_back_with_pause,
+                   running_start, wiggle, lingering, exponential_decay]:
+    _rate_func.supports_arrays = True
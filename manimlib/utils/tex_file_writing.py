@@ -1,10 +1,13 @@
 import os
 import hashlib
+import re
+import shutil
 
 from pathlib import Path
 
 from manimlib.constants import TEX_TEXT_TO_REPLACE
 from manimlib.constants import TEX_USE_CTEX
+from manimlib.utils.iterables import remove_list_redundancies
 import manimlib.constants as consts
 
 
@@ -16,12 +19,140 @@ def tex_hash(expression, template_tex_file_body):
     return hasher.hexdigest()[:16]
 
 
+def get_svg_file_name(expression, template_tex_file_body):
+    result = os.path.join(
+        consts.TEX_DIR,
+        tex_hash(expression, template_tex_file_body)
+    ) + ".svg"
+    return Path(result).as_posix()
+
+
+# Expressions queued to be compiled along with the next
+# one which is missing, by template tex file body
+QUEUED_TEX_EXPRESSIONS = dict()
+
+
+def queue_tex_expressions(expressions, template_tex_file_body):
+    """
+    Notes down expressions which will be needed later, so that
+    as soon as any expression with the same template has to be
+    compiled, all of them are compiled in the same batch.
+    """
+    QUEUED_TEX_EXPRESSIONS.setdefault(
+        template_tex_file_body, []
+    ).extend(expressions)
+
+
 def tex_to_svg_file(expression, template_tex_file_body):
+    result = get_svg_file_name(expression, template_tex_file_body)
+    if os.path.exists(result):
+        # Possibly compiled as one page of a batch, in which
+        # case there's no tex or dvi file of its own
+        return result
+    if QUEUED_TEX_EXPRESSIONS.get(template_tex_file_body):
+        return tex_to_svg_files([expression], template_tex_file_body)[0]
     tex_file = generate_tex_file(expression, template_tex_file_body)
     dvi_file = tex_to_dvi(tex_file)
     return dvi_to_svg(dvi_file)
 
 
+def tex_to_svg_files(expressions, template_tex_file_body):
+    """
+    Like tex_to_svg_file, for many expressions at once.  Those which
+    haven't been compiled before, along with any queued with
+    queue_tex_expressions, are typeset as the pages of a single
+    document, so that latex and dvisvgm each only run once, and each
+    page is then stored under the name tex_to_svg_file would look for.
+    """
+    queued = QUEUED_TEX_EXPRESSIONS.pop(template_tex_file_body, [])
+    missing = [
+        expression
+        for expression in remove_list_redundancies(queued + list(expressions))
+        if not os.path.exists(
+            get_svg_file_name(expression, template_tex_file_body)
+        )
+    ]
+    if len(missing) > 1:
+        try:
+            tex_batch_to_svg_files(missing, template_tex_file_body)
+        except Exception:
+            # Compiling them one at a time below will point
+            # to the expression which is actually at fault
+            pass
+    return [
+        tex_to_svg_file(expression, template_tex_file_body)
+        for expression in expressions
+    ]
+
+
+def compile_tex_expressions(expressions_and_templates):
+    """
+    Compiles each (expression, template_tex_file_body) pair,
+    in one batch per template.
+    """
+    templates = remove_list_redundancies([
+        template for expression, template in expressions_and_templates
+    ])
+    for template in templates:
+        tex_to_svg_files([
+            expression
+            for expression, other_template in expressions_and_templates
+            if other_template == template
+        ], template)
+
+
+def tex_batch_to_svg_files(expressions, template_tex_file_body):
+    tex_file = generate_batch_tex_file(expressions, template_tex_file_body)
+    if tex_file is None:
+        # Not a template which can be split into pages
+        return
+    dvi_file = tex_to_dvi(tex_file)
+    page_files = dvi_to_svg_pages(dvi_file)
+    if len(page_files) != len(expressions):
+        raise Exception("Expected %d pages in %s, found %d" % (
+            len(expressions), dvi_file, len(page_files)
+        ))
+    for expression, page_file in zip(expressions, page_files):
+        shutil.move(
+            page_file,
+            get_svg_file_name(expression, template_tex_file_body)
+        )
+
+
+def generate_batch_tex_file(expressions, template_tex_file_body):
+    begin = "\\begin{document}"
+    end = "\\end{document}"
+    if "{standalone}" not in template_tex_file_body or \
+            begin not in template_tex_file_body or \
+            end not in template_tex_file_body:
+        return None
+    preamble, rest = template_tex_file_body.split(begin, 1)
+    page_body, ending = rest.split(end, 1)
+    # In multi mode, the standalone class puts the contents of
+    # each standalone environment on a page of its own
+    pages = [
+        "\\begin{standalone}\n" +
+        page_body.replace(TEX_TEXT_TO_REPLACE, expression) +
+        "\n\\end{standalone}\n"
+        for expression in expressions
+    ]
+    body = "".join([
+        "\\PassOptionsToClass{multi=true}{standalone}\n",
+        preamble, begin, "\n",
+        *pages,
+        end, ending,
+    ])
+    result = os.path.join(
+        consts.TEX_DIR,
+        "batch_" + tex_hash("\n".join(expressions), template_tex_file_body)
+    ) + ".tex"
+    if not os.path.exists(result):
+        print("Writing %d expressions to %s" % (len(expressions), result))
+        with open(result, "w", encoding="utf-8") as outfile:
+            outfile.write(body)
+    return result
+
+
 def generate_tex_file(expression, template_tex_file_body):
     result = os.path.join(
         consts.TEX_DIR,
@@ -97,3 +228,35 @@ def dvi_to_svg(dvi_file, regen_if_exists=False):
         ]
         os.system(" ".join(commands))
     return result
+
+
+def dvi_to_svg_pages(dvi_file):
+    """
+    Converts every page of a dvi into its own svg, and returns
+    the paths of these svgs in the order of the pages.
+    """
+    dvi_file = Path(dvi_file).as_posix()
+    stem = dvi_file[:dvi_file.rindex(".")]
+    commands = [
+        "dvisvgm",
+        "\"{}\"".format(dvi_file),
+        "-p",
+        "1-",
+        "-n",
+        "-v",
+        "0",
+        "-o",
+        "\"{}-%p.svg\"".format(stem),
+        ">",
+        os.devnull
+    ]
+    os.system(" ".join(commands))
+    directory, prefix = os.path.split(stem + "-")
+    page_files = []
+    for file_name in os.listdir(directory or "."):
+        match = re.fullmatch(re.escape(prefix) + r"(\d+)\.svg", file_name)
+        if match:
+            page_number = int(match.group(1))
+            page_files.append((page_number, os.path.join(directory, file_name)))
+    page_files.sort()
+    return [Path(path).as_posix() for page_number, path in page_files]